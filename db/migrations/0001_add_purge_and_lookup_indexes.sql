@@ -0,0 +1,15 @@
+CREATE INDEX IF NOT EXISTS "failed_program_match_date_time_of_last_failure_index"
+    ON "failed_program_match" ("date_time_of_last_failure");
+CREATE INDEX IF NOT EXISTS "forced_program_match_smooth_streams_program_stop_index"
+    ON "forced_program_match" ("smooth_streams_program_stop");
+CREATE INDEX IF NOT EXISTS "ignored_epg_program_match_epg_program_stop_index"
+    ON "ignored_epg_program_match" ("epg_program_stop");
+CREATE INDEX IF NOT EXISTS "ignored_smooth_streams_program_match_smooth_streams_program_stop_index"
+    ON "ignored_smooth_streams_program_match" ("smooth_streams_program_stop");
+CREATE INDEX IF NOT EXISTS "program_match_date_time_of_last_match_index"
+    ON "program_match" ("date_time_of_last_match");
+CREATE INDEX IF NOT EXISTS "program_match_lookup_index"
+    ON "program_match" ("smooth_streams_program_title", "smooth_streams_program_sub_title",
+                        "smooth_streams_program_channel", "smooth_streams_program_start",
+                        "smooth_streams_program_stop", "epg_program_title", "epg_program_sub_title",
+                        "epg_program_channel", "epg_program_start", "epg_program_stop", "is_valid");
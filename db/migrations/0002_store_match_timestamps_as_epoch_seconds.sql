@@ -0,0 +1,83 @@
+CREATE TABLE "failed_program_match_0002"
+(
+    "smooth_streams_program_title"     TEXT    NOT NULL,
+    "smooth_streams_program_sub_title" TEXT    NOT NULL DEFAULT '',
+    "smooth_streams_program_channel"   TEXT    NOT NULL,
+    "smooth_streams_program_start"     INTEGER NOT NULL,
+    "smooth_streams_program_stop"      INTEGER NOT NULL,
+    "date_time_of_last_failure"        INTEGER NOT NULL,
+    "number_of_occurrences"            INTEGER NOT NULL,
+    "reviewed"                         INTEGER NOT NULL DEFAULT 0 CHECK (reviewed IN (0, 1)),
+    PRIMARY KEY ("smooth_streams_program_title", "smooth_streams_program_sub_title", "smooth_streams_program_channel",
+                 "smooth_streams_program_start", "smooth_streams_program_stop")
+);
+INSERT OR IGNORE INTO "failed_program_match_0002"
+SELECT "smooth_streams_program_title",
+       "smooth_streams_program_sub_title",
+       "smooth_streams_program_channel",
+       CAST(strftime('%s', "smooth_streams_program_start") AS INTEGER),
+       CAST(strftime('%s', "smooth_streams_program_stop") AS INTEGER),
+       CAST(strftime('%s', "date_time_of_last_failure") AS INTEGER),
+       "number_of_occurrences",
+       "reviewed"
+FROM "failed_program_match";
+DROP TABLE "failed_program_match";
+ALTER TABLE "failed_program_match_0002" RENAME TO "failed_program_match";
+CREATE INDEX "failed_program_match_date_time_of_last_failure_index"
+    ON "failed_program_match" ("date_time_of_last_failure");
+
+CREATE TABLE "program_match_0002"
+(
+    "smooth_streams_program_title"           TEXT    NOT NULL,
+    "smooth_streams_program_sub_title"       TEXT    NOT NULL DEFAULT '',
+    "smooth_streams_program_channel"         TEXT    NOT NULL,
+    "smooth_streams_program_start"           INTEGER NOT NULL,
+    "smooth_streams_program_stop"            INTEGER NOT NULL,
+    "epg_program_title"                      TEXT    NOT NULL,
+    "epg_program_sub_title"                  TEXT    NOT NULL DEFAULT '',
+    "epg_program_channel"                    TEXT    NOT NULL,
+    "epg_program_start"                      INTEGER NOT NULL,
+    "epg_program_stop"                       INTEGER NOT NULL,
+    "smooth_streams_program_string_compared" TEXT    NOT NULL,
+    "epg_program_string_compared"            TEXT    NOT NULL,
+    "token_sort_ratio_score"                 INTEGER NOT NULL,
+    "jaro_winkler_ratio_score"               INTEGER NOT NULL,
+    "match_type"                             TEXT    NOT NULL CHECK (match_type IN ('risky', 'safe')),
+    "date_time_of_last_match"                INTEGER NOT NULL,
+    "number_of_occurrences"                  INTEGER NOT NULL DEFAULT 1,
+    "is_valid"                               INTEGER CHECK (is_valid IN (0, 1)),
+    "reviewed"                               INTEGER NOT NULL DEFAULT 0 CHECK (reviewed IN (0, 1)),
+    PRIMARY KEY ("smooth_streams_program_title", "smooth_streams_program_sub_title", "smooth_streams_program_channel",
+                 "smooth_streams_program_start", "smooth_streams_program_stop", "epg_program_title",
+                 "epg_program_sub_title", "epg_program_channel", "epg_program_start", "epg_program_stop")
+);
+INSERT OR IGNORE INTO "program_match_0002"
+SELECT "smooth_streams_program_title",
+       "smooth_streams_program_sub_title",
+       "smooth_streams_program_channel",
+       CAST(strftime('%s', "smooth_streams_program_start") AS INTEGER),
+       CAST(strftime('%s', "smooth_streams_program_stop") AS INTEGER),
+       "epg_program_title",
+       "epg_program_sub_title",
+       "epg_program_channel",
+       CAST(strftime('%s', "epg_program_start") AS INTEGER),
+       CAST(strftime('%s', "epg_program_stop") AS INTEGER),
+       "smooth_streams_program_string_compared",
+       "epg_program_string_compared",
+       "token_sort_ratio_score",
+       "jaro_winkler_ratio_score",
+       "match_type",
+       CAST(strftime('%s', "date_time_of_last_match") AS INTEGER),
+       "number_of_occurrences",
+       "is_valid",
+       "reviewed"
+FROM "program_match";
+DROP TABLE "program_match";
+ALTER TABLE "program_match_0002" RENAME TO "program_match";
+CREATE INDEX "program_match_date_time_of_last_match_index"
+    ON "program_match" ("date_time_of_last_match");
+CREATE INDEX "program_match_lookup_index"
+    ON "program_match" ("smooth_streams_program_title", "smooth_streams_program_sub_title",
+                        "smooth_streams_program_channel", "smooth_streams_program_start",
+                        "smooth_streams_program_stop", "epg_program_title", "epg_program_sub_title",
+                        "epg_program_channel", "epg_program_start", "epg_program_stop", "is_valid");
@@ -0,0 +1,58 @@
+CREATE TABLE "program_match_0003"
+(
+    "program_match_key"                      INTEGER PRIMARY KEY,
+    "smooth_streams_program_title"           TEXT    NOT NULL,
+    "smooth_streams_program_sub_title"       TEXT    NOT NULL DEFAULT '',
+    "smooth_streams_program_channel"         TEXT    NOT NULL,
+    "smooth_streams_program_start"           INTEGER NOT NULL,
+    "smooth_streams_program_stop"            INTEGER NOT NULL,
+    "epg_program_title"                      TEXT    NOT NULL,
+    "epg_program_sub_title"                  TEXT    NOT NULL DEFAULT '',
+    "epg_program_channel"                    TEXT    NOT NULL,
+    "epg_program_start"                      INTEGER NOT NULL,
+    "epg_program_stop"                       INTEGER NOT NULL,
+    "smooth_streams_program_string_compared" TEXT    NOT NULL,
+    "epg_program_string_compared"            TEXT    NOT NULL,
+    "token_sort_ratio_score"                 INTEGER NOT NULL,
+    "jaro_winkler_ratio_score"               INTEGER NOT NULL,
+    "match_type"                             TEXT    NOT NULL CHECK (match_type IN ('risky', 'safe')),
+    "date_time_of_last_match"                INTEGER NOT NULL,
+    "number_of_occurrences"                  INTEGER NOT NULL DEFAULT 1,
+    "is_valid"                               INTEGER CHECK (is_valid IN (0, 1)),
+    "reviewed"                               INTEGER NOT NULL DEFAULT 0 CHECK (reviewed IN (0, 1))
+);
+INSERT OR IGNORE INTO "program_match_0003"
+SELECT calculate_hash_key("smooth_streams_program_title",
+                          "smooth_streams_program_sub_title",
+                          "smooth_streams_program_channel",
+                          "smooth_streams_program_start",
+                          "smooth_streams_program_stop",
+                          "epg_program_title",
+                          "epg_program_sub_title",
+                          "epg_program_channel",
+                          "epg_program_start",
+                          "epg_program_stop"),
+       "smooth_streams_program_title",
+       "smooth_streams_program_sub_title",
+       "smooth_streams_program_channel",
+       "smooth_streams_program_start",
+       "smooth_streams_program_stop",
+       "epg_program_title",
+       "epg_program_sub_title",
+       "epg_program_channel",
+       "epg_program_start",
+       "epg_program_stop",
+       "smooth_streams_program_string_compared",
+       "epg_program_string_compared",
+       "token_sort_ratio_score",
+       "jaro_winkler_ratio_score",
+       "match_type",
+       "date_time_of_last_match",
+       "number_of_occurrences",
+       "is_valid",
+       "reviewed"
+FROM "program_match";
+DROP TABLE "program_match";
+ALTER TABLE "program_match_0003" RENAME TO "program_match";
+CREATE INDEX "program_match_date_time_of_last_match_index"
+    ON "program_match" ("date_time_of_last_match");
@@ -0,0 +1,6 @@
+CREATE TABLE "maintenance_task"
+(
+    "name"                  TEXT    NOT NULL,
+    "date_time_of_last_run" INTEGER NOT NULL,
+    PRIMARY KEY ("name")
+);
@@ -4,10 +4,37 @@ import sys
 
 from configobj import ConfigObj
 
+from .constants import DEFAULT_DB_ANALYZE_INTERVAL
+from .constants import DEFAULT_DB_BACKGROUND_WRITER
+from .constants import DEFAULT_DB_CACHE_SIZE
+from .constants import DEFAULT_DB_CACHED_STATEMENTS
+from .constants import DEFAULT_DB_IN_MEMORY
+from .constants import DEFAULT_DB_INCREMENTAL_VACUUM_PAGES
+from .constants import DEFAULT_DB_JOURNAL_MODE
+from .constants import DEFAULT_DB_MMAP_SIZE
+from .constants import DEFAULT_DB_OPTIMIZE_INTERVAL
+from .constants import DEFAULT_DB_SYNCHRONOUS
+from .constants import DEFAULT_DB_TEMP_STORE
 from .constants import DEFAULT_GMAIL_ENABLED
 from .constants import DEFAULT_LOGGING_LEVEL
+from .constants import DEFAULT_MERGE_INCREMENTAL
+from .constants import DEFAULT_MERGE_NUMBER_OF_WORKERS
+from .constants import DEFAULT_MERGE_PARALLEL
+from .constants import DEFAULT_OUTPUT_COMPRESSION
+from .constants import DEFAULT_OUTPUT_DELTA
+from .constants import DEFAULT_OUTPUT_EXPORT
+from .constants import DEFAULT_OUTPUT_PARALLEL
+from .constants import DEFAULT_OUTPUT_SPLIT
+from .constants import DEFAULT_SERVER_ADDRESS
+from .constants import DEFAULT_SERVER_GENERATION_INTERVAL
+from .constants import DEFAULT_SERVER_PORT
+from .constants import VALID_BOOLEAN_VALUES
+from .constants import VALID_DB_JOURNAL_MODE_VALUES
+from .constants import VALID_DB_SYNCHRONOUS_VALUES
+from .constants import VALID_DB_TEMP_STORE_VALUES
 from .constants import VALID_GMAIL_ENABLED_VALUES
 from .constants import VALID_LOGGING_LEVEL_VALUES
+from .constants import VALID_OUTPUT_COMPRESSION_VALUES
 from .utilities import Utility
 
 logger = logging.getLogger(__name__)
@@ -18,12 +45,170 @@ class Configuration(object):
 
     _configuration = {}
 
+    @classmethod
+    def _read_boolean_option(
+        cls, section, section_name, option_name, default, error_messages
+    ):
+        try:
+            value = distutils.util.strtobool(section[option_name])
+        except KeyError:
+            error_messages.append(
+                'Could not find a {0} option within the [{1}] section\n'
+                'The {0} option within the [{1}] section must be one of\n'
+                '{2}\n'
+                'Defaulting to {3}\n'.format(
+                    option_name,
+                    section_name,
+                    '\n'.join(
+                        [
+                            '\u2022 {0}'.format(service)
+                            for service in VALID_BOOLEAN_VALUES
+                        ]
+                    ),
+                    default,
+                )
+            )
+
+            value = default
+        except ValueError:
+            error_messages.append(
+                'The {0} option in the [{1}] section has an invalid value\n'
+                'The {0} option within the [{1}] section must be one of\n'
+                '{2}\n'
+                'Defaulting to {3}\n'.format(
+                    option_name,
+                    section_name,
+                    '\n'.join(
+                        [
+                            '\u2022 {0}'.format(service)
+                            for service in VALID_BOOLEAN_VALUES
+                        ]
+                    ),
+                    default,
+                )
+            )
+
+            value = default
+
+        return value
+
+    @classmethod
+    def _read_choice_option(
+        cls, section, section_name, option_name, valid_values, default, error_messages
+    ):
+        try:
+            value = section[option_name].upper()
+            if value not in valid_values:
+                error_messages.append(
+                    'The {0} option within the [{1}] section must be one of\n'
+                    '{2}\n'
+                    'Defaulting to {3}\n'.format(
+                        option_name,
+                        section_name,
+                        '\n'.join(
+                            ['\u2022 {0}'.format(service) for service in valid_values]
+                        ),
+                        default,
+                    )
+                )
+
+                value = default
+        except KeyError:
+            error_messages.append(
+                'Could not find a {0} option within the [{1}] section\n'
+                'The {0} option within the [{1}] section must be one of\n'
+                '{2}\n'
+                'Defaulting to {3}\n'.format(
+                    option_name,
+                    section_name,
+                    '\n'.join(
+                        ['\u2022 {0}'.format(service) for service in valid_values]
+                    ),
+                    default,
+                )
+            )
+
+            value = default
+
+        return value
+
+    @classmethod
+    def _read_choices_option(
+        cls, section, section_name, option_name, valid_values, default, error_messages
+    ):
+        try:
+            values = section[option_name]
+            if isinstance(values, str):
+                values = [values] if values else []
+
+            values = tuple(sorted({value.upper() for value in values}))
+            if any(value not in valid_values for value in values):
+                error_messages.append(
+                    'The {0} option within the [{1}] section must be a comma '
+                    'separated list of\n'
+                    '{2}\n'
+                    'Defaulting to {3}\n'.format(
+                        option_name,
+                        section_name,
+                        '\n'.join(
+                            ['\u2022 {0}'.format(service) for service in valid_values]
+                        ),
+                        ', '.join(default) or 'none',
+                    )
+                )
+
+                values = default
+        except KeyError:
+            error_messages.append(
+                'Could not find a {0} option within the [{1}] section\n'
+                'The {0} option within the [{1}] section must be a comma separated '
+                'list of\n'
+                '{2}\n'
+                'Defaulting to {3}\n'.format(
+                    option_name,
+                    section_name,
+                    '\n'.join(
+                        ['\u2022 {0}'.format(service) for service in valid_values]
+                    ),
+                    ', '.join(default) or 'none',
+                )
+            )
+
+            values = default
+
+        return values
+
+    @classmethod
+    def _read_integer_option(
+        cls, section, section_name, option_name, default, error_messages
+    ):
+        try:
+            value = int(section[option_name])
+        except KeyError:
+            error_messages.append(
+                'Could not find a {0} option within the [{1}] section\n'
+                'Defaulting to {2}\n'.format(option_name, section_name, default)
+            )
+
+            value = default
+        except ValueError:
+            error_messages.append(
+                'The {0} option within the [{1}] section must be an integer\n'
+                'Defaulting to {2}\n'.format(option_name, section_name, default)
+            )
+
+            value = default
+
+        return value
+
     @classmethod
     def get_configuration_parameter(cls, parameter_name):
         return cls._configuration[parameter_name]
 
     @classmethod
-    def read_configuration_file(cls, configuration_file_path):
+    def read_configuration_file(
+        cls, configuration_file_path, do_serve_output_xmltv_files=False
+    ):
         try:
             configuration_object = ConfigObj(
                 configuration_file_path,
@@ -47,6 +232,28 @@ class Configuration(object):
             gmail_username = None
             gmail_password = None
             logging_level = DEFAULT_LOGGING_LEVEL
+            database_journal_mode = DEFAULT_DB_JOURNAL_MODE
+            database_synchronous = DEFAULT_DB_SYNCHRONOUS
+            database_cache_size = DEFAULT_DB_CACHE_SIZE
+            database_mmap_size = DEFAULT_DB_MMAP_SIZE
+            database_temp_store = DEFAULT_DB_TEMP_STORE
+            database_cached_statements = DEFAULT_DB_CACHED_STATEMENTS
+            database_optimize_interval = DEFAULT_DB_OPTIMIZE_INTERVAL
+            database_background_writer = DEFAULT_DB_BACKGROUND_WRITER
+            database_incremental_vacuum_pages = DEFAULT_DB_INCREMENTAL_VACUUM_PAGES
+            database_analyze_interval = DEFAULT_DB_ANALYZE_INTERVAL
+            database_in_memory = DEFAULT_DB_IN_MEMORY
+            merge_parallel = DEFAULT_MERGE_PARALLEL
+            merge_number_of_workers = DEFAULT_MERGE_NUMBER_OF_WORKERS
+            merge_incremental = DEFAULT_MERGE_INCREMENTAL
+            output_compression = DEFAULT_OUTPUT_COMPRESSION
+            output_parallel = DEFAULT_OUTPUT_PARALLEL
+            output_export = DEFAULT_OUTPUT_EXPORT
+            output_delta = DEFAULT_OUTPUT_DELTA
+            output_split = DEFAULT_OUTPUT_SPLIT
+            server_address = DEFAULT_SERVER_ADDRESS
+            server_port = DEFAULT_SERVER_PORT
+            server_generation_interval = DEFAULT_SERVER_GENERATION_INTERVAL
 
             try:
                 rovi_section = configuration_object['Rovi']
@@ -216,6 +423,258 @@ class Configuration(object):
                     'Defaulting the level option to {0}\n'.format(logging_level)
                 )
 
+            try:
+                database_section = configuration_object['Database']
+
+                database_journal_mode = cls._read_choice_option(
+                    database_section,
+                    'Database',
+                    'journal_mode',
+                    VALID_DB_JOURNAL_MODE_VALUES,
+                    DEFAULT_DB_JOURNAL_MODE,
+                    error_messages,
+                )
+                database_synchronous = cls._read_choice_option(
+                    database_section,
+                    'Database',
+                    'synchronous',
+                    VALID_DB_SYNCHRONOUS_VALUES,
+                    DEFAULT_DB_SYNCHRONOUS,
+                    error_messages,
+                )
+                database_cache_size = cls._read_integer_option(
+                    database_section,
+                    'Database',
+                    'cache_size',
+                    DEFAULT_DB_CACHE_SIZE,
+                    error_messages,
+                )
+                database_mmap_size = cls._read_integer_option(
+                    database_section,
+                    'Database',
+                    'mmap_size',
+                    DEFAULT_DB_MMAP_SIZE,
+                    error_messages,
+                )
+                database_temp_store = cls._read_choice_option(
+                    database_section,
+                    'Database',
+                    'temp_store',
+                    VALID_DB_TEMP_STORE_VALUES,
+                    DEFAULT_DB_TEMP_STORE,
+                    error_messages,
+                )
+                database_cached_statements = cls._read_integer_option(
+                    database_section,
+                    'Database',
+                    'cached_statements',
+                    DEFAULT_DB_CACHED_STATEMENTS,
+                    error_messages,
+                )
+                database_optimize_interval = cls._read_integer_option(
+                    database_section,
+                    'Database',
+                    'optimize_interval',
+                    DEFAULT_DB_OPTIMIZE_INTERVAL,
+                    error_messages,
+                )
+                database_background_writer = cls._read_boolean_option(
+                    database_section,
+                    'Database',
+                    'background_writer',
+                    DEFAULT_DB_BACKGROUND_WRITER,
+                    error_messages,
+                )
+                database_incremental_vacuum_pages = cls._read_integer_option(
+                    database_section,
+                    'Database',
+                    'incremental_vacuum_pages',
+                    DEFAULT_DB_INCREMENTAL_VACUUM_PAGES,
+                    error_messages,
+                )
+                database_analyze_interval = cls._read_integer_option(
+                    database_section,
+                    'Database',
+                    'analyze_interval',
+                    DEFAULT_DB_ANALYZE_INTERVAL,
+                    error_messages,
+                )
+                database_in_memory = cls._read_boolean_option(
+                    database_section,
+                    'Database',
+                    'in_memory',
+                    DEFAULT_DB_IN_MEMORY,
+                    error_messages,
+                )
+
+                if database_in_memory and database_background_writer:
+                    error_messages.append(
+                        'The background_writer option within the [Database] section '
+                        'cannot be enabled together with the in_memory option\n'
+                        'Defaulting background_writer to False\n'
+                    )
+
+                    database_background_writer = False
+            except KeyError:
+                error_messages.append(
+                    'Could not find a [Database] section\n'
+                    'Defaulting all options within the [Database] section\n'
+                )
+
+            try:
+                merge_section = configuration_object['Merge']
+
+                merge_parallel = cls._read_boolean_option(
+                    merge_section,
+                    'Merge',
+                    'parallel',
+                    DEFAULT_MERGE_PARALLEL,
+                    error_messages,
+                )
+                merge_number_of_workers = cls._read_integer_option(
+                    merge_section,
+                    'Merge',
+                    'number_of_workers',
+                    DEFAULT_MERGE_NUMBER_OF_WORKERS,
+                    error_messages,
+                )
+                merge_incremental = cls._read_boolean_option(
+                    merge_section,
+                    'Merge',
+                    'incremental',
+                    DEFAULT_MERGE_INCREMENTAL,
+                    error_messages,
+                )
+            except KeyError:
+                error_messages.append(
+                    'Could not find a [Merge] section\n'
+                    'Defaulting all options within the [Merge] section\n'
+                )
+
+            try:
+                output_section = configuration_object['Output']
+
+                output_compression = cls._read_choices_option(
+                    output_section,
+                    'Output',
+                    'compression',
+                    VALID_OUTPUT_COMPRESSION_VALUES,
+                    DEFAULT_OUTPUT_COMPRESSION,
+                    error_messages,
+                )
+                output_parallel = cls._read_boolean_option(
+                    output_section,
+                    'Output',
+                    'parallel',
+                    DEFAULT_OUTPUT_PARALLEL,
+                    error_messages,
+                )
+                output_export = cls._read_boolean_option(
+                    output_section,
+                    'Output',
+                    'export',
+                    DEFAULT_OUTPUT_EXPORT,
+                    error_messages,
+                )
+                output_delta = cls._read_boolean_option(
+                    output_section,
+                    'Output',
+                    'delta',
+                    DEFAULT_OUTPUT_DELTA,
+                    error_messages,
+                )
+                output_split = cls._read_boolean_option(
+                    output_section,
+                    'Output',
+                    'split',
+                    DEFAULT_OUTPUT_SPLIT,
+                    error_messages,
+                )
+            except KeyError:
+                error_messages.append(
+                    'Could not find a [Output] section\n'
+                    'Defaulting all options within the [Output] section\n'
+                )
+
+            try:
+                server_section = configuration_object['Server']
+
+                try:
+                    server_address = server_section['address']
+                except KeyError:
+                    error_messages.append(
+                        'Could not find an address option within the [Server] section\n'
+                        'Defaulting to {0}\n'.format(DEFAULT_SERVER_ADDRESS)
+                    )
+
+                server_port = cls._read_integer_option(
+                    server_section,
+                    'Server',
+                    'port',
+                    DEFAULT_SERVER_PORT,
+                    error_messages,
+                )
+                server_generation_interval = cls._read_integer_option(
+                    server_section,
+                    'Server',
+                    'generation_interval',
+                    DEFAULT_SERVER_GENERATION_INTERVAL,
+                    error_messages,
+                )
+
+                if not 0 < server_port < 65536:
+                    error_messages.append(
+                        'The port option within the [Server] section must be between '
+                        '1 and 65535\n'
+                        'Defaulting to {0}\n'.format(DEFAULT_SERVER_PORT)
+                    )
+
+                    server_port = DEFAULT_SERVER_PORT
+            except KeyError:
+                error_messages.append(
+                    'Could not find a [Server] section\n'
+                    'Defaulting all options within the [Server] section\n'
+                )
+
+            if merge_parallel and database_in_memory:
+                error_messages.append(
+                    'The parallel option within the [Merge] section '
+                    'cannot be enabled together with the in_memory option within the '
+                    '[Database] section\n'
+                    'Defaulting parallel to False\n'
+                )
+
+                merge_parallel = False
+
+            if output_parallel and database_in_memory:
+                error_messages.append(
+                    'The parallel option within the [Output] section '
+                    'cannot be enabled together with the in_memory option within the '
+                    '[Database] section\n'
+                    'Defaulting parallel to False\n'
+                )
+
+                output_parallel = False
+
+            if do_serve_output_xmltv_files:
+                if merge_parallel:
+                    error_messages.append(
+                        'The parallel option within the [Merge] section '
+                        'cannot be enabled when serving the XMLTV files over HTTP\n'
+                        'Defaulting parallel to False\n'
+                    )
+
+                    merge_parallel = False
+
+                if output_parallel:
+                    error_messages.append(
+                        'The parallel option within the [Output] section '
+                        'cannot be enabled when serving the XMLTV files over HTTP\n'
+                        'Defaulting parallel to False\n'
+                    )
+
+                    output_parallel = False
+
             if error_messages:
                 error_messages.insert(
                     0,
@@ -248,6 +707,28 @@ class Configuration(object):
                     'GMAIL_USERNAME': gmail_username,
                     'GMAIL_PASSWORD': gmail_password,
                     'LOGGING_LEVEL': logging_level,
+                    'DATABASE_JOURNAL_MODE': database_journal_mode,
+                    'DATABASE_SYNCHRONOUS': database_synchronous,
+                    'DATABASE_CACHE_SIZE': database_cache_size,
+                    'DATABASE_MMAP_SIZE': database_mmap_size,
+                    'DATABASE_TEMP_STORE': database_temp_store,
+                    'DATABASE_CACHED_STATEMENTS': database_cached_statements,
+                    'DATABASE_OPTIMIZE_INTERVAL': database_optimize_interval,
+                    'DATABASE_BACKGROUND_WRITER': database_background_writer,
+                    'DATABASE_INCREMENTAL_VACUUM_PAGES': database_incremental_vacuum_pages,
+                    'DATABASE_ANALYZE_INTERVAL': database_analyze_interval,
+                    'DATABASE_IN_MEMORY': database_in_memory,
+                    'MERGE_PARALLEL': merge_parallel,
+                    'MERGE_NUMBER_OF_WORKERS': merge_number_of_workers,
+                    'MERGE_INCREMENTAL': merge_incremental,
+                    'OUTPUT_COMPRESSION': output_compression,
+                    'OUTPUT_PARALLEL': output_parallel,
+                    'OUTPUT_EXPORT': output_export,
+                    'OUTPUT_DELTA': output_delta,
+                    'OUTPUT_SPLIT': output_split,
+                    'SERVER_ADDRESS': server_address,
+                    'SERVER_PORT': server_port,
+                    'SERVER_GENERATION_INTERVAL': server_generation_interval,
                 }
 
                 logger.info(
@@ -262,7 +743,29 @@ class Configuration(object):
                     'GMail enabled            => %s\n'
                     'GMail username           => %s\n'
                     'GMail password           => %s\n'
-                    'Logging level            => %s',
+                    'Logging level            => %s\n'
+                    'DB journal mode          => %s\n'
+                    'DB synchronous           => %s\n'
+                    'DB cache size            => %s\n'
+                    'DB mmap size             => %s\n'
+                    'DB temp store            => %s\n'
+                    'DB cached statements     => %s\n'
+                    'DB optimize interval     => %s\n'
+                    'DB background writer     => %s\n'
+                    'DB incremental vacuum    => %s\n'
+                    'DB analyze interval      => %s\n'
+                    'DB in memory             => %s\n'
+                    'Merge parallel           => %s\n'
+                    'Merge # of workers       => %s\n'
+                    'Merge incremental        => %s\n'
+                    'Output compression       => %s\n'
+                    'Output parallel          => %s\n'
+                    'Output export            => %s\n'
+                    'Output delta             => %s\n'
+                    'Output split             => %s\n'
+                    'Server address           => %s\n'
+                    'Server port              => %s\n'
+                    'Server interval          => %s',
                     configuration_file_path,
                     rovi_api_key,
                     rovi_shared_secret,
@@ -274,6 +777,28 @@ class Configuration(object):
                     gmail_username,
                     gmail_password,
                     logging_level,
+                    database_journal_mode,
+                    database_synchronous,
+                    database_cache_size,
+                    database_mmap_size,
+                    database_temp_store,
+                    database_cached_statements,
+                    database_optimize_interval,
+                    bool(database_background_writer),
+                    database_incremental_vacuum_pages,
+                    database_analyze_interval,
+                    bool(database_in_memory),
+                    bool(merge_parallel),
+                    merge_number_of_workers,
+                    bool(merge_incremental),
+                    ', '.join(output_compression),
+                    bool(output_parallel),
+                    bool(output_export),
+                    bool(output_delta),
+                    bool(output_split),
+                    server_address,
+                    server_port,
+                    server_generation_interval,
                 )
         except OSError:
             logger.error(
@@ -18,6 +18,21 @@ DEFAULT_DB_FILE_PATH = os.path.join(
 DEFAULT_DB_CREATE_SCHEMA_FILE_PATH = os.path.join(
     DEFAULT_DB_DIRECTORY_PATH, 'create_schema.sql'
 )
+DEFAULT_DB_ANALYZE_INTERVAL = 604800
+DEFAULT_DB_BACKGROUND_WRITER = False
+DEFAULT_DB_CACHE_SIZE = -65536
+DEFAULT_DB_CACHED_STATEMENTS = 256
+DEFAULT_DB_IN_MEMORY = False
+DEFAULT_DB_INCREMENTAL_VACUUM_PAGES = 1024
+DEFAULT_DB_JOURNAL_MODE = 'WAL'
+DEFAULT_DB_MIGRATIONS_DIRECTORY_PATH = os.path.join(
+    DEFAULT_DB_DIRECTORY_PATH, 'migrations'
+)
+DEFAULT_DB_MMAP_SIZE = 268435456
+DEFAULT_DB_OPTIMIZE_INTERVAL = 3600
+DEFAULT_DB_SYNCHRONOUS = 'NORMAL'
+DEFAULT_DB_TEMP_STORE = 'MEMORY'
+DEFAULT_DB_WRITER_BATCH_SIZE = 256
 DEFAULT_GMAIL_ENABLED = True
 DEFAULT_INPUT_XMLTV_DIRECTORY_PATH = os.path.join(sys.path[0], 'xmltv')
 DEFAULT_LOGGING_LEVEL = logging.DEBUG
@@ -32,20 +47,68 @@ DEFAULT_MC2XML_EXECUTABLE_MAP = {
     'Windows': 'mc2xml_windows.exe',
 }
 DEFAULT_MC2XML_OUTPUT_DIRECTORY_PATH = os.path.join(sys.path[0], 'xmltv')
+DEFAULT_MERGE_CACHE_DIRECTORY_PATH = os.path.join(sys.path[0], 'cache')
+DEFAULT_MERGE_INCREMENTAL = False
+DEFAULT_MERGE_NUMBER_OF_WORKERS = 0
+DEFAULT_MERGE_PARALLEL = False
+DEFAULT_OUTPUT_COMPRESSION = ()
+DEFAULT_OUTPUT_DELTA = False
+DEFAULT_OUTPUT_DELTA_FILE_NAME_FORMAT = 'epg_{0}.delta.json'
+DEFAULT_OUTPUT_DELTA_SNAPSHOT_DIRECTORY_PATH = os.path.join(sys.path[0], 'cache')
+DEFAULT_OUTPUT_DELTA_SNAPSHOT_FILE_NAME_FORMAT = 'delta_{0}.pickle'
+DEFAULT_OUTPUT_EXPORT = False
+DEFAULT_OUTPUT_EXPORT_COLUMNAR_FILE_NAME_FORMAT = 'epg_{0}.columnar.json'
+DEFAULT_OUTPUT_EXPORT_NDJSON_FILE_NAME_FORMAT = 'epg_{0}.ndjson'
+DEFAULT_OUTPUT_FILE_BUFFER_SIZE = 1024 * 1024
+DEFAULT_OUTPUT_INDEX_FILE_NAME_FORMAT = '{0}.index.json'
+DEFAULT_OUTPUT_MANIFEST_FILE_NAME = 'manifest.json'
+DEFAULT_OUTPUT_PARALLEL = False
+DEFAULT_OUTPUT_SPLIT = False
+DEFAULT_OUTPUT_SPLIT_CHANNEL_FILE_NAME_FORMAT = 'xmltv_{0}{1}_channel_{2}.xml'
+DEFAULT_OUTPUT_SPLIT_DAY_FILE_NAME_FORMAT = 'xmltv_{0}{1}_day_{2}.xml'
 DEFAULT_OUTPUT_XMLTV_DIRECTORY_PATH = os.path.join(sys.path[0], 'output')
 DEFAULT_OUTPUT_XMLTV_FILE_NAME_FORMAT = 'xmltv_{0}{1}{2}.xml'
+DEFAULT_OUTPUT_XMLTV_FOOTER = '</tv>\n'
+DEFAULT_OUTPUT_XMLTV_HEADER = '<?xml version="1.0" encoding="utf-8"?>\n<tv>\n'
 DEFAULT_OUTPUT_XMLTV_NUMBER_OF_DAYS = [1, 3, 7]
 DEFAULT_ROVI_TEMPLATE_FILE_PATH = os.path.join(
     DEFAULT_MC2XML_DIRECTORY_PATH, 'rovi_template', 'templates.json'
 )
 DEFAULT_ROVI_TEMPLATE_URL = 'http://cloud.rovicorp.com/template/v1/{0}/3/templates.json'
+DEFAULT_SERVER_ADDRESS = '0.0.0.0'
+DEFAULT_SERVER_GENERATION_INTERVAL = 14400
+DEFAULT_SERVER_PORT = 8080
 GMAIL_SERVER_HOSTNAME = 'smtp.gmail.com'
 LOGGING_MAP = {'DEBUG': logging.DEBUG, 'ERROR': logging.ERROR, 'INFO': logging.INFO}
 MAXIMUM_TIME_DELTA_IN_SECONDS = 1800
 RISKY_FUZZY_MATCH_PERCENTAGE = 50
 SAFE_FUZZY_MATCH_PERCENTAGE = 70
+SERVER_CONTENT_TYPE_MAP = {
+    '.gz': 'application/gzip',
+    '.json': 'application/json',
+    '.ndjson': 'application/x-ndjson',
+    '.xml': 'application/xml; charset=utf-8',
+    '.xz': 'application/x-xz',
+}
 SMOOTH_STREAMS_EPG_BASE_URL = 'https://fast-guide.smoothstreams.tv/'
 SMOOTH_STREAMS_EPG_FILE_NAME = 'feed.xml'
+VALID_BOOLEAN_VALUES = (
+    '0',
+    '1',
+    'f',
+    'false',
+    'n',
+    'no',
+    'off',
+    'on',
+    't',
+    'true',
+    'y',
+    'yes',
+)
+VALID_DB_JOURNAL_MODE_VALUES = ('DELETE', 'MEMORY', 'OFF', 'PERSIST', 'TRUNCATE', 'WAL')
+VALID_DB_SYNCHRONOUS_VALUES = ('EXTRA', 'FULL', 'NORMAL', 'OFF')
+VALID_DB_TEMP_STORE_VALUES = ('DEFAULT', 'FILE', 'MEMORY')
 VALID_GMAIL_ENABLED_VALUES = (
     '0',
     '1',
@@ -61,4 +124,5 @@ VALID_GMAIL_ENABLED_VALUES = (
     'yes',
 )
 VALID_LOGGING_LEVEL_VALUES = ('DEBUG', 'ERROR', 'INFO')
+VALID_OUTPUT_COMPRESSION_VALUES = ('GZ', 'XZ')
 VERSION = '1.3.8'
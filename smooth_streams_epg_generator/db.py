@@ -1,8 +1,19 @@
 import logging
+import os
+import queue
+import re
 import sqlite3
+import sys
+import threading
+import time
+import traceback
 from sqlite3 import Row
 
+from .configuration import Configuration
 from .constants import DEFAULT_DB_CREATE_SCHEMA_FILE_PATH
+from .constants import DEFAULT_DB_MIGRATIONS_DIRECTORY_PATH
+from .constants import DEFAULT_DB_WRITER_BATCH_SIZE
+from .error import Error
 from .utilities import Utility
 
 logger = logging.getLogger(__name__)
@@ -14,13 +25,234 @@ class Database(object):
     _connection = None
     _cursor = None
     _database_file_path = None
+    _deferred_writes = None
+    _last_optimize_time = None
+    _writer_metrics = {}
+    _writer_queue = None
+    _writer_thread = None
+
+    @classmethod
+    def _apply_performance_profile(cls, cursor):
+        journal_mode = Configuration.get_configuration_parameter(
+            'DATABASE_JOURNAL_MODE'
+        )
+        synchronous = Configuration.get_configuration_parameter('DATABASE_SYNCHRONOUS')
+        cache_size = Configuration.get_configuration_parameter('DATABASE_CACHE_SIZE')
+        mmap_size = Configuration.get_configuration_parameter('DATABASE_MMAP_SIZE')
+        temp_store = Configuration.get_configuration_parameter('DATABASE_TEMP_STORE')
+
+        cursor.execute('PRAGMA journal_mode = {0}'.format(journal_mode))
+        cursor.execute('PRAGMA synchronous = {0}'.format(synchronous))
+        cursor.execute('PRAGMA cache_size = {0:d}'.format(cache_size))
+        cursor.execute('PRAGMA mmap_size = {0:d}'.format(mmap_size))
+        cursor.execute('PRAGMA temp_store = {0}'.format(temp_store))
+
+        logger.debug(
+            'Applied SQLite performance profile\n'
+            'Journal mode => %s\n'
+            'Synchronous  => %s\n'
+            'Cache size   => %s\n'
+            'mmap size    => %s\n'
+            'Temp store   => %s',
+            cursor.execute('PRAGMA journal_mode').fetchone()[0],
+            synchronous,
+            cache_size,
+            mmap_size,
+            temp_store,
+        )
+
+    @classmethod
+    def _connect(cls, database):
+        connection = sqlite3.connect(
+            database,
+            cached_statements=Configuration.get_configuration_parameter(
+                'DATABASE_CACHED_STATEMENTS'
+            ),
+        )
+        connection.row_factory = Row
+        connection.create_function(
+            'calculate_hash_key', -1, Utility.calculate_hash_key, deterministic=True
+        )
+
+        cls._apply_performance_profile(connection.cursor())
+
+        return connection
 
     @classmethod
     def _create_schema(cls):
         cls._cursor.executescript(Utility.read_file(DEFAULT_DB_CREATE_SCHEMA_FILE_PATH))
 
     @classmethod
-    def close_connection(cls):
+    def _load_in_memory_database(cls):
+        file_connection = sqlite3.connect(cls._database_file_path)
+        file_connection.backup(cls._connection)
+        file_connection.close()
+
+        logger.debug(
+            'Loaded SQLite database into memory\nSQLite database file => %s',
+            cls._database_file_path,
+        )
+
+    @classmethod
+    def _migrate_schema(cls):
+        schema_version = cls._cursor.execute('PRAGMA user_version').fetchone()[0]
+
+        for migration_file_name in sorted(
+            os.listdir(DEFAULT_DB_MIGRATIONS_DIRECTORY_PATH)
+        ):
+            regular_expression_match = re.match(
+                r'\A(\d+)_.*\.sql\Z', migration_file_name
+            )
+            if regular_expression_match is None:
+                continue
+
+            migration_version = int(regular_expression_match.group(1))
+            if migration_version <= schema_version:
+                continue
+
+            logger.info(
+                'Migrating SQLite database schema\n'
+                'From version => %s\n'
+                'To version   => %s\n'
+                'Migration    => %s',
+                schema_version,
+                migration_version,
+                migration_file_name,
+            )
+
+            try:
+                cls._cursor.executescript(
+                    'BEGIN;\n{0}\nPRAGMA user_version = {1:d};\nCOMMIT;'.format(
+                        Utility.read_file(
+                            os.path.join(
+                                DEFAULT_DB_MIGRATIONS_DIRECTORY_PATH,
+                                migration_file_name,
+                            )
+                        ),
+                        migration_version,
+                    )
+                )
+            except sqlite3.Error:
+                cls._connection.rollback()
+
+                logger.error(
+                    'Failed to migrate SQLite database schema\nMigration => %s',
+                    migration_file_name,
+                )
+
+                raise
+
+            schema_version = migration_version
+
+    @classmethod
+    def _optimize(cls):
+        cls._cursor.execute('PRAGMA optimize')
+        cls._last_optimize_time = time.monotonic()
+
+        logger.debug(
+            'Optimized SQLite database\nSQLite database file => %s',
+            cls._database_file_path,
+        )
+
+    @classmethod
+    def _persist_in_memory_database(cls):
+        temporary_database_file_path = '{0}.new'.format(cls._database_file_path)
+
+        if os.path.exists(temporary_database_file_path):
+            os.remove(temporary_database_file_path)
+
+        file_connection = sqlite3.connect(temporary_database_file_path)
+        cls._connection.backup(file_connection)
+        file_connection.close()
+
+        os.replace(temporary_database_file_path, cls._database_file_path)
+
+        logger.debug(
+            'Persisted in-memory SQLite database\nSQLite database file => %s',
+            cls._database_file_path,
+        )
+
+    @classmethod
+    def _run_writer(cls):
+        connection = cls._connect(cls._database_file_path)
+        cursor = connection.cursor()
+
+        is_running = True
+        while is_running:
+            operations = [cls._writer_queue.get()]
+            while len(operations) < DEFAULT_DB_WRITER_BATCH_SIZE:
+                try:
+                    operations.append(cls._writer_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            flush_events = []
+            for operation in operations:
+                if operation is None:
+                    is_running = False
+                elif isinstance(operation, threading.Event):
+                    flush_events.append(operation)
+                else:
+                    try:
+                        cursor.execute(*operation)
+                    except sqlite3.Error:
+                        (type_, value_, traceback_) = sys.exc_info()
+                        error = 'Failed to execute queued SQL statement\n{0}'.format(
+                            '\n'.join(
+                                traceback.format_exception(type_, value_, traceback_)
+                            )
+                        )
+
+                        logger.error(error)
+                        Error.add_error(error)
+
+            connection.commit()
+
+            for flush_event in flush_events:
+                flush_event.set()
+
+        cursor.close()
+        connection.close()
+
+    @classmethod
+    def _start_writer(cls):
+        if cls._writer_thread is not None:
+            logger.warning('Stopping stale SQLite background writer')
+
+            cls.stop_writer()
+
+        cls._writer_metrics = {
+            'maximum_queue_depth': 0,
+            'maximum_flush_latency': 0.0,
+            'number_of_flushes': 0,
+            'number_of_writes': 0,
+            'total_flush_latency': 0.0,
+        }
+        cls._writer_queue = queue.Queue()
+        cls._writer_thread = threading.Thread(
+            target=cls._run_writer, name='DatabaseWriter', daemon=True
+        )
+        cls._writer_thread.start()
+
+        logger.debug(
+            'Started SQLite background writer\nSQLite database file => %s',
+            cls._database_file_path,
+        )
+
+    @classmethod
+    def close_connection(cls, do_persist=True):
+        cls.stop_writer()
+
+        if cls._connection is None:
+            return
+
+        cls._optimize()
+
+        if do_persist and Configuration.get_configuration_parameter(
+            'DATABASE_IN_MEMORY'
+        ):
+            cls._persist_in_memory_database()
+
         logger.debug(
             'Close connection to SQLite database\nSQLite database file => %s',
             cls._database_file_path,
@@ -29,27 +261,86 @@ class Database(object):
         cls._cursor.close()
         cls._connection.close()
 
+        cls._connection = None
+        cls._cursor = None
+
     @classmethod
     def commit(cls):
         cls._connection.commit()
 
+        optimize_interval = Configuration.get_configuration_parameter(
+            'DATABASE_OPTIMIZE_INTERVAL'
+        )
+        if (
+            optimize_interval > 0
+            and time.monotonic() - cls._last_optimize_time >= optimize_interval
+        ):
+            cls._optimize()
+
+    @classmethod
+    def defer_writes(cls):
+        cls._deferred_writes = []
+
     @classmethod
     def execute(cls, sql_statement, parameters):
         cls._cursor.execute(sql_statement, parameters)
 
         return cls._cursor.fetchall()
 
+    @classmethod
+    def flush(cls):
+        if cls._writer_thread is None:
+            return
+
+        flush_start_time = time.monotonic()
+
+        flush_event = threading.Event()
+        cls._writer_queue.put(flush_event)
+        flush_event.wait()
+
+        flush_latency = time.monotonic() - flush_start_time
+
+        cls._writer_metrics['number_of_flushes'] += 1
+        cls._writer_metrics['total_flush_latency'] += flush_latency
+        cls._writer_metrics['maximum_flush_latency'] = max(
+            cls._writer_metrics['maximum_flush_latency'], flush_latency
+        )
+
     @classmethod
     def get_row_count(cls):
         return cls._cursor.rowcount
 
+    @classmethod
+    def get_writer_metrics(cls):
+        writer_metrics = dict(cls._writer_metrics)
+
+        if cls._writer_queue is not None:
+            writer_metrics['queue_depth'] = cls._writer_queue.qsize()
+
+        return writer_metrics
+
     @classmethod
     def open_connection(cls, database_file_path):
+        if cls._connection is not None:
+            logger.warning(
+                'Closing stale connection to SQLite database\n'
+                'SQLite database file => %s',
+                cls._database_file_path,
+            )
+
+            cls.stop_writer()
+            cls.rollback()
+            cls.close_connection(do_persist=False)
+
         cls._database_file_path = database_file_path
 
-        cls._connection = sqlite3.connect(cls._database_file_path)
-        cls._connection.row_factory = Row
+        if Configuration.get_configuration_parameter('DATABASE_IN_MEMORY'):
+            cls._connection = cls._connect(':memory:')
+            cls._load_in_memory_database()
+        else:
+            cls._connection = cls._connect(cls._database_file_path)
         cls._cursor = cls._connection.cursor()
+        cls._last_optimize_time = time.monotonic()
 
         logger.debug(
             'Opened connection to SQLite database\nSQLite database file => %s',
@@ -57,3 +348,111 @@ class Database(object):
         )
 
         cls._create_schema()
+        cls._migrate_schema()
+
+        if Configuration.get_configuration_parameter('DATABASE_BACKGROUND_WRITER'):
+            cls._start_writer()
+
+    @classmethod
+    def open_worker_connection(cls):
+        # The handles inherited from the parent were closed before the fork. Drop
+        # them without touching them, as a SQLite connection must never be used
+        # across fork().
+        cls._connection = None
+        cls._cursor = None
+
+        cls._connection = cls._connect(cls._database_file_path)
+        cls._cursor = cls._connection.cursor()
+        cls._writer_queue = None
+        cls._writer_thread = None
+
+        logger.debug(
+            'Opened worker connection to SQLite database\n'
+            'SQLite database file => %s',
+            cls._database_file_path,
+        )
+
+    @classmethod
+    def release_deferred_writes(cls):
+        deferred_writes = cls._deferred_writes
+        cls._deferred_writes = None
+
+        return deferred_writes
+
+    @classmethod
+    def resume_connection(cls):
+        cls._connection = cls._connect(cls._database_file_path)
+        cls._cursor = cls._connection.cursor()
+
+        logger.debug(
+            'Resumed connection to SQLite database\nSQLite database file => %s',
+            cls._database_file_path,
+        )
+
+    @classmethod
+    def rollback(cls):
+        cls._connection.rollback()
+
+    @classmethod
+    def stop_writer(cls):
+        if cls._writer_thread is None:
+            return
+
+        cls._writer_queue.put(None)
+        cls._writer_thread.join()
+
+        logger.debug(
+            'Stopped SQLite background writer\n'
+            '# of writes           => %s\n'
+            '# of flushes          => %s\n'
+            'Average flush latency => %.6f\n'
+            'Maximum flush latency => %.6f\n'
+            'Maximum queue depth   => %s',
+            cls._writer_metrics['number_of_writes'],
+            cls._writer_metrics['number_of_flushes'],
+            cls._writer_metrics['total_flush_latency']
+            / cls._writer_metrics['number_of_flushes']
+            if cls._writer_metrics['number_of_flushes']
+            else 0.0,
+            cls._writer_metrics['maximum_flush_latency'],
+            cls._writer_metrics['maximum_queue_depth'],
+        )
+
+        cls._writer_queue = None
+        cls._writer_thread = None
+
+    @classmethod
+    def submit(cls, sql_statement, parameters):
+        if cls._deferred_writes is not None:
+            cls._deferred_writes.append((sql_statement, parameters))
+
+            return
+
+        if cls._writer_thread is None:
+            cls.execute(sql_statement, parameters)
+            cls.commit()
+
+            return
+
+        cls._writer_queue.put((sql_statement, parameters))
+
+        cls._writer_metrics['number_of_writes'] += 1
+        cls._writer_metrics['maximum_queue_depth'] = max(
+            cls._writer_metrics['maximum_queue_depth'], cls._writer_queue.qsize()
+        )
+
+    @classmethod
+    def suspend_connection(cls):
+        cls.stop_writer()
+
+        cls._connection.commit()
+        cls._cursor.close()
+        cls._connection.close()
+
+        cls._connection = None
+        cls._cursor = None
+
+        logger.debug(
+            'Suspended connection to SQLite database\nSQLite database file => %s',
+            cls._database_file_path,
+        )
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+
+from .constants import DEFAULT_OUTPUT_DELTA_SNAPSHOT_DIRECTORY_PATH
+from .constants import DEFAULT_OUTPUT_DELTA_SNAPSHOT_FILE_NAME_FORMAT
+from .utilities import Utility
+
+logger = logging.getLogger(__name__)
+
+
+class OutputDelta(object):
+    __slots__ = []
+
+    @classmethod
+    def _get_snapshot_file_path(cls, snapshot_name):
+        return os.path.join(
+            DEFAULT_OUTPUT_DELTA_SNAPSHOT_DIRECTORY_PATH,
+            DEFAULT_OUTPUT_DELTA_SNAPSHOT_FILE_NAME_FORMAT.format(snapshot_name),
+        )
+
+    @classmethod
+    def calculate_program_identity(cls, program):
+        return hashlib.blake2b(
+            pickle.dumps(
+                (
+                    program.titles,
+                    program.sub_titles,
+                    program.descriptions,
+                    program.categories,
+                    program.episode_numbers,
+                ),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            ),
+            digest_size=8,
+        ).hexdigest()
+
+    @classmethod
+    def load_snapshot(cls, snapshot_name):
+        snapshot_file_path = cls._get_snapshot_file_path(snapshot_name)
+
+        try:
+            with open(snapshot_file_path, 'rb') as snapshot_file:
+                return pickle.load(snapshot_file)
+        except FileNotFoundError:
+            pass
+        except (AttributeError, EOFError, ImportError, OSError, pickle.PickleError):
+            logger.info(
+                'Failed to load delta snapshot\nSnapshot file path => %s',
+                snapshot_file_path,
+            )
+
+        return None
+
+    @classmethod
+    def render_delta(cls, previous_snapshot, snapshot, render_program_json):
+        (previous_generation_time, previous_channels) = previous_snapshot
+        (generation_time, channels) = snapshot
+
+        channels_delta = {}
+
+        for channel_id in sorted(previous_channels.keys() | channels.keys()):
+            previous_programs = previous_channels.get(channel_id, {})
+            programs = channels.get(channel_id, {})
+
+            added_programs = {
+                program_identity: json.loads(
+                    render_program_json(channel_id, program_identity)
+                )
+                for program_identity in programs
+                if program_identity not in previous_programs
+            }
+            removed_programs = [
+                program_identity
+                for program_identity in previous_programs
+                if program_identity not in programs
+            ]
+            retimed_programs = {
+                program_identity: program_times
+                for (program_identity, program_times) in programs.items()
+                if program_identity in previous_programs
+                and previous_programs[program_identity] != program_times
+            }
+
+            if added_programs or removed_programs or retimed_programs:
+                channels_delta[channel_id] = {
+                    'added': added_programs,
+                    'removed': removed_programs,
+                    'retimed': retimed_programs,
+                }
+
+        return json.dumps(
+            {
+                'channels': channels_delta,
+                'from': previous_generation_time,
+                'to': generation_time,
+            },
+            ensure_ascii=False,
+            separators=(',', ':'),
+            sort_keys=True,
+        )
+
+    @classmethod
+    def save_snapshot(cls, snapshot_name, snapshot):
+        if not os.path.exists(DEFAULT_OUTPUT_DELTA_SNAPSHOT_DIRECTORY_PATH):
+            Utility.create_directory(DEFAULT_OUTPUT_DELTA_SNAPSHOT_DIRECTORY_PATH)
+
+        snapshot_file_path = cls._get_snapshot_file_path(snapshot_name)
+        temporary_snapshot_file_path = '{0}.new'.format(snapshot_file_path)
+
+        with open(temporary_snapshot_file_path, 'wb') as snapshot_file:
+            pickle.dump(snapshot, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temporary_snapshot_file_path, snapshot_file_path)
@@ -1,12 +1,16 @@
 import bisect
 import copy
+import itertools
+import json
 import logging
+import multiprocessing
 import os
 import re
-import sqlite3
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from datetime import timedelta
-from xml.sax import saxutils
 
 import jellyfish
 import pytz
@@ -17,10 +21,10 @@ from fuzzywuzzy import process
 from lxml import etree
 
 from smooth_streams_epg_generator.db import Database
+from .configuration import Configuration
 from .constants import DEFAULT_CHANNEL_MAP_FILE_PATH
 from .constants import DEFAULT_INPUT_XMLTV_DIRECTORY_PATH
 from .constants import DEFAULT_MC2XML_DIRECTORY_PATH
-from .constants import DEFAULT_OUTPUT_XMLTV_FILE_NAME_FORMAT
 from .constants import DEFAULT_OUTPUT_XMLTV_NUMBER_OF_DAYS
 from .constants import MAXIMUM_TIME_DELTA_IN_SECONDS
 from .constants import RISKY_FUZZY_MATCH_PERCENTAGE
@@ -28,6 +32,16 @@ from .constants import SAFE_FUZZY_MATCH_PERCENTAGE
 from .constants import SMOOTH_STREAMS_EPG_BASE_URL
 from .constants import SMOOTH_STREAMS_EPG_FILE_NAME
 from .error import Error
+from .maintenance import DatabaseMaintenance
+from .merge_cache import MergeCache
+from .merge_statistics import MergeStatistics
+from .output import OutputCompressor
+from .output import OutputManifest
+from .output_encoding import OutputEncoding
+from .output_writers import OutputDeltaWriter
+from .output_writers import OutputExportWriter
+from .output_writers import OutputSplitWriter
+from .output_writers import OutputXMLTVWriter
 from .privilege import Privilege
 from .utilities import Utility
 
@@ -138,13 +152,54 @@ class EPG(object):
         'I362.58812': '145',
         'I1503.94289': '150',
     }
+    _consulted_parsed_programs_map_keys = None
+    _deferred_categories_map_updates = None
     _epg = {}
+    _generate_epgs_futures = []
+    _generate_epgs_process_pool_executor = None
     _latest_date_time_epg_xml = None
     _mc2xml_channel_ids_map = {}
     _parsed_programs_map = {}
     _smooth_streams_epg = {}
     _startup_date_time_in_utc = None
 
+    @classmethod
+    def _apply_categories_map_update(
+        cls, smooth_streams_program_category, epg_program_title
+    ):
+        if (
+            smooth_streams_program_category in cls._categories_map
+            and epg_program_title
+            in cls._categories_map[smooth_streams_program_category]
+        ):
+            cls._categories_map[smooth_streams_program_category][epg_program_title] += 1
+        else:
+            cls._categories_map[smooth_streams_program_category] = {
+                epg_program_title: 1
+            }
+
+    @classmethod
+    def _apply_merge_channel_result(cls, channel_id, merge_result):
+        (
+            (epg_programs, smooth_streams_programs),
+            deferred_writes,
+            deferred_categories_map_updates,
+        ) = merge_result
+
+        cls._epg[channel_id].programs = epg_programs
+        cls._smooth_streams_epg[channel_id].programs = smooth_streams_programs
+
+        for (sql_statement, parameters) in deferred_writes:
+            Database.submit(sql_statement, parameters)
+
+        for (
+            smooth_streams_program_category,
+            epg_program_title,
+        ) in deferred_categories_map_updates:
+            cls._apply_categories_map_update(
+                smooth_streams_program_category, epg_program_title
+            )
+
     @classmethod
     def _are_programs_pre_validated_match(cls, smooth_streams_program, epg_program):
         program_match_records = cls._query_program_match_table(
@@ -158,6 +213,127 @@ class EPG(object):
 
         return False
 
+    @classmethod
+    def _calculate_channel_fingerprint(cls, channel_id, matching_context_fingerprint):
+        cutoff_date_time_in_utc = cls._startup_date_time_in_utc.replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) + timedelta(days=max(DEFAULT_OUTPUT_XMLTV_NUMBER_OF_DAYS) + 1)
+
+        smooth_streams_programs = list(cls._smooth_streams_epg[channel_id].programs)
+
+        return MergeCache.calculate_fingerprint(
+            matching_context_fingerprint,
+            [
+                smooth_streams_program.get_fingerprint_fields()
+                for smooth_streams_program in smooth_streams_programs
+            ],
+            [
+                epg_program.get_fingerprint_fields()
+                for epg_program in cls._epg[channel_id].programs
+            ],
+            [
+                (
+                    smooth_streams_program.start < cls._startup_date_time_in_utc
+                    and smooth_streams_program.stop <= cls._startup_date_time_in_utc,
+                    smooth_streams_program.start >= cutoff_date_time_in_utc
+                    or smooth_streams_program.start >= cls._latest_date_time_epg_xml
+                    or smooth_streams_program.stop >= cls._latest_date_time_epg_xml,
+                )
+                for smooth_streams_program in smooth_streams_programs
+            ],
+        )
+
+    @classmethod
+    def _calculate_matching_context_fingerprint(cls):
+        Database.flush()
+
+        return MergeCache.calculate_fingerprint(
+            cls._channel_id_map,
+            [
+                tuple(record)
+                for sql_statement in (
+                    'SELECT * '
+                    'FROM forced_program_match '
+                    'ORDER BY smooth_streams_program_title, '
+                    'smooth_streams_program_sub_title, '
+                    'smooth_streams_program_channel, '
+                    'smooth_streams_program_start, '
+                    'smooth_streams_program_stop',
+                    'SELECT * '
+                    'FROM ignored_epg_program_match '
+                    'ORDER BY epg_program_title, '
+                    'epg_program_sub_title, '
+                    'epg_program_channel, '
+                    'epg_program_start, '
+                    'epg_program_stop',
+                    'SELECT * '
+                    'FROM ignored_smooth_streams_program_match '
+                    'ORDER BY smooth_streams_program_title, '
+                    'smooth_streams_program_sub_title, '
+                    'smooth_streams_program_channel, '
+                    'smooth_streams_program_start, '
+                    'smooth_streams_program_stop',
+                    'SELECT * '
+                    'FROM ignored_smooth_streams_program_pattern '
+                    'ORDER BY smooth_streams_program_pattern',
+                    'SELECT * '
+                    'FROM pattern_program_match '
+                    'ORDER BY smooth_streams_program_title, epg_program_pattern',
+                    'SELECT smooth_streams_category, epg_category, is_valid, reviewed '
+                    'FROM category_map '
+                    'ORDER BY smooth_streams_category, epg_category',
+                )
+                for record in Database.execute(sql_statement, {})
+            ],
+            [
+                tuple(record)
+                for record in Database.execute(
+                    'SELECT program_match_key, is_valid '
+                    'FROM program_match '
+                    'ORDER BY program_match_key',
+                    {},
+                )
+                if record['is_valid'] is not None
+            ],
+        )
+
+    @classmethod
+    def _calculate_parsed_programs_fingerprint(cls, parsed_programs_map_keys):
+        return MergeCache.calculate_fingerprint(
+            [
+                [
+                    parsed_program.get_fingerprint_fields()
+                    for parsed_program in cls._parsed_programs_map.get(
+                        parsed_programs_map_key, []
+                    )
+                ]
+                for parsed_programs_map_key in parsed_programs_map_keys
+            ]
+        )
+
+    @classmethod
+    def _capture_merge_channel_result(cls, merge_channel, channel_id):
+        cls._consulted_parsed_programs_map_keys = set()
+        cls._deferred_categories_map_updates = []
+        Database.defer_writes()
+
+        cls._run_merge_channel(merge_channel, cls._smooth_streams_epg[channel_id])
+
+        merge_result = (
+            (
+                list(cls._epg[channel_id].programs),
+                list(cls._smooth_streams_epg[channel_id].programs),
+            ),
+            Database.release_deferred_writes(),
+            cls._deferred_categories_map_updates,
+        )
+        parsed_programs_map_keys = sorted(cls._consulted_parsed_programs_map_keys)
+
+        cls._consulted_parsed_programs_map_keys = None
+        cls._deferred_categories_map_updates = None
+
+        return (merge_result, parsed_programs_map_keys)
+
     @classmethod
     def _cleanup_smooth_streams_epg(cls):
         for channel in cls._smooth_streams_epg.values():
@@ -197,6 +373,15 @@ class EPG(object):
                     smooth_streams_program_to_delete.stop,
                 )
 
+    @classmethod
+    def _compress_epgs(cls, published_files):
+        Privilege.become_privileged_user()
+        try:
+            for (file_path, is_published) in published_files:
+                OutputCompressor.compress(file_path, is_published)
+        finally:
+            Privilege.become_unprivileged_user()
+
     @classmethod
     def _create_match_tuples(cls, smooth_streams_program, epg_program):
         match_tuples = []
@@ -306,6 +491,8 @@ class EPG(object):
                         potential_match_tuple[0]
                     ] = potential_match_tuple[1]
 
+        cls._record_consulted_parsed_programs_map_keys(potential_matches_to_score_map)
+
         potential_match_tuples = []
         for potential_match in potential_matches_to_score_map:
             potential_match_tuples.append(
@@ -317,6 +504,46 @@ class EPG(object):
 
         return potential_match_tuples
 
+    @classmethod
+    def _create_program_match_identity(cls, smooth_streams_program, epg_program):
+        regular_expression_match = re.search(
+            r'I[0-9]+.[0-9]+(.[0-9]+)?', epg_program.channel
+        )
+        if regular_expression_match is not None:
+            epg_program_channel_id = regular_expression_match.group(0)
+        else:
+            epg_program_channel_id = epg_program.channel
+
+        program_match_identity = {
+            'smooth_streams_program_title': smooth_streams_program.titles[0]['value'],
+            'smooth_streams_program_sub_title': smooth_streams_program.sub_titles[0][
+                'value'
+            ]
+            if smooth_streams_program.has_sub_titles()
+            else '',
+            'smooth_streams_program_channel': smooth_streams_program.channel,
+            'smooth_streams_program_start': Utility.convert_date_time_to_epoch(
+                smooth_streams_program.start
+            ),
+            'smooth_streams_program_stop': Utility.convert_date_time_to_epoch(
+                smooth_streams_program.stop
+            ),
+            'epg_program_title': epg_program.titles[0]['value'],
+            'epg_program_sub_title': epg_program.sub_titles[0]['value']
+            if epg_program.has_sub_titles()
+            else '',
+            'epg_program_channel': cls._channel_id_map[epg_program_channel_id]
+            if epg_program_channel_id in cls._channel_id_map
+            else epg_program_channel_id,
+            'epg_program_start': Utility.convert_date_time_to_epoch(epg_program.start),
+            'epg_program_stop': Utility.convert_date_time_to_epoch(epg_program.stop),
+        }
+        program_match_identity['program_match_key'] = Utility.calculate_hash_key(
+            *program_match_identity.values()
+        )
+
+        return program_match_identity
+
     @classmethod
     def _create_program_query_strings(cls, smooth_streams_program):
         smooth_streams_program_query_strings = []
@@ -370,85 +597,6 @@ class EPG(object):
 
         return smooth_streams_program_query_strings
 
-    @classmethod
-    def _delete_from_failed_program_match_table(cls):
-        sql_statement = (
-            'DELETE '
-            'FROM failed_program_match '
-            'WHERE date_time_of_last_failure < :date_time_of_last_failure_cutoff'
-        )
-        Database.execute(
-            sql_statement,
-            {'date_time_of_last_failure_cutoff': str(cls._startup_date_time_in_utc)},
-        )
-        Database.commit()
-
-    @classmethod
-    def _delete_from_forced_program_match_table(cls):
-        sql_statement = (
-            'DELETE '
-            'FROM forced_program_match '
-            'WHERE smooth_streams_program_stop < :smooth_streams_program_stop_cutoff'
-        )
-        Database.execute(
-            sql_statement,
-            {
-                'smooth_streams_program_stop_cutoff': str(
-                    cls._startup_date_time_in_utc - timedelta(days=1)
-                )
-            },
-        )
-        Database.commit()
-
-    @classmethod
-    def _delete_from_ignored_epg_program_match_table(cls):
-        sql_statement = (
-            'DELETE '
-            'FROM ignored_epg_program_match '
-            'WHERE epg_program_stop < :epg_program_stop_cutoff'
-            '  AND epg_program_stop <> \'\''
-        )
-        Database.execute(
-            sql_statement,
-            {
-                'epg_program_stop_cutoff': str(
-                    cls._startup_date_time_in_utc - timedelta(days=1)
-                )
-            },
-        )
-        Database.commit()
-
-    @classmethod
-    def _delete_from_ignored_smooth_streams_program_match_table(cls):
-        sql_statement = (
-            'DELETE '
-            'FROM ignored_smooth_streams_program_match '
-            'WHERE smooth_streams_program_stop < :smooth_streams_program_stop_cutoff'
-            '  AND smooth_streams_program_stop <> \'\''
-        )
-        Database.execute(
-            sql_statement,
-            {
-                'smooth_streams_program_stop_cutoff': str(
-                    cls._startup_date_time_in_utc - timedelta(days=1)
-                )
-            },
-        )
-        Database.commit()
-
-    @classmethod
-    def _delete_from_program_match_table(cls):
-        sql_statement = (
-            'DELETE '
-            'FROM program_match '
-            'WHERE date_time_of_last_match < :date_time_of_last_match_cutoff'
-        )
-        Database.execute(
-            sql_statement,
-            {'date_time_of_last_match_cutoff': str(cls._startup_date_time_in_utc)},
-        )
-        Database.commit()
-
     @classmethod
     def _determine_matching_program(
         cls,
@@ -506,11 +654,9 @@ class EPG(object):
                         not do_check_start_stop_times_alignment
                         and do_check_duration_equivalency
                     ):
-                        matching_epg_program = copy.deepcopy(
-                            potential_matching_epg_program
+                        matching_epg_program = potential_matching_epg_program.retime(
+                            smooth_streams_program.start, smooth_streams_program.stop
                         )
-                        matching_epg_program.start = smooth_streams_program.start
-                        matching_epg_program.stop = smooth_streams_program.stop
 
                     return matching_epg_program
 
@@ -653,10 +799,15 @@ class EPG(object):
         potential_match_tuples = []
 
         matched_program = cls._find_forced_matched_program(smooth_streams_program)
+        if matched_program is not None:
+            MergeStatistics.count_matching_outcome('Forced match')
 
         if matched_program is None:
             matched_program = cls._find_pattern_matched_program(smooth_streams_program)
 
+            if matched_program is not None:
+                MergeStatistics.count_matching_outcome('Pattern match')
+
         if matched_program is None:
             potential_match_tuples = cls._create_potential_match_tuples(
                 cls._create_program_query_strings(smooth_streams_program)
@@ -669,6 +820,10 @@ class EPG(object):
                 do_check_start_stop_times_alignment=True,
                 do_check_duration_equivalency=False,
             )
+
+            if matched_program is not None:
+                MergeStatistics.count_matching_outcome('Fuzzy match (same channel)')
+
         if matched_program is None:
             matched_program = cls._determine_matching_program(
                 smooth_streams_program,
@@ -678,6 +833,9 @@ class EPG(object):
                 do_check_duration_equivalency=False,
             )
 
+            if matched_program is not None:
+                MergeStatistics.count_matching_outcome('Fuzzy match (other channel)')
+
         if matched_program is None:
             matched_program = cls._determine_matching_program(
                 smooth_streams_program,
@@ -690,6 +848,10 @@ class EPG(object):
             if matched_program is not None:
                 did_apply_start_stop_time_changes = True
 
+                MergeStatistics.count_matching_outcome(
+                    'Duration equivalent match (same channel)'
+                )
+
         if matched_program is None:
             matched_program = cls._determine_matching_program(
                 smooth_streams_program,
@@ -702,6 +864,10 @@ class EPG(object):
             if matched_program is not None:
                 did_apply_start_stop_time_changes = True
 
+                MergeStatistics.count_matching_outcome(
+                    'Duration equivalent match (other channel)'
+                )
+
         if matched_program is not None:
             logger.debug(
                 'SmoothStreams program match processed%s\n'
@@ -728,7 +894,9 @@ class EPG(object):
                 matched_program.stop,
             )
 
-            return matched_program
+            return matched_program.retime(matched_program.start, matched_program.stop)
+
+        MergeStatistics.count_matching_outcome('Failed match')
 
         cls._insert_into_failed_program_match_table(smooth_streams_program)
 
@@ -763,6 +931,17 @@ class EPG(object):
             if not epg_program_sub_title:
                 epg_program_sub_title = None
 
+            cls._record_consulted_parsed_programs_map_keys(
+                [
+                    parsed_programs_map_key
+                    for parsed_programs_map_key in (
+                        epg_program_title,
+                        epg_program_sub_title,
+                    )
+                    if parsed_programs_map_key
+                ]
+            )
+
             potential_matching_program_key = None
             if epg_program_title in cls._parsed_programs_map:
                 potential_matching_program_key = epg_program_title
@@ -809,11 +988,10 @@ class EPG(object):
                             forced_matched_program = potential_matching_program
 
                         else:
-                            forced_matched_program = copy.deepcopy(
-                                potential_matching_program
+                            forced_matched_program = potential_matching_program.retime(
+                                smooth_streams_program.start,
+                                smooth_streams_program.stop,
                             )
-                            forced_matched_program.start = smooth_streams_program.start
-                            forced_matched_program.stop = smooth_streams_program.stop
 
                         logger.debug('Forced program match detected')
 
@@ -841,6 +1019,10 @@ class EPG(object):
                 )
             ]
 
+            cls._record_consulted_parsed_programs_map_keys(
+                pattern_matching_program_keys
+            )
+
             for pattern_matching_program_key in pattern_matching_program_keys:
                 for potential_matching_program in cls._parsed_programs_map[
                     pattern_matching_program_key
@@ -859,11 +1041,10 @@ class EPG(object):
                             pattern_matched_program = potential_matching_program
 
                         else:
-                            pattern_matched_program = copy.deepcopy(
-                                potential_matching_program
+                            pattern_matched_program = potential_matching_program.retime(
+                                smooth_streams_program.start,
+                                smooth_streams_program.stop,
                             )
-                            pattern_matched_program.start = smooth_streams_program.start
-                            pattern_matched_program.stop = smooth_streams_program.stop
 
                         logger.debug('Pattern program match detected')
 
@@ -872,445 +1053,215 @@ class EPG(object):
         return pattern_matched_program
 
     @classmethod
-    def _force_merge_smooth_streams_epg(cls):
-        for channel in cls._smooth_streams_epg.values():
-            logger.debug(
-                'Reconciling channel\nName   => %s\nNumber => %s',
-                channel.display_names[0]['value'],
-                channel.id,
-            )
+    def _force_merge_channel(cls, channel):
+        logger.debug(
+            'Reconciling channel\nName   => %s\nNumber => %s',
+            channel.display_names[0]['value'],
+            channel.id,
+        )
 
-            epg_programs = cls._epg[channel.id].programs
+        epg_programs_index = EPGProgramIntervalIndex(cls._epg[channel.id])
+        epg_programs_snapshot = EPGProgramIntervalSnapshot(
+            cls._epg[channel.id].programs
+        )
 
-            for smooth_streams_program in channel.programs:
-                is_smooth_streams_program_processed = False
+        for smooth_streams_program in channel.programs:
+            is_smooth_streams_program_processed = False
 
-                for epg_program in cls._epg[channel.id].programs:
-                    if smooth_streams_program.start < epg_program.start:
-                        if smooth_streams_program.stop <= epg_program.start:
-                            if not is_smooth_streams_program_processed:
-                                logger.debug(
-                                    'No overlap detected\n'
-                                    'Sports program\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                )
+            for epg_program in epg_programs_snapshot.find_programs_in_range(
+                smooth_streams_program.start, smooth_streams_program.stop
+            ):
+                if smooth_streams_program.start < epg_program.start:
+                    if smooth_streams_program.stop <= epg_program.start:
+                        if not is_smooth_streams_program_processed:
+                            MergeStatistics.count_overlap_case('No overlap detected')
 
-                                bisect.insort(epg_programs, smooth_streams_program)
-                                is_smooth_streams_program_processed = True
+                            logger.debug(
+                                'No overlap detected\n'
+                                'Sports program\n'
+                                '  Title     => %s\n'
+                                '  Start     => %s\n'
+                                '  Stop      => %s',
+                                smooth_streams_program.titles[0]['value'],
+                                smooth_streams_program.start,
+                                smooth_streams_program.stop,
+                            )
 
-                                logger.debug(
-                                    'No overlap processed\n'
-                                    'SmoothStreams program inserted\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                )
-                            else:
-                                logger.debug(
-                                    'Unexpected case #1 detected\n'
-                                    'Sports program\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
-                                )
-                            break
-                        elif smooth_streams_program.stop < epg_program.stop:
-                            if is_smooth_streams_program_processed:
-                                logger.debug(
-                                    'Overlap continuation detected\n'
-                                    '  Type      => Overflow\n'
-                                    '  Alignment => Start to before stop\n'
-                                    'Sports program\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
-                                )
+                            epg_programs_index.insert(smooth_streams_program)
+                            is_smooth_streams_program_processed = True
 
-                                epg_program.start = smooth_streams_program.stop
+                            logger.debug(
+                                'No overlap processed\n'
+                                'SmoothStreams program inserted\n'
+                                '  Title     => %s\n'
+                                '  Start     => %s\n'
+                                '  Stop      => %s',
+                                smooth_streams_program.titles[0]['value'],
+                                smooth_streams_program.start,
+                                smooth_streams_program.stop,
+                            )
+                        else:
+                            MergeStatistics.count_overlap_case(
+                                'Unexpected case #1 detected'
+                            )
 
-                                logger.debug(
-                                    'Overlap continuation processed\n'
-                                    '  Type      => Overflow\n'
-                                    '  Alignment => Start to before stop\n'
-                                    'Sports program\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program modified\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
+                            logger.debug(
+                                'Unexpected case #1 detected\n'
+                                'Sports program\n'
+                                '  Title     => %s\n'
+                                '  Start     => %s\n'
+                                '  Stop      => %s\n'
+                                'EPG program\n'
+                                '  Title     => %s\n'
+                                '%s'
+                                '  Start     => %s\n'
+                                '  Stop      => %s',
+                                smooth_streams_program.titles[0]['value'],
+                                smooth_streams_program.start,
+                                smooth_streams_program.stop,
+                                epg_program.titles[0]['value'],
+                                '  Sub-Title => {0}\n'.format(
+                                    epg_program.sub_titles[0]['value']
                                 )
+                                if epg_program.sub_titles
+                                else '',
+                                epg_program.start,
+                                epg_program.stop,
+                            )
+                        break
+                    elif smooth_streams_program.stop < epg_program.stop:
+                        if is_smooth_streams_program_processed:
+                            MergeStatistics.count_overlap_case(
+                                'Overlap continuation detected (Overflow, Start to before stop)'
+                            )
 
-                                break
-                            else:
-                                logger.debug(
-                                    'Overlap continuation detected\n'
-                                    '  Type      => Overflow\n'
-                                    '  Alignment => Start to before stop\n'
-                                    'Sports program\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
+                            logger.debug(
+                                'Overlap continuation detected\n'
+                                '  Type      => Overflow\n'
+                                '  Alignment => Start to before stop\n'
+                                'Sports program\n'
+                                '  Title     => %s\n'
+                                '  Start     => %s\n'
+                                '  Stop      => %s\n'
+                                'EPG program\n'
+                                '  Title     => %s\n'
+                                '%s'
+                                '  Start     => %s\n'
+                                '  Stop      => %s',
+                                smooth_streams_program.titles[0]['value'],
+                                smooth_streams_program.start,
+                                smooth_streams_program.stop,
+                                epg_program.titles[0]['value'],
+                                '  Sub-Title => {0}\n'.format(
+                                    epg_program.sub_titles[0]['value']
                                 )
+                                if epg_program.sub_titles
+                                else '',
+                                epg_program.start,
+                                epg_program.stop,
+                            )
 
-                                epg_program.start = smooth_streams_program.stop
-                                bisect.insort(epg_programs, smooth_streams_program)
-                                is_smooth_streams_program_processed = True
-
-                                logger.debug(
-                                    'Overlap continuation processed\n'
-                                    '  Type      => Overflow\n'
-                                    '  Alignment => Start to before stop\n'
-                                    'SmoothStreams program inserted\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program removed\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
-                                )
+                            epg_program.start = smooth_streams_program.stop
 
-                                break
-                        elif smooth_streams_program.stop == epg_program.stop:
-                            if is_smooth_streams_program_processed:
-                                logger.debug(
-                                    'Overlap continuation detected\n'
-                                    '  Type      => Overflow\n'
-                                    '  Alignment => Start to stop\n'
-                                    'Sports program\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
+                            logger.debug(
+                                'Overlap continuation processed\n'
+                                '  Type      => Overflow\n'
+                                '  Alignment => Start to before stop\n'
+                                'Sports program\n'
+                                '  Title     => %s\n'
+                                '  Start     => %s\n'
+                                '  Stop      => %s\n'
+                                'EPG program modified\n'
+                                '  Title     => %s\n'
+                                '%s'
+                                '  Start     => %s\n'
+                                '  Stop      => %s',
+                                smooth_streams_program.titles[0]['value'],
+                                smooth_streams_program.start,
+                                smooth_streams_program.stop,
+                                epg_program.titles[0]['value'],
+                                '  Sub-Title => {0}\n'.format(
+                                    epg_program.sub_titles[0]['value']
                                 )
+                                if epg_program.sub_titles
+                                else '',
+                                epg_program.start,
+                                epg_program.stop,
+                            )
 
-                                epg_programs.remove(epg_program)
+                            break
+                        else:
+                            MergeStatistics.count_overlap_case(
+                                'Overlap continuation detected (Overflow, Start to before stop)'
+                            )
 
-                                logger.debug(
-                                    'Overlap continuation processed\n'
-                                    '  Type      => Overflow\n'
-                                    '  Alignment => Start to stop\n'
-                                    'Sports program\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program removed\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
+                            logger.debug(
+                                'Overlap continuation detected\n'
+                                '  Type      => Overflow\n'
+                                '  Alignment => Start to before stop\n'
+                                'Sports program\n'
+                                '  Title     => %s\n'
+                                '  Start     => %s\n'
+                                '  Stop      => %s\n'
+                                'EPG program\n'
+                                '  Title     => %s\n'
+                                '%s'
+                                '  Start     => %s\n'
+                                '  Stop      => %s',
+                                smooth_streams_program.titles[0]['value'],
+                                smooth_streams_program.start,
+                                smooth_streams_program.stop,
+                                epg_program.titles[0]['value'],
+                                '  Sub-Title => {0}\n'.format(
+                                    epg_program.sub_titles[0]['value']
                                 )
+                                if epg_program.sub_titles
+                                else '',
+                                epg_program.start,
+                                epg_program.stop,
+                            )
 
-                                break
-                            else:
-                                logger.debug(
-                                    'Overlap continuation detected\n'
-                                    '  Type      => Overflow\n'
-                                    '  Alignment => Start to stop\n'
-                                    'Sports program\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
+                            epg_program.start = smooth_streams_program.stop
+                            epg_programs_index.insert(smooth_streams_program)
+                            is_smooth_streams_program_processed = True
+
+                            logger.debug(
+                                'Overlap continuation processed\n'
+                                '  Type      => Overflow\n'
+                                '  Alignment => Start to before stop\n'
+                                'SmoothStreams program inserted\n'
+                                '  Title     => %s\n'
+                                '  Start     => %s\n'
+                                '  Stop      => %s\n'
+                                'EPG program removed\n'
+                                '  Title     => %s\n'
+                                '%s'
+                                '  Start     => %s\n'
+                                '  Stop      => %s',
+                                smooth_streams_program.titles[0]['value'],
+                                smooth_streams_program.start,
+                                smooth_streams_program.stop,
+                                epg_program.titles[0]['value'],
+                                '  Sub-Title => {0}\n'.format(
+                                    epg_program.sub_titles[0]['value']
                                 )
+                                if epg_program.sub_titles
+                                else '',
+                                epg_program.start,
+                                epg_program.stop,
+                            )
 
-                                epg_programs.remove(epg_program)
-                                bisect.insort(epg_programs, smooth_streams_program)
-                                is_smooth_streams_program_processed = True
+                            break
+                    elif smooth_streams_program.stop == epg_program.stop:
+                        if is_smooth_streams_program_processed:
+                            MergeStatistics.count_overlap_case(
+                                'Overlap continuation detected (Overflow, Start to stop)'
+                            )
 
-                                logger.debug(
-                                    'Overlap continuation processed\n'
-                                    '  Type      => Overflow\n'
-                                    '  Alignment => Start to stop\n'
-                                    'SmoothStreams program inserted\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program removed\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
-                                )
-
-                                break
-                        elif smooth_streams_program.stop > epg_program.stop:
-                            if is_smooth_streams_program_processed:
-                                logger.debug(
-                                    'Overlap continuation detected\n'
-                                    '  Type      => Overflow\n'
-                                    '  Alignment => Start to stop\n'
-                                    'Sports program\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
-                                )
-
-                                epg_programs.remove(epg_program)
-
-                                logger.debug(
-                                    'Overlap continuation processed\n'
-                                    '  Type      => Overflow\n'
-                                    '  Alignment => Start to stop\n'
-                                    'Sports program\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program removed\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
-                                )
-                            else:
-                                logger.debug(
-                                    'Overlap continuation detected\n'
-                                    '  Type      => Overflow\n'
-                                    '  Alignment => Start to stop\n'
-                                    'Sports program\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
-                                )
-
-                                epg_programs.remove(epg_program)
-                                bisect.insort(epg_programs, smooth_streams_program)
-                                is_smooth_streams_program_processed = True
-
-                                logger.debug(
-                                    'Overlap continuation processed\n'
-                                    '  Type      => Overflow\n'
-                                    '  Alignment => Start to stop\n'
-                                    'SmoothStreams program inserted\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program removed\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
-                                )
-
-                                break
-                        else:
-                            logger.debug(
-                                'Unexpected case #2 detected\n'
-                                'Sports program\n'
-                                '  Title     => %s\n'
-                                '  Start     => %s\n'
-                                '  Stop      => %s\n'
-                                'EPG program\n'
-                                '  Title     => %s\n'
-                                '%s'
-                                '  Start     => %s\n'
-                                '  Stop      => %s',
-                                smooth_streams_program.titles[0]['value'],
-                                smooth_streams_program.start,
-                                smooth_streams_program.stop,
-                                epg_program.titles[0]['value'],
-                                '  Sub-Title => {0}\n'.format(
-                                    epg_program.sub_titles[0]['value']
-                                )
-                                if epg_program.sub_titles
-                                else '',
-                                epg_program.start,
-                                epg_program.stop,
-                            )
-                    elif smooth_streams_program.start == epg_program.start:
-                        if smooth_streams_program.stop < epg_program.stop:
                             logger.debug(
-                                'Overlap detected\n'
-                                '  Type      => Partial\n'
-                                '  Alignment => Start\n'
+                                'Overlap continuation detected\n'
+                                '  Type      => Overflow\n'
+                                '  Alignment => Start to stop\n'
                                 'Sports program\n'
                                 '  Title     => %s\n'
                                 '  Start     => %s\n'
@@ -1333,19 +1284,17 @@ class EPG(object):
                                 epg_program.stop,
                             )
 
-                            epg_program.start = smooth_streams_program.stop
-                            bisect.insort(epg_programs, smooth_streams_program)
-                            is_smooth_streams_program_processed = True
+                            epg_programs_index.remove(epg_program)
 
                             logger.debug(
-                                'Overlap processed\n'
-                                '  Type      => Partial\n'
-                                '  Alignment => Start\n'
-                                'SmoothStreams program inserted\n'
+                                'Overlap continuation processed\n'
+                                '  Type      => Overflow\n'
+                                '  Alignment => Start to stop\n'
+                                'Sports program\n'
                                 '  Title     => %s\n'
                                 '  Start     => %s\n'
                                 '  Stop      => %s\n'
-                                'EPG program modified\n'
+                                'EPG program removed\n'
                                 '  Title     => %s\n'
                                 '%s'
                                 '  Start     => %s\n'
@@ -1364,10 +1313,14 @@ class EPG(object):
                             )
 
                             break
-                        elif smooth_streams_program.stop == epg_program.stop:
+                        else:
+                            MergeStatistics.count_overlap_case(
+                                'Overlap continuation detected (Overflow, Start to stop)'
+                            )
+
                             logger.debug(
-                                'Overlap detected\n'
-                                '  Type      => Full\n'
+                                'Overlap continuation detected\n'
+                                '  Type      => Overflow\n'
                                 '  Alignment => Start to stop\n'
                                 'Sports program\n'
                                 '  Title     => %s\n'
@@ -1391,13 +1344,13 @@ class EPG(object):
                                 epg_program.stop,
                             )
 
-                            epg_programs.remove(epg_program)
-                            bisect.insort(epg_programs, smooth_streams_program)
+                            epg_programs_index.remove(epg_program)
+                            epg_programs_index.insert(smooth_streams_program)
                             is_smooth_streams_program_processed = True
 
                             logger.debug(
-                                'Overlap processed\n'
-                                '  Type      => Full\n'
+                                'Overlap continuation processed\n'
+                                '  Type      => Overflow\n'
                                 '  Alignment => Start to stop\n'
                                 'SmoothStreams program inserted\n'
                                 '  Title     => %s\n'
@@ -1422,11 +1375,16 @@ class EPG(object):
                             )
 
                             break
-                        elif smooth_streams_program.stop > epg_program.stop:
+                    elif smooth_streams_program.stop > epg_program.stop:
+                        if is_smooth_streams_program_processed:
+                            MergeStatistics.count_overlap_case(
+                                'Overlap continuation detected (Overflow, Start to stop)'
+                            )
+
                             logger.debug(
-                                'Overlap detected\n'
+                                'Overlap continuation detected\n'
                                 '  Type      => Overflow\n'
-                                '  Alignment => Start to after stop\n'
+                                '  Alignment => Start to stop\n'
                                 'Sports program\n'
                                 '  Title     => %s\n'
                                 '  Start     => %s\n'
@@ -1449,15 +1407,13 @@ class EPG(object):
                                 epg_program.stop,
                             )
 
-                            epg_programs.remove(epg_program)
-                            bisect.insort(epg_programs, smooth_streams_program)
-                            is_smooth_streams_program_processed = True
+                            epg_programs_index.remove(epg_program)
 
                             logger.debug(
-                                'Overlap processed\n'
+                                'Overlap continuation processed\n'
                                 '  Type      => Overflow\n'
-                                '  Alignment => Start to after stop\n'
-                                'SmoothStreams program inserted\n'
+                                '  Alignment => Start to stop\n'
+                                'Sports program\n'
                                 '  Title     => %s\n'
                                 '  Start     => %s\n'
                                 '  Stop      => %s\n'
@@ -1478,14 +1434,15 @@ class EPG(object):
                                 epg_program.start,
                                 epg_program.stop,
                             )
-                    elif smooth_streams_program.start > epg_program.start:
-                        if smooth_streams_program.start >= epg_program.stop:
-                            continue
-                        elif smooth_streams_program.stop < epg_program.stop:
+                        else:
+                            MergeStatistics.count_overlap_case(
+                                'Overlap continuation detected (Overflow, Start to stop)'
+                            )
+
                             logger.debug(
-                                'Overlap detected\n'
-                                '  Type      => Partial\n'
-                                '  Alignment => After start to before stop\n'
+                                'Overlap continuation detected\n'
+                                '  Type      => Overflow\n'
+                                '  Alignment => Start to stop\n'
                                 'Sports program\n'
                                 '  Title     => %s\n'
                                 '  Start     => %s\n'
@@ -1508,29 +1465,19 @@ class EPG(object):
                                 epg_program.stop,
                             )
 
-                            new_epg_program = copy.deepcopy(epg_program)
-
-                            epg_program.stop = smooth_streams_program.start
-                            bisect.insort(epg_programs, smooth_streams_program)
+                            epg_programs_index.remove(epg_program)
+                            epg_programs_index.insert(smooth_streams_program)
                             is_smooth_streams_program_processed = True
 
-                            new_epg_program.start = smooth_streams_program.stop
-                            bisect.insort(epg_programs, new_epg_program)
-
                             logger.debug(
-                                'Overlap processed\n'
-                                '  Type      => Partial\n'
-                                '  Alignment => After start to before stop\n'
+                                'Overlap continuation processed\n'
+                                '  Type      => Overflow\n'
+                                '  Alignment => Start to stop\n'
                                 'SmoothStreams program inserted\n'
                                 '  Title     => %s\n'
                                 '  Start     => %s\n'
                                 '  Stop      => %s\n'
-                                'EPG program modified\n'
-                                '  Title     => %s\n'
-                                '%s'
-                                '  Start     => %s\n'
-                                '  Stop      => %s\n'
-                                'EPG program inserted\n'
+                                'EPG program removed\n'
                                 '  Title     => %s\n'
                                 '%s'
                                 '  Start     => %s\n'
@@ -1546,806 +1493,533 @@ class EPG(object):
                                 else '',
                                 epg_program.start,
                                 epg_program.stop,
-                                new_epg_program.titles[0]['value'],
-                                '  Sub-Title => {0}\n'.format(
-                                    new_epg_program.sub_titles[0]['value']
-                                )
-                                if new_epg_program.sub_titles
-                                else '',
-                                new_epg_program.start,
-                                new_epg_program.stop,
                             )
 
                             break
-                        elif smooth_streams_program.stop == epg_program.stop:
-                            logger.debug(
-                                'Overlap detected\n'
-                                '  Type      => Partial\n'
-                                '  Alignment => After start to stop\n'
-                                'Sports program\n'
-                                '  Title     => %s\n'
-                                '  Start     => %s\n'
-                                '  Stop      => %s\n'
-                                'EPG program\n'
-                                '  Title     => %s\n'
-                                '%s'
-                                '  Start     => %s\n'
-                                '  Stop      => %s',
-                                smooth_streams_program.titles[0]['value'],
-                                smooth_streams_program.start,
-                                smooth_streams_program.stop,
-                                epg_program.titles[0]['value'],
-                                '  Sub-Title => {0}\n'.format(
-                                    epg_program.sub_titles[0]['value']
-                                )
-                                if epg_program.sub_titles
-                                else '',
-                                epg_program.start,
-                                epg_program.stop,
+                    else:
+                        MergeStatistics.count_overlap_case(
+                            'Unexpected case #2 detected'
+                        )
+
+                        logger.debug(
+                            'Unexpected case #2 detected\n'
+                            'Sports program\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                            epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                epg_program.sub_titles[0]['value']
                             )
+                            if epg_program.sub_titles
+                            else '',
+                            epg_program.start,
+                            epg_program.stop,
+                        )
+                elif smooth_streams_program.start == epg_program.start:
+                    if smooth_streams_program.stop < epg_program.stop:
+                        MergeStatistics.count_overlap_case(
+                            'Overlap detected (Partial, Start)'
+                        )
 
-                            epg_program.stop = smooth_streams_program.start
-                            bisect.insort(epg_programs, smooth_streams_program)
-                            is_smooth_streams_program_processed = True
+                        logger.debug(
+                            'Overlap detected\n'
+                            '  Type      => Partial\n'
+                            '  Alignment => Start\n'
+                            'Sports program\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                            epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                epg_program.sub_titles[0]['value']
+                            )
+                            if epg_program.sub_titles
+                            else '',
+                            epg_program.start,
+                            epg_program.stop,
+                        )
 
-                            logger.debug(
-                                'Overlap processed\n'
-                                '  Type      => Partial\n'
-                                '  Alignment => After start to stop\n'
-                                'SmoothStreams program inserted\n'
-                                '  Title     => %s\n'
-                                '  Start     => %s\n'
-                                '  Stop      => %s\n'
-                                'EPG program modified\n'
-                                '  Title     => %s\n'
-                                '%s'
-                                '  Start     => %s\n'
-                                '  Stop      => %s',
-                                smooth_streams_program.titles[0]['value'],
-                                smooth_streams_program.start,
-                                smooth_streams_program.stop,
-                                epg_program.titles[0]['value'],
-                                '  Sub-Title => {0}\n'.format(
-                                    epg_program.sub_titles[0]['value']
-                                )
-                                if epg_program.sub_titles
-                                else '',
-                                epg_program.start,
-                                epg_program.stop,
-                            )
-
-                            break
-                        elif smooth_streams_program.stop > epg_program.stop:
-                            logger.debug(
-                                'Overlap detected\n'
-                                '  Type      => Overflow\n'
-                                '  Alignment => After start to after stop\n'
-                                'Sports program\n'
-                                '  Title     => %s\n'
-                                '  Start     => %s\n'
-                                '  Stop      => %s\n'
-                                'EPG program\n'
-                                '  Title     => %s\n'
-                                '%s'
-                                '  Start     => %s\n'
-                                '  Stop      => %s',
-                                smooth_streams_program.titles[0]['value'],
-                                smooth_streams_program.start,
-                                smooth_streams_program.stop,
-                                epg_program.titles[0]['value'],
-                                '  Sub-Title => {0}\n'.format(
-                                    epg_program.sub_titles[0]['value']
-                                )
-                                if epg_program.sub_titles
-                                else '',
-                                epg_program.start,
-                                epg_program.stop,
+                        epg_program.start = smooth_streams_program.stop
+                        epg_programs_index.insert(smooth_streams_program)
+                        is_smooth_streams_program_processed = True
+
+                        logger.debug(
+                            'Overlap processed\n'
+                            '  Type      => Partial\n'
+                            '  Alignment => Start\n'
+                            'SmoothStreams program inserted\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program modified\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                            epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                epg_program.sub_titles[0]['value']
                             )
+                            if epg_program.sub_titles
+                            else '',
+                            epg_program.start,
+                            epg_program.stop,
+                        )
 
-                            epg_program.stop = smooth_streams_program.start
-                            bisect.insort(epg_programs, smooth_streams_program)
-                            is_smooth_streams_program_processed = True
+                        break
+                    elif smooth_streams_program.stop == epg_program.stop:
+                        MergeStatistics.count_overlap_case(
+                            'Overlap detected (Full, Start to stop)'
+                        )
 
-                            logger.debug(
-                                'Overlap processed\n'
-                                '  Type      => Overflow\n'
-                                '  Alignment => After start to after stop\n'
-                                'SmoothStreams program iserted\n'
-                                '  Title     => %s\n'
-                                '  Start     => %s\n'
-                                '  Stop      => %s\n'
-                                'EPG program modified\n'
-                                '  Title     => %s\n'
-                                '%s'
-                                '  Start     => %s\n'
-                                '  Stop      => %s',
-                                smooth_streams_program.titles[0]['value'],
-                                smooth_streams_program.start,
-                                smooth_streams_program.stop,
-                                epg_program.titles[0]['value'],
-                                '  Sub-Title => {0}\n'.format(
-                                    epg_program.sub_titles[0]['value']
-                                )
-                                if epg_program.sub_titles
-                                else '',
-                                epg_program.start,
-                                epg_program.stop,
-                            )
-                        else:
-                            logger.debug(
-                                'Unexpected case #3 detected\n'
-                                'Sports program\n'
-                                '  Title     => %s\n'
-                                '  Start     => %s\n'
-                                '  Stop      => %s\n'
-                                'EPG program\n'
-                                '  Title     => %s\n'
-                                '%s'
-                                '  Start     => %s\n'
-                                '  Stop      => %s',
-                                smooth_streams_program.titles[0]['value'],
-                                smooth_streams_program.start,
-                                smooth_streams_program.stop,
-                                epg_program.titles[0]['value'],
-                                '  Sub-Title => {0}\n'.format(
-                                    epg_program.sub_titles[0]['value']
-                                )
-                                if epg_program.sub_titles
-                                else '',
-                                epg_program.start,
-                                epg_program.stop,
+                        logger.debug(
+                            'Overlap detected\n'
+                            '  Type      => Full\n'
+                            '  Alignment => Start to stop\n'
+                            'Sports program\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                            epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                epg_program.sub_titles[0]['value']
                             )
+                            if epg_program.sub_titles
+                            else '',
+                            epg_program.start,
+                            epg_program.stop,
+                        )
 
-                if not is_smooth_streams_program_processed:
-                    bisect.insort(epg_programs, smooth_streams_program)
-
-                    logger.debug(
-                        'No overlap detected\n'
-                        'SmoothStreams program inserted\n'
-                        '  Title     => %s\n'
-                        '  Start     => %s\n'
-                        '  Stop      => %s',
-                        smooth_streams_program.titles[0]['value'],
-                        smooth_streams_program.start,
-                        smooth_streams_program.stop,
-                    )
-
-            cls._epg[channel.id].programs = epg_programs
-
-    @classmethod
-    def _generate_epg(
-        cls,
-        output_directory_path,
-        is_forced,
-        number_of_days,
-        do_concatenate_sub_title_to_title=False,
-        do_generate_all_elements=True,
-    ):
-        cutoff_date_time_in_utc = cls._startup_date_time_in_utc.replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ) + timedelta(days=number_of_days + 1)
-
-        channels_output = []
-        programs_output = []
-
-        for channel in cls._epg.values():
-            channels_output.append('\t<channel id="{0}">\n'.format(channel.id))
-
-            for display_name in channel.display_names:
-                channels_output.append(
-                    '\t\t<display-name{0}>{1}</display-name>\n'.format(
-                        ' lang="{0}"'.format(saxutils.escape(display_name['language']))
-                        if display_name['language'] is not None
-                        else '',
-                        saxutils.escape(display_name['value']),
-                    )
-                )
-
-            channels_output.append(
-                '\t\t<display-name>{0}</display-name>\n'.format(channel.id)
-            )
-
-            for icon in channel.icons:
-                channels_output.append(
-                    '\t\t<icon {0}src="{1}"{2} />\n'.format(
-                        'height="{0}" '.format(saxutils.escape(icon['height']))
-                        if icon['height'] is not None
-                        else '',
-                        saxutils.escape(icon['source']),
-                        ' width="{0}"'.format(saxutils.escape(icon['width']))
-                        if icon['width'] is not None
-                        else '',
-                    )
-                )
-
-            for url in channel.urls:
-                channels_output.append(
-                    '\t\t<url>{0}</url>\n'.format(saxutils.escape(url['value']))
-                )
+                        epg_programs_index.remove(epg_program)
+                        epg_programs_index.insert(smooth_streams_program)
+                        is_smooth_streams_program_processed = True
+
+                        logger.debug(
+                            'Overlap processed\n'
+                            '  Type      => Full\n'
+                            '  Alignment => Start to stop\n'
+                            'SmoothStreams program inserted\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program removed\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                            epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                epg_program.sub_titles[0]['value']
+                            )
+                            if epg_program.sub_titles
+                            else '',
+                            epg_program.start,
+                            epg_program.stop,
+                        )
 
-            channels_output.append('\t</channel>\n')
+                        break
+                    elif smooth_streams_program.stop > epg_program.stop:
+                        MergeStatistics.count_overlap_case(
+                            'Overlap detected (Overflow, Start to after stop)'
+                        )
 
-            for program in channel.programs:
-                if (
-                    cutoff_date_time_in_utc > program.start
-                    and cls._startup_date_time_in_utc < program.stop
-                ):
-                    programs_output.append(
-                        '\t<programme start="{0}"{1}{2}{3}{4}{5} channel="{6}"{7}>\n'.format(
-                            saxutils.escape(
-                                program.start.astimezone(pytz.utc).strftime(
-                                    '%Y%m%d%H%M%S %z'
-                                )
-                            ),
-                            ' stop="{0}"'.format(
-                                saxutils.escape(
-                                    program.stop.astimezone(pytz.utc).strftime(
-                                        '%Y%m%d%H%M%S %z'
-                                    )
-                                )
+                        logger.debug(
+                            'Overlap detected\n'
+                            '  Type      => Overflow\n'
+                            '  Alignment => Start to after stop\n'
+                            'Sports program\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                            epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                epg_program.sub_titles[0]['value']
                             )
-                            if program.stop is not None
+                            if epg_program.sub_titles
                             else '',
-                            ' pdc-start="{0}"'.format(
-                                saxutils.escape(program.pdc_start)
+                            epg_program.start,
+                            epg_program.stop,
+                        )
+
+                        epg_programs_index.remove(epg_program)
+                        epg_programs_index.insert(smooth_streams_program)
+                        is_smooth_streams_program_processed = True
+
+                        logger.debug(
+                            'Overlap processed\n'
+                            '  Type      => Overflow\n'
+                            '  Alignment => Start to after stop\n'
+                            'SmoothStreams program inserted\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program removed\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                            epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                epg_program.sub_titles[0]['value']
                             )
-                            if program.pdc_start is not None
+                            if epg_program.sub_titles
                             else '',
-                            ' vps-start="{0}"'.format(
-                                saxutils.escape(program.vps_start)
+                            epg_program.start,
+                            epg_program.stop,
+                        )
+                elif smooth_streams_program.start > epg_program.start:
+                    if smooth_streams_program.start >= epg_program.stop:
+                        continue
+                    elif smooth_streams_program.stop < epg_program.stop:
+                        MergeStatistics.count_overlap_case(
+                            'Overlap detected (Partial, After start to before stop)'
+                        )
+
+                        logger.debug(
+                            'Overlap detected\n'
+                            '  Type      => Partial\n'
+                            '  Alignment => After start to before stop\n'
+                            'Sports program\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                            epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                epg_program.sub_titles[0]['value']
                             )
-                            if program.vps_start is not None
+                            if epg_program.sub_titles
                             else '',
-                            ' showview="{0}"'.format(saxutils.escape(program.showview))
-                            if program.showview is not None
-                            else '',
-                            ' videoplus="{0}"'.format(
-                                saxutils.escape(program.videoplus)
+                            epg_program.start,
+                            epg_program.stop,
+                        )
+
+                        new_epg_program = epg_programs_index.split(
+                            epg_program,
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                        )
+                        epg_programs_index.insert(smooth_streams_program)
+                        is_smooth_streams_program_processed = True
+
+                        logger.debug(
+                            'Overlap processed\n'
+                            '  Type      => Partial\n'
+                            '  Alignment => After start to before stop\n'
+                            'SmoothStreams program inserted\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program modified\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program inserted\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                            epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                epg_program.sub_titles[0]['value']
                             )
-                            if program.videoplus is not None
+                            if epg_program.sub_titles
                             else '',
-                            channel.id,
-                            ' clumpidx="{0}"'.format(saxutils.escape(program.clumpidx))
-                            if program.clumpidx is not None
+                            epg_program.start,
+                            epg_program.stop,
+                            new_epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                new_epg_program.sub_titles[0]['value']
+                            )
+                            if new_epg_program.sub_titles
                             else '',
+                            new_epg_program.start,
+                            new_epg_program.stop,
                         )
-                    )
-
-                    if not do_concatenate_sub_title_to_title:
-                        for title in program.titles:
-                            programs_output.append(
-                                '\t\t<title{0}>{1}</title>\n'.format(
-                                    ' lang="{0}"'.format(
-                                        saxutils.escape(title['language'])
-                                    )
-                                    if title['language'] is not None
-                                    else '',
-                                    saxutils.escape(
-                                        re.sub(r'Live: ', '', title['value'])
-                                    ),
-                                )
-                            )
 
-                        for sub_title in program.sub_titles:
-                            programs_output.append(
-                                '\t\t<sub-title{0}>{1}</sub-title>\n'.format(
-                                    ' lang="{0}"'.format(
-                                        saxutils.escape(sub_title['language'])
-                                    )
-                                    if sub_title['language'] is not None
-                                    else '',
-                                    saxutils.escape(sub_title['value']),
-                                )
-                            )
-                    else:
-                        if program.has_sub_titles():
-                            title = program.titles[0]
-                            sub_title = program.sub_titles[0]
-
-                            programs_output.append(
-                                '\t\t<title{0}>{1}: {2}</title>\n'.format(
-                                    ' lang="{0}"'.format(
-                                        saxutils.escape(title['language'])
-                                    )
-                                    if title['language'] is not None
-                                    else '',
-                                    saxutils.escape(
-                                        re.sub(r'Live: ', '', title['value'])
-                                    ),
-                                    saxutils.escape(sub_title['value']),
-                                )
-                            )
-                        else:
-                            title = program.titles[0]
+                        break
+                    elif smooth_streams_program.stop == epg_program.stop:
+                        MergeStatistics.count_overlap_case(
+                            'Overlap detected (Partial, After start to stop)'
+                        )
 
-                            programs_output.append(
-                                '\t\t<title{0}>{1}</title>\n'.format(
-                                    ' lang="{0}"'.format(title['language'])
-                                    if title['language'] is not None
-                                    else '',
-                                    saxutils.escape(
-                                        re.sub(r'Live: ', '', title['value'])
-                                    ),
-                                )
+                        logger.debug(
+                            'Overlap detected\n'
+                            '  Type      => Partial\n'
+                            '  Alignment => After start to stop\n'
+                            'Sports program\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                            epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                epg_program.sub_titles[0]['value']
                             )
+                            if epg_program.sub_titles
+                            else '',
+                            epg_program.start,
+                            epg_program.stop,
+                        )
 
-                    for description in program.descriptions:
-                        programs_output.append(
-                            '\t\t<desc{0}>{1}</desc>\n'.format(
-                                ' lang="{0}"'.format(description['language'])
-                                if description['language'] is not None
-                                else '',
-                                saxutils.escape(description['value']),
+                        epg_programs_index.trim_stop(
+                            epg_program, smooth_streams_program.start
+                        )
+                        epg_programs_index.insert(smooth_streams_program)
+                        is_smooth_streams_program_processed = True
+
+                        logger.debug(
+                            'Overlap processed\n'
+                            '  Type      => Partial\n'
+                            '  Alignment => After start to stop\n'
+                            'SmoothStreams program inserted\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program modified\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                            epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                epg_program.sub_titles[0]['value']
                             )
+                            if epg_program.sub_titles
+                            else '',
+                            epg_program.start,
+                            epg_program.stop,
                         )
 
-                    if do_generate_all_elements:
-                        if program.has_credits():
-                            programs_output.append('\t\t<credits>\n')
-
-                            credits_ = program.credits
-                            for director in credits_['directors']:
-                                programs_output.append(
-                                    '\t\t\t<director>{0}</director>\n'.format(
-                                        saxutils.escape(director['value'])
-                                    )
-                                )
-                            for actor in credits_['actors']:
-                                programs_output.append(
-                                    '\t\t\t<actor{0}>{1}</actor>\n'.format(
-                                        ' role="{0}"'.format(
-                                            saxutils.escape(actor['role'])
-                                        )
-                                        if actor['role'] is not None
-                                        else '',
-                                        saxutils.escape(actor['value']),
-                                    )
-                                )
-                            for writer in credits_['writers']:
-                                programs_output.append(
-                                    '\t\t\t<writer>{0}</writer>\n'.format(
-                                        saxutils.escape(writer['value'])
-                                    )
-                                )
-                            for adapter in credits_['adapters']:
-                                programs_output.append(
-                                    '\t\t\t<adapter>{0}</adapter>\n'.format(
-                                        saxutils.escape(adapter['value'])
-                                    )
-                                )
-                            for producer in credits_['producers']:
-                                programs_output.append(
-                                    '\t\t\t<producer>{0}</producer>\n'.format(
-                                        saxutils.escape(producer['value'])
-                                    )
-                                )
-                            for composer in credits_['composers']:
-                                programs_output.append(
-                                    '\t\t\t<composer>{0}</composer>\n'.format(
-                                        saxutils.escape(composer['value'])
-                                    )
-                                )
-                            for editor in credits_['editors']:
-                                programs_output.append(
-                                    '\t\t\t<editor>{0}</editor>\n'.format(
-                                        saxutils.escape(editor['value'])
-                                    )
-                                )
-                            for presenter in credits_['presenters']:
-                                programs_output.append(
-                                    '\t\t\t<presenter>{0}</presenter>\n'.format(
-                                        saxutils.escape(presenter['value'])
-                                    )
-                                )
-                            for commentator in credits_['commentators']:
-                                programs_output.append(
-                                    '\t\t\t<commentator>{0}</commentator>\n'.format(
-                                        saxutils.escape(commentator['value'])
-                                    )
-                                )
-                            for guest in credits_['guests']:
-                                programs_output.append(
-                                    '\t\t\t<guest>{0}</guest>\n'.format(
-                                        saxutils.escape(guest['value'])
-                                    )
-                                )
-
-                            programs_output.append('\t\t</credits>\n')
+                        break
+                    elif smooth_streams_program.stop > epg_program.stop:
+                        MergeStatistics.count_overlap_case(
+                            'Overlap detected (Overflow, After start to after stop)'
+                        )
 
-                        if program.date is not None:
-                            programs_output.append(
-                                '\t\t<date>{0}</date>\n'.format(
-                                    saxutils.escape(program.date['value'])
-                                )
+                        logger.debug(
+                            'Overlap detected\n'
+                            '  Type      => Overflow\n'
+                            '  Alignment => After start to after stop\n'
+                            'Sports program\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                            epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                epg_program.sub_titles[0]['value']
                             )
+                            if epg_program.sub_titles
+                            else '',
+                            epg_program.start,
+                            epg_program.stop,
+                        )
 
-                    for category in program.categories:
-                        programs_output.append(
-                            '\t\t<category{0}>{1}</category>\n'.format(
-                                ' lang="{0}"'.format(
-                                    saxutils.escape(category['language'])
-                                )
-                                if category['language'] is not None
-                                else '',
-                                saxutils.escape(category['value']),
+                        epg_programs_index.trim_stop(
+                            epg_program, smooth_streams_program.start
+                        )
+                        epg_programs_index.insert(smooth_streams_program)
+                        is_smooth_streams_program_processed = True
+
+                        logger.debug(
+                            'Overlap processed\n'
+                            '  Type      => Overflow\n'
+                            '  Alignment => After start to after stop\n'
+                            'SmoothStreams program iserted\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program modified\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                            epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                epg_program.sub_titles[0]['value']
                             )
+                            if epg_program.sub_titles
+                            else '',
+                            epg_program.start,
+                            epg_program.stop,
+                        )
+                    else:
+                        MergeStatistics.count_overlap_case(
+                            'Unexpected case #3 detected'
                         )
 
-                    if do_generate_all_elements:
-                        for keyword in program.keywords:
-                            programs_output.append(
-                                '\t\t<keyword{0}>{1}</keyword>\n'.format(
-                                    ' lang="{0}"'.format(
-                                        saxutils.escape(keyword['language'])
-                                    )
-                                    if keyword['language'] is not None
-                                    else '',
-                                    saxutils.escape(keyword['value']),
-                                )
+                        logger.debug(
+                            'Unexpected case #3 detected\n'
+                            'Sports program\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s\n'
+                            'EPG program\n'
+                            '  Title     => %s\n'
+                            '%s'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                            epg_program.titles[0]['value'],
+                            '  Sub-Title => {0}\n'.format(
+                                epg_program.sub_titles[0]['value']
                             )
+                            if epg_program.sub_titles
+                            else '',
+                            epg_program.start,
+                            epg_program.stop,
+                        )
 
-                        if program.language is not None:
-                            programs_output.append(
-                                '\t\t<language{0}>{1}</language>\n'.format(
-                                    ' lang="{0}"'.format(
-                                        saxutils.escape(program.language['language'])
-                                    )
-                                    if program.language['language'] is not None
-                                    else '',
-                                    saxutils.escape(program.language['value']),
-                                )
-                            )
+            if not is_smooth_streams_program_processed:
+                epg_programs_index.insert(smooth_streams_program)
 
-                        if program.original_language is not None:
-                            programs_output.append(
-                                '\t\t<orig-language{0}>{1}</orig-language>\n'.format(
-                                    ' lang="{0}"'.format(
-                                        saxutils.escape(
-                                            program.original_language['language']
-                                        )
-                                    )
-                                    if program.original_language['language'] is not None
-                                    else '',
-                                    saxutils.escape(program.original_language['value']),
-                                )
-                            )
+                MergeStatistics.count_overlap_case('No overlap detected')
 
-                        if program.length is not None:
-                            programs_output.append(
-                                '\t\t<length units="{0}">{1}</length>\n'.format(
-                                    saxutils.escape(program.length['units']),
-                                    saxutils.escape(program.length['value']),
-                                )
-                            )
+                logger.debug(
+                    'No overlap detected\n'
+                    'SmoothStreams program inserted\n'
+                    '  Title     => %s\n'
+                    '  Start     => %s\n'
+                    '  Stop      => %s',
+                    smooth_streams_program.titles[0]['value'],
+                    smooth_streams_program.start,
+                    smooth_streams_program.stop,
+                )
 
-                        for icon in program.icons:
-                            programs_output.append(
-                                '\t\t<icon {0}src="{1}"{2} />\n'.format(
-                                    'height="{0}" '.format(
-                                        saxutils.escape(icon['height'])
-                                    )
-                                    if icon['height'] is not None
-                                    else '',
-                                    icon['source'],
-                                    ' width="{0}"'.format(
-                                        saxutils.escape(icon['width'])
-                                    )
-                                    if icon['width'] is not None
-                                    else '',
-                                )
-                            )
+    @classmethod
+    def _force_merge_smooth_streams_epg(cls):
+        cls._merge_smooth_streams_epg(cls._force_merge_channel, 'force_merge')
 
-                        for url in program.urls:
-                            programs_output.append(
-                                '\t\t<url>{0}</url>\n'.format(
-                                    saxutils.escape(url['value'])
-                                )
-                            )
+    @classmethod
+    def _generate_epgs(cls, output_directory_path, is_forced):
+        is_parallel = (
+            Configuration.get_configuration_parameter('OUTPUT_PARALLEL')
+            and 'fork' in multiprocessing.get_all_start_methods()
+        )
 
-                        for country in program.countries:
-                            programs_output.append(
-                                '\t\t<country{0}>{1}</country>\n'.format(
-                                    ' lang="{0}"'.format(
-                                        saxutils.escape(country['language'])
-                                    )
-                                    if country['language'] is not None
-                                    else '',
-                                    saxutils.escape(country['value']),
-                                )
-                            )
+        if not is_parallel:
+            cls._compress_epgs(
+                cls._write_epgs(output_directory_path, is_forced, (True, False))
+            )
 
-                        for episode_number in program.episode_numbers:
-                            programs_output.append(
-                                '\t\t<episode-num{0}>{1}</episode-num>\n'.format(
-                                    ' system="{0}"'.format(
-                                        saxutils.escape(episode_number['system'])
-                                    )
-                                    if episode_number['system'] is not None
-                                    else '',
-                                    saxutils.escape(episode_number['value']),
-                                )
-                            )
+            return
 
-                        if program.has_video():
-                            programs_output.append('\t\t<video>\n')
+        logger.debug('Generating EPGs in parallel\nForced => %s', is_forced)
 
-                            video = program.video
-                            if video['present'] is not None:
-                                programs_output.append(
-                                    '\t\t\t<present>{0}</present>\n'.format(
-                                        saxutils.escape(video['present']['value'])
-                                    )
-                                )
-                            if video['colour'] is not None:
-                                programs_output.append(
-                                    '\t\t\t<colour>{0}</colour>\n'.format(
-                                        saxutils.escape(video['colour']['value'])
-                                    )
-                                )
-                            if video['aspect'] is not None:
-                                programs_output.append(
-                                    '\t\t\t<aspect>{0}</aspect>\n'.format(
-                                        saxutils.escape(video['aspect']['value'])
-                                    )
-                                )
-                            if video['quality'] is not None:
-                                programs_output.append(
-                                    '\t\t\t<quality>{0}</quality>\n'.format(
-                                        saxutils.escape(video['quality']['value'])
-                                    )
-                                )
-
-                            programs_output.append('\t\t</video>\n')
-
-                        if program.has_audio():
-                            programs_output.append('\t\t<audio>\n')
-
-                            audio = program.audio
-                            if audio['present'] is not None:
-                                programs_output.append(
-                                    '\t\t\t<present>{0}</present>\n'.format(
-                                        saxutils.escape(audio['present']['value'])
-                                    )
-                                )
-                            if audio['stereo'] is not None:
-                                programs_output.append(
-                                    '\t\t\t<stereo>{0}</stereo>\n'.format(
-                                        saxutils.escape(audio['stereo']['value'])
-                                    )
-                                )
-
-                            programs_output.append('\t\t</audio>\n')
-
-                        if program.previously_shown is not None:
-                            programs_output.append(
-                                '\t\t<previously-shown{0}{1} />\n'.format(
-                                    ' start="{0}"'.format(
-                                        saxutils.escape(
-                                            program.previously_shown['start']
-                                        )
-                                    )
-                                    if program.previously_shown['start'] is not None
-                                    else '',
-                                    ' channel="{0}"'.format(
-                                        saxutils.escape(
-                                            program.previously_shown['channel']
-                                        )
-                                    )
-                                    if program.previously_shown['channel'] is not None
-                                    else '',
-                                )
-                            )
-
-                        if program.premiere is not None:
-                            programs_output.append(
-                                '\t\t<premiere{0}{1}\n'.format(
-                                    ' lang="{0}"'.format(
-                                        saxutils.escape(program.premiere['language'])
-                                    )
-                                    if program.premiere['language'] is not None
-                                    else '',
-                                    ' />'
-                                    if program.premiere['value'] is None
-                                    else '>{0}</premiere>'.format(
-                                        saxutils.escape(program.premiere['value'])
-                                    ),
-                                )
-                            )
-
-                        if program.last_chance is not None:
-                            programs_output.append(
-                                '\t\t<last-chance{0}{1}\n'.format(
-                                    ' lang="{0}"'.format(
-                                        saxutils.escape(program.last_chance['language'])
-                                    )
-                                    if program.last_chance['language'] is not None
-                                    else '',
-                                    ' />'
-                                    if program.last_chance['value'] is None
-                                    else '>{0}</last-chance>'.format(
-                                        saxutils.escape(program.last_chance['value'])
-                                    ),
-                                )
-                            )
-
-                        if program.new:
-                            programs_output.append('\t\t<new />\n')
-
-                        for subtitles in program.subtitles:
-                            programs_output.append(
-                                '\t\t<subtitles{0}{1}>\n'.format(
-                                    ' type="{0}"'.format(
-                                        saxutils.escape(subtitles['type'])
-                                    )
-                                    if subtitles['type'] is not None
-                                    else '',
-                                    ' /' if 'language' not in subtitles else '',
-                                )
-                            )
-
-                            if 'language' in subtitles:
-                                programs_output.append(
-                                    '\t\t\t<language{0}>{1}</language>\n'.format(
-                                        ' lang="{0}"'.format(
-                                            saxutils.escape(
-                                                subtitles['language']['language']
-                                            )
-                                        )
-                                        if subtitles['language']['language'] is not None
-                                        else '',
-                                        saxutils.escape(subtitles['language']['value']),
-                                    )
-                                )
-
-                                programs_output.append('\t\t</subtitles>\n')
-
-                        for rating in program.ratings:
-                            programs_output.append(
-                                '\t\t<rating{0}>\n'.format(
-                                    ' system="{0}"'.format(
-                                        saxutils.escape(rating['system'])
-                                    )
-                                    if rating['system'] is not None
-                                    else ''
-                                )
-                            )
-
-                            for icon in rating['icons']:
-                                programs_output.append(
-                                    '\t\t\t<icon {0}src="{1}"{2} />\n'.format(
-                                        'height="{0}" '.format(
-                                            saxutils.escape(icon['height'])
-                                        )
-                                        if icon['height'] is not None
-                                        else '',
-                                        saxutils.escape(icon['source']),
-                                        ' width="{0}"'.format(
-                                            saxutils.escape(icon['width'])
-                                        )
-                                        if icon['width'] is not None
-                                        else '',
-                                    )
-                                )
-
-                            if 'value' in rating:
-                                programs_output.append(
-                                    '\t\t\t<value>{0}</value>\n'.format(
-                                        saxutils.escape(rating['value']['value'])
-                                    )
-                                )
-
-                            programs_output.append('\t\t</rating>\n')
-
-                        for star_rating in program.star_ratings:
-                            programs_output.append(
-                                '\t\t<star-rating{0}>\n'.format(
-                                    ' system="{0}"'.format(
-                                        saxutils.escape(star_rating['system'])
-                                    )
-                                    if star_rating['system'] is not None
-                                    else ''
-                                )
-                            )
-
-                            for icon in star_rating['icons']:
-                                programs_output.append(
-                                    '\t\t\t<icon {0}src="{1}"{2} />\n'.format(
-                                        'height="{0}" '.format(
-                                            saxutils.escape(icon['height'])
-                                        )
-                                        if icon['height'] is not None
-                                        else '',
-                                        saxutils.escape(icon['source']),
-                                        ' width="{0}"'.format(
-                                            saxutils.escape(icon['width'])
-                                        )
-                                        if icon['width'] is not None
-                                        else '',
-                                    )
-                                )
-
-                            if 'value' in star_rating:
-                                programs_output.append(
-                                    '\t\t\t<value>{0}</value>\n'.format(
-                                        saxutils.escape(star_rating['value']['value'])
-                                    )
-                                )
-
-                            programs_output.append('\t\t</star-rating>\n')
-
-                        for review in program.reviews:
-                            programs_output.append(
-                                '\t\t<review type="{0}"{1}{2}{3}>{4}</review>\n'.format(
-                                    saxutils.escape(review['type']),
-                                    ' source="{0}"'.format(
-                                        saxutils.escape(review['source'])
-                                    )
-                                    if review['source'] is not None
-                                    else '',
-                                    ' reviewer="{0}"'.format(
-                                        saxutils.escape(review['reviewer'])
-                                    )
-                                    if review['reviewer'] is not None
-                                    else '',
-                                    ' lang="{0}"'.format(
-                                        saxutils.escape(review['language'])
-                                    )
-                                    if review['language'] is not None
-                                    else '',
-                                    saxutils.escape(review['value']),
-                                )
-                            )
+        cls._prepare_to_fork()
 
-                    programs_output.append('\t</programme>\n')
+        try:
+            cls._generate_epgs_process_pool_executor = ProcessPoolExecutor(
+                max_workers=2, mp_context=multiprocessing.get_context('fork')
+            )
 
-        Privilege.become_privileged_user()
-        Utility.write_file(
-            os.path.join(
-                output_directory_path,
-                DEFAULT_OUTPUT_XMLTV_FILE_NAME_FORMAT.format(
-                    'f' if is_forced else 'r',
-                    'f' if do_generate_all_elements else 's',
-                    number_of_days,
-                ),
-            ),
-            '<?xml version="1.0" encoding="utf-8"?>\n'
-            '<tv>\n'
-            '{0}'
-            '{1}'
-            '</tv>\n'.format(''.join(channels_output), ''.join(programs_output)),
-        )
-        Privilege.become_unprivileged_user()
+            for do_generate_all_elements in (True, False):
+                cls._generate_epgs_futures.append(
+                    cls._generate_epgs_process_pool_executor.submit(
+                        cls._write_epgs_in_worker,
+                        output_directory_path,
+                        is_forced,
+                        (do_generate_all_elements,),
+                    )
+                )
+        finally:
+            Database.resume_connection()
 
     @classmethod
-    def _generate_epgs(cls, output_directory_path, is_forced):
-        for number_of_days in DEFAULT_OUTPUT_XMLTV_NUMBER_OF_DAYS:
-            cls._generate_epg(output_directory_path, is_forced, number_of_days)
-            cls._generate_epg(
-                output_directory_path,
-                is_forced,
-                number_of_days,
-                do_concatenate_sub_title_to_title=True,
-                do_generate_all_elements=False,
-            )
+    def _initialize_merge_worker(cls):
+        Database.open_worker_connection()
+        MergeStatistics.detach()
 
     @classmethod
     def _insert_into_category_map_table(cls, smooth_streams_category, epg_category):
         sql_statement = (
-            "INSERT "
+            "INSERT OR IGNORE "
             "INTO category_map (smooth_streams_category, epg_category) "
             "VALUES (:smooth_streams_category, :epg_category)"
         )
-        try:
-            Database.execute(
-                sql_statement,
-                {
-                    'smooth_streams_category': smooth_streams_category,
-                    'epg_category': epg_category,
-                },
-            )
-            Database.commit()
-        except sqlite3.IntegrityError:
-            pass
+        Database.submit(
+            sql_statement,
+            {
+                'smooth_streams_category': smooth_streams_category,
+                'epg_category': epg_category,
+            },
+        )
 
     @classmethod
     def _insert_into_failed_program_match_table(cls, smooth_streams_program):
@@ -2356,36 +2030,34 @@ class EPG(object):
             "date_time_of_last_failure, number_of_occurrences, reviewed) "
             "VALUES (:smooth_streams_program_title, :smooth_streams_program_sub_title, "
             ":smooth_streams_program_channel, :smooth_streams_program_start, "
-            ":smooth_streams_program_stop, :date_time_of_last_failure, :number_of_occurrences, :reviewed)"
+            ":smooth_streams_program_stop, CAST(strftime('%s', 'now') AS INTEGER), :number_of_occurrences, :reviewed) "
+            "ON CONFLICT (smooth_streams_program_title, smooth_streams_program_sub_title, "
+            "smooth_streams_program_channel, smooth_streams_program_start, smooth_streams_program_stop) "
+            "DO UPDATE SET date_time_of_last_failure = excluded.date_time_of_last_failure, "
+            "number_of_occurrences = number_of_occurrences + 1"
+        )
+        Database.submit(
+            sql_statement,
+            {
+                'smooth_streams_program_title': smooth_streams_program.titles[0][
+                    'value'
+                ],
+                'smooth_streams_program_sub_title': smooth_streams_program.sub_titles[
+                    0
+                ]['value']
+                if smooth_streams_program.has_sub_titles()
+                else '',
+                'smooth_streams_program_channel': smooth_streams_program.channel,
+                'smooth_streams_program_start': Utility.convert_date_time_to_epoch(
+                    smooth_streams_program.start
+                ),
+                'smooth_streams_program_stop': Utility.convert_date_time_to_epoch(
+                    smooth_streams_program.stop
+                ),
+                'number_of_occurrences': 1,
+                'reviewed': 0,
+            },
         )
-        try:
-            Database.execute(
-                sql_statement,
-                {
-                    'smooth_streams_program_title': smooth_streams_program.titles[0][
-                        'value'
-                    ],
-                    'smooth_streams_program_sub_title': smooth_streams_program.sub_titles[
-                        0
-                    ][
-                        'value'
-                    ]
-                    if smooth_streams_program.has_sub_titles()
-                    else '',
-                    'smooth_streams_program_channel': smooth_streams_program.channel,
-                    'smooth_streams_program_start': str(smooth_streams_program.start),
-                    'smooth_streams_program_stop': str(smooth_streams_program.stop),
-                    'date_time_of_last_failure': str(
-                        datetime.now(pytz.utc).replace(microsecond=0)
-                    ),
-                    'number_of_occurrences': 1,
-                    'reviewed': 0,
-                },
-            )
-            Database.commit()
-        except sqlite3.IntegrityError as err:
-            if 'UNIQUE constraint failed' in '{0}'.format(err):
-                cls._update_failed_program_match_table(smooth_streams_program)
 
     @classmethod
     def _insert_into_program_match_table(
@@ -2397,76 +2069,46 @@ class EPG(object):
         token_sort_ratio_score,
         jaro_winkler_ratio_score,
     ):
-        regular_expression_match = re.search(
-            r'I[0-9]+.[0-9]+(.[0-9]+)?', epg_program.channel
-        )
-        if regular_expression_match is not None:
-            epg_program_channel_id = regular_expression_match.group(0)
-        else:
-            epg_program_channel_id = epg_program.channel
-
         sql_statement = (
             "INSERT "
-            "INTO program_match (smooth_streams_program_title, smooth_streams_program_sub_title, "
-            "smooth_streams_program_channel, smooth_streams_program_start, smooth_streams_program_stop, "
+            "INTO program_match (program_match_key, smooth_streams_program_title, "
+            "smooth_streams_program_sub_title, smooth_streams_program_channel, "
+            "smooth_streams_program_start, smooth_streams_program_stop, "
             "epg_program_title, epg_program_sub_title, epg_program_channel, "
             "epg_program_start, epg_program_stop, smooth_streams_program_string_compared, "
             "epg_program_string_compared, token_sort_ratio_score, jaro_winkler_ratio_score, "
             "match_type, date_time_of_last_match, number_of_occurrences, is_valid, reviewed) "
-            "VALUES (:smooth_streams_program_title, :smooth_streams_program_sub_title, "
-            ":smooth_streams_program_channel, :smooth_streams_program_start, "
-            ":smooth_streams_program_stop, :epg_program_title, :epg_program_sub_title, "
-            ":epg_program_channel, :epg_program_start, :epg_program_stop, "
+            "VALUES (:program_match_key, :smooth_streams_program_title, "
+            ":smooth_streams_program_sub_title, :smooth_streams_program_channel, "
+            ":smooth_streams_program_start, :smooth_streams_program_stop, :epg_program_title, "
+            ":epg_program_sub_title, :epg_program_channel, :epg_program_start, :epg_program_stop, "
             ":smooth_streams_program_string_compared, :epg_program_string_compared, "
-            ":token_sort_ratio_score, :jaro_winkler_ratio_score, :match_type, :date_time_of_last_match, "
-            ":number_of_occurrences, :is_valid, :reviewed)"
+            ":token_sort_ratio_score, :jaro_winkler_ratio_score, :match_type, CAST(strftime('%s', 'now') AS INTEGER), "
+            ":number_of_occurrences, :is_valid, :reviewed) "
+            "ON CONFLICT (program_match_key) "
+            "DO UPDATE SET date_time_of_last_match = excluded.date_time_of_last_match, "
+            "number_of_occurrences = number_of_occurrences + 1"
         )
-        try:
-            Database.execute(
-                sql_statement,
-                {
-                    'smooth_streams_program_title': smooth_streams_program.titles[0][
-                        'value'
-                    ],
-                    'smooth_streams_program_sub_title': smooth_streams_program.sub_titles[
-                        0
-                    ][
-                        'value'
-                    ]
-                    if smooth_streams_program.has_sub_titles()
-                    else '',
-                    'smooth_streams_program_channel': smooth_streams_program.channel,
-                    'smooth_streams_program_start': str(smooth_streams_program.start),
-                    'smooth_streams_program_stop': str(smooth_streams_program.stop),
-                    'epg_program_title': epg_program.titles[0]['value'],
-                    'epg_program_sub_title': epg_program.sub_titles[0]['value']
-                    if epg_program.has_sub_titles()
-                    else '',
-                    'epg_program_channel': cls._channel_id_map[epg_program_channel_id]
-                    if epg_program_channel_id in cls._channel_id_map
-                    else epg_program_channel_id,
-                    'epg_program_start': str(epg_program.start),
-                    'epg_program_stop': str(epg_program.stop),
-                    'smooth_streams_program_string_compared': smooth_streams_program_string_compared,
-                    'epg_program_string_compared': epg_program_string_compared,
-                    'token_sort_ratio_score': token_sort_ratio_score,
-                    'jaro_winkler_ratio_score': jaro_winkler_ratio_score,
-                    'match_type': 'safe'
-                    if token_sort_ratio_score >= SAFE_FUZZY_MATCH_PERCENTAGE
-                    or jaro_winkler_ratio_score >= SAFE_FUZZY_MATCH_PERCENTAGE
-                    else 'risky',
-                    'date_time_of_last_match': str(
-                        datetime.now(pytz.utc).replace(microsecond=0)
-                    ),
-                    'number_of_occurrences': 1,
-                    'is_valid': None,
-                    'reviewed': 0,
-                },
-            )
-            Database.commit()
-        except sqlite3.IntegrityError as err:
-            if 'UNIQUE constraint failed' in '{0}'.format(err):
-                cls._update_program_match_table(smooth_streams_program, epg_program)
+        parameters = cls._create_program_match_identity(
+            smooth_streams_program, epg_program
+        )
+        parameters.update(
+            {
+                'smooth_streams_program_string_compared': smooth_streams_program_string_compared,
+                'epg_program_string_compared': epg_program_string_compared,
+                'token_sort_ratio_score': token_sort_ratio_score,
+                'jaro_winkler_ratio_score': jaro_winkler_ratio_score,
+                'match_type': 'safe'
+                if token_sort_ratio_score >= SAFE_FUZZY_MATCH_PERCENTAGE
+                or jaro_winkler_ratio_score >= SAFE_FUZZY_MATCH_PERCENTAGE
+                else 'risky',
+                'number_of_occurrences': 1,
+                'is_valid': None,
+                'reviewed': 0,
+            }
+        )
+
+        Database.submit(sql_statement, parameters)
 
     @classmethod
     def _is_match_found(
@@ -2585,6 +2227,143 @@ class EPG(object):
 
         return False
 
+    @classmethod
+    def _merge_channel_in_worker(cls, merge_channel, channel_id):
+        number_of_errors = len(Error.get_errors())
+
+        (merge_result, parsed_programs_map_keys) = cls._capture_merge_channel_result(
+            merge_channel, channel_id
+        )
+
+        return (
+            merge_result,
+            parsed_programs_map_keys,
+            Error.get_errors()[number_of_errors:],
+            MergeStatistics.detach(),
+        )
+
+    @classmethod
+    def _merge_smooth_streams_epg(cls, merge_channel, merge_name):
+        MergeStatistics.start_merge(merge_name)
+
+        is_incremental = Configuration.get_configuration_parameter('MERGE_INCREMENTAL')
+        number_of_workers = (
+            Configuration.get_configuration_parameter('MERGE_NUMBER_OF_WORKERS')
+            or os.cpu_count()
+        )
+        is_parallel = (
+            Configuration.get_configuration_parameter('MERGE_PARALLEL')
+            and number_of_workers > 1
+            and 'fork' in multiprocessing.get_all_start_methods()
+        )
+
+        if not is_incremental and not is_parallel:
+            for channel in cls._smooth_streams_epg.values():
+                cls._run_merge_channel(merge_channel, channel)
+
+            return
+
+        channel_ids = list(cls._smooth_streams_epg)
+        channel_fingerprints = {}
+        merge_results = {}
+
+        if is_incremental:
+            MergeCache.load(merge_name)
+
+            matching_context_fingerprint = cls._calculate_matching_context_fingerprint()
+
+            for channel_id in channel_ids:
+                channel_fingerprints[channel_id] = cls._calculate_channel_fingerprint(
+                    channel_id, matching_context_fingerprint
+                )
+
+                merge_result = MergeCache.get_merge_result(
+                    channel_id,
+                    channel_fingerprints[channel_id],
+                    cls._calculate_parsed_programs_fingerprint,
+                )
+                if merge_result is not None:
+                    merge_results[channel_id] = merge_result
+
+                    MergeStatistics.count_channel_reused()
+
+        changed_channel_ids = [
+            channel_id for channel_id in channel_ids if channel_id not in merge_results
+        ]
+
+        if is_parallel and len(changed_channel_ids) > 1:
+            logger.debug(
+                'Merging channels in parallel\n'
+                '# of channels => %s\n'
+                '# of workers  => %s',
+                len(changed_channel_ids),
+                number_of_workers,
+            )
+
+            cls._prepare_to_fork()
+
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=number_of_workers,
+                    mp_context=multiprocessing.get_context('fork'),
+                    initializer=cls._initialize_merge_worker,
+                ) as process_pool_executor:
+                    for (
+                        channel_id,
+                        (merge_result, parsed_programs_map_keys, errors, statistics),
+                    ) in zip(
+                        changed_channel_ids,
+                        process_pool_executor.map(
+                            cls._merge_channel_in_worker,
+                            itertools.repeat(merge_channel),
+                            changed_channel_ids,
+                        ),
+                    ):
+                        merge_results[channel_id] = merge_result
+
+                        if is_incremental:
+                            MergeCache.set_merge_result(
+                                channel_id,
+                                channel_fingerprints[channel_id],
+                                parsed_programs_map_keys,
+                                cls._calculate_parsed_programs_fingerprint(
+                                    parsed_programs_map_keys
+                                ),
+                                merge_result,
+                            )
+
+                        for error in errors:
+                            Error.add_error(error)
+
+                        MergeStatistics.attach(statistics)
+            finally:
+                Database.resume_connection()
+        else:
+            for channel_id in changed_channel_ids:
+                (
+                    merge_result,
+                    parsed_programs_map_keys,
+                ) = cls._capture_merge_channel_result(merge_channel, channel_id)
+
+                merge_results[channel_id] = merge_result
+
+                if is_incremental:
+                    MergeCache.set_merge_result(
+                        channel_id,
+                        channel_fingerprints[channel_id],
+                        parsed_programs_map_keys,
+                        cls._calculate_parsed_programs_fingerprint(
+                            parsed_programs_map_keys
+                        ),
+                        merge_result,
+                    )
+
+        for channel_id in channel_ids:
+            cls._apply_merge_channel_result(channel_id, merge_results[channel_id])
+
+        if is_incremental:
+            MergeCache.save()
+
     @classmethod
     def _parse_epg_xml(
         cls, epg_xml_stream, is_smooth_streams_epg=False, parse_channels=True
@@ -2877,1667 +2656,2282 @@ class EPG(object):
                     else:
                         channel_id = program.channel
 
-                    if is_smooth_streams_epg:
-                        cls._smooth_streams_epg[channel_id].add_program(program)
-                    else:
-                        cls._populate_parsed_programs_map(copy.deepcopy(program))
+                    if is_smooth_streams_epg:
+                        cls._smooth_streams_epg[channel_id].add_program(program)
+                    else:
+                        cls._populate_parsed_programs_map(
+                            program.retime(program.start, program.stop)
+                        )
+
+                        if channel_id in cls._channel_id_map:
+                            cls._epg[cls._channel_id_map[channel_id]].add_program(
+                                program
+                            )
+
+                            if cls._latest_date_time_epg_xml is None:
+                                cls._latest_date_time_epg_xml = program.stop
+                            elif cls._latest_date_time_epg_xml < program.stop:
+                                cls._latest_date_time_epg_xml = program.stop
+
+                        try:
+                            cls._mc2xml_channel_ids_map[program.channel] = True
+                        except KeyError:
+                            pass
+
+                    element.clear()
+                    tv_element.clear()
+            elif event == 'start':
+                if element.tag == 'tv':
+                    tv_element = element
+
+    @classmethod
+    def _populate_parsed_programs_map(cls, epg_program):
+        if epg_program.titles[0]['value'] in cls._parsed_programs_map:
+            bisect.insort(
+                cls._parsed_programs_map[epg_program.titles[0]['value']], epg_program
+            )
+        else:
+            cls._parsed_programs_map[epg_program.titles[0]['value']] = [epg_program]
+
+        if epg_program.has_sub_titles():
+            if epg_program.sub_titles[0]['value'] in cls._parsed_programs_map:
+                bisect.insort(
+                    cls._parsed_programs_map[epg_program.sub_titles[0]['value']],
+                    epg_program,
+                )
+            else:
+                cls._parsed_programs_map[epg_program.sub_titles[0]['value']] = [
+                    epg_program
+                ]
+
+    @classmethod
+    def _prepare_to_fork(cls):
+        # A forked child only inherits the forking thread. Any lock held by another
+        # thread at that moment, such as a logging handler lock, stays locked in the
+        # child forever. Stop every thread this process started before forking.
+        Database.stop_writer()
+
+        cls._wait_for_generated_epgs()
+
+        Privilege.become_privileged_user()
+        try:
+            OutputCompressor.wait()
+        finally:
+            Privilege.become_unprivileged_user()
+
+        # A SQLite connection must not be carried across fork(), so the children
+        # must not inherit an open one.
+        Database.suspend_connection()
+
+    @classmethod
+    def _query_category_map_table(cls, smooth_streams_category):
+        sql_statement = (
+            'SELECT * '
+            'FROM category_map '
+            'WHERE smooth_streams_category = :smooth_streams_category'
+        )
+        records = Database.execute(
+            sql_statement, {'smooth_streams_category': smooth_streams_category}
+        )
+
+        return records
+
+    @classmethod
+    def _query_forced_program_match_table(cls, smooth_streams_program):
+        sql_statement = (
+            'SELECT * '
+            'FROM forced_program_match '
+            'WHERE smooth_streams_program_title = :smooth_streams_program_title'
+            '  AND smooth_streams_program_sub_title = :smooth_streams_program_sub_title'
+            '  AND smooth_streams_program_channel = :smooth_streams_program_channel'
+            '  AND smooth_streams_program_start = :smooth_streams_program_start'
+            '  AND smooth_streams_program_stop = :smooth_streams_program_stop'
+        )
+        records = Database.execute(
+            sql_statement,
+            {
+                'smooth_streams_program_title': smooth_streams_program.titles[0][
+                    'value'
+                ],
+                'smooth_streams_program_sub_title': smooth_streams_program.sub_titles[
+                    0
+                ]['value']
+                if smooth_streams_program.has_sub_titles()
+                else '',
+                'smooth_streams_program_channel': smooth_streams_program.channel,
+                'smooth_streams_program_start': str(smooth_streams_program.start),
+                'smooth_streams_program_stop': str(smooth_streams_program.stop),
+            },
+        )
+
+        return records
+
+    @classmethod
+    def _query_ignored_epg_program_match_table(cls, epg_program):
+        sql_statement = (
+            'SELECT * '
+            'FROM ignored_epg_program_match '
+            'WHERE epg_program_title = :epg_program_title'
+            '  AND ((epg_program_sub_title = :epg_program_sub_title'
+            '  AND epg_program_channel = :epg_program_channel'
+            '  AND epg_program_start = :epg_program_start'
+            '  AND epg_program_stop = :epg_program_stop)'
+            '  OR (epg_program_sub_title = :epg_program_sub_title'
+            '  AND epg_program_channel = \'\''
+            '  AND epg_program_start = \'\''
+            '  AND epg_program_stop = \'\')'
+            '  OR (epg_program_sub_title = \'\''
+            '  AND epg_program_channel = \'\''
+            '  AND epg_program_start = \'\''
+            '  AND epg_program_stop = \'\'))'
+        )
+        records = Database.execute(
+            sql_statement,
+            {
+                'epg_program_title': epg_program.titles[0]['value'],
+                'epg_program_sub_title': epg_program.sub_titles[0]['value']
+                if epg_program.has_sub_titles()
+                else '',
+                'epg_program_channel': epg_program.channel,
+                'epg_program_start': str(epg_program.start),
+                'epg_program_stop': str(epg_program.stop),
+            },
+        )
+
+        return records
+
+    @classmethod
+    def _query_ignored_smooth_streams_program_match_table(cls, smooth_streams_program):
+        sql_statement = (
+            'SELECT * '
+            'FROM ignored_smooth_streams_program_match '
+            'WHERE smooth_streams_program_title = :smooth_streams_program_title'
+            '  AND smooth_streams_program_sub_title = :smooth_streams_program_sub_title'
+            '  AND ((smooth_streams_program_channel = :smooth_streams_program_channel'
+            '  AND smooth_streams_program_start = :smooth_streams_program_start'
+            '  AND smooth_streams_program_stop = :smooth_streams_program_stop)'
+            '  OR (smooth_streams_program_channel = \'\''
+            '  AND smooth_streams_program_start = \'\''
+            '  AND smooth_streams_program_stop = \'\'))'
+        )
+        records = Database.execute(
+            sql_statement,
+            {
+                'smooth_streams_program_title': smooth_streams_program.titles[0][
+                    'value'
+                ],
+                'smooth_streams_program_sub_title': smooth_streams_program.sub_titles[
+                    0
+                ]['value']
+                if smooth_streams_program.has_sub_titles()
+                else '',
+                'smooth_streams_program_channel': smooth_streams_program.channel,
+                'smooth_streams_program_start': str(smooth_streams_program.start),
+                'smooth_streams_program_stop': str(smooth_streams_program.stop),
+            },
+        )
+
+        return records
+
+    @classmethod
+    def _query_ignored_smooth_streams_program_pattern_table(cls):
+        sql_statement = 'SELECT * FROM ignored_smooth_streams_program_pattern'
+        records = Database.execute(sql_statement, {})
+
+        return records
+
+    @classmethod
+    def _query_pattern_program_match_table(cls, smooth_streams_program):
+        sql_statement = (
+            'SELECT * '
+            'FROM pattern_program_match '
+            'WHERE smooth_streams_program_title = :smooth_streams_program_title'
+        )
+
+        records = Database.execute(
+            sql_statement,
+            {'smooth_streams_program_title': smooth_streams_program.titles[0]['value']},
+        )
+
+        return records
+
+    @classmethod
+    def _query_program_match_table(cls, smooth_streams_program, epg_program):
+        sql_statement = (
+            'SELECT is_valid '
+            'FROM program_match '
+            'WHERE program_match_key = :program_match_key'
+        )
+
+        records = Database.execute(
+            sql_statement,
+            {
+                'program_match_key': cls._create_program_match_identity(
+                    smooth_streams_program, epg_program
+                )['program_match_key']
+            },
+        )
+
+        return records
+
+    @classmethod
+    def _read_mc2xml_channel_ids_map(cls, mc2xml_country):
+        cls._mc2xml_channel_ids_map = {}
+
+        for mc2xml_channel_id in (
+            Utility.read_file(
+                os.path.join(
+                    DEFAULT_MC2XML_DIRECTORY_PATH, mc2xml_country, 'mc2xml.chl'
+                )
+            )
+            .strip()
+            .split('\n')
+        ):
+            if mc2xml_channel_id.strip()[0] != '#':
+                cls._mc2xml_channel_ids_map[mc2xml_channel_id] = False
+
+    @classmethod
+    def _record_consulted_parsed_programs_map_keys(cls, parsed_programs_map_keys):
+        if cls._consulted_parsed_programs_map_keys is not None:
+            cls._consulted_parsed_programs_map_keys.update(parsed_programs_map_keys)
+
+    @classmethod
+    def _relax_merge_channel(cls, channel):
+        logger.debug(
+            'Reconciling channel\nName   => %s\nNumber => %s',
+            channel.display_names[0]['value'],
+            channel.id,
+        )
+
+        epg_programs_index = EPGProgramIntervalIndex(cls._epg[channel.id])
+
+        for smooth_streams_program in channel.programs:
+            do_find_best_matching_program = True
+            is_smooth_streams_program_processed = False
+
+            while not is_smooth_streams_program_processed:
+                for epg_program in epg_programs_index.find_programs_in_range(
+                    smooth_streams_program.start, smooth_streams_program.stop
+                ):
+                    if smooth_streams_program.start < epg_program.start:
+                        if smooth_streams_program.stop <= epg_program.start:
+                            if not is_smooth_streams_program_processed:
+                                if (
+                                    do_find_best_matching_program
+                                    and not cls._is_program_in_the_past(
+                                        smooth_streams_program
+                                    )
+                                    and not cls._is_program_past_date_time_criteria(
+                                        smooth_streams_program
+                                    )
+                                    and not cls._is_program_in_ignored_smooth_streams_program_match_table(
+                                        smooth_streams_program
+                                    )
+                                    and not cls._does_program_match_ignored_smooth_streams_program_pattern(
+                                        smooth_streams_program
+                                    )
+                                ):
+                                    matching_program = cls._find_best_matching_program(
+                                        smooth_streams_program
+                                    )
+
+                                    if smooth_streams_program is not matching_program:
+                                        do_find_best_matching_program = False
+
+                                        if (
+                                            smooth_streams_program.start
+                                            != matching_program.start
+                                            or smooth_streams_program.stop
+                                            != matching_program.stop
+                                        ):
+                                            smooth_streams_program = matching_program
+
+                                            break
+                                        else:
+                                            smooth_streams_program = matching_program
+
+                                MergeStatistics.count_overlap_case(
+                                    'No overlap detected'
+                                )
+
+                                logger.debug(
+                                    'No overlap detected\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                )
+
+                                epg_programs_index.insert(smooth_streams_program)
+                                is_smooth_streams_program_processed = True
+
+                                logger.debug(
+                                    'No overlap processed\n'
+                                    'SmoothStreams program inserted\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                )
+                            else:
+                                is_smooth_streams_program_processed = True
+
+                                MergeStatistics.count_overlap_case(
+                                    'Unexpected case #1 detected'
+                                )
+
+                                logger.debug(
+                                    'Unexpected case #1 detected\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+                            break
+                        elif smooth_streams_program.stop < epg_program.stop:
+                            if is_smooth_streams_program_processed:
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap continuation detected (Overflow, Start to before stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap continuation detected\n'
+                                    '  Type      => Overflow\n'
+                                    '  Alignment => Start to before stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                epg_programs_index.trim_start(
+                                    epg_program, smooth_streams_program.stop
+                                )
+
+                                logger.debug(
+                                    'Overlap continuation processed\n'
+                                    '  Type      => Overflow\n'
+                                    '  Alignment => Start to before stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program modified\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                break
+                            else:
+                                if (
+                                    do_find_best_matching_program
+                                    and not cls._is_program_in_the_past(
+                                        smooth_streams_program
+                                    )
+                                    and not cls._is_program_past_date_time_criteria(
+                                        smooth_streams_program
+                                    )
+                                    and not cls._is_program_in_ignored_smooth_streams_program_match_table(
+                                        smooth_streams_program
+                                    )
+                                    and not cls._does_program_match_ignored_smooth_streams_program_pattern(
+                                        smooth_streams_program
+                                    )
+                                ):
+                                    matching_program = cls._find_best_matching_program(
+                                        smooth_streams_program
+                                    )
+
+                                    if smooth_streams_program is not matching_program:
+                                        do_find_best_matching_program = False
+
+                                        if (
+                                            smooth_streams_program.start
+                                            != matching_program.start
+                                            or smooth_streams_program.stop
+                                            != matching_program.stop
+                                        ):
+                                            smooth_streams_program = matching_program
+
+                                            break
+                                        else:
+                                            smooth_streams_program = matching_program
+
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap detected (Partial, After start to before stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap detected\n'
+                                    '  Type      => Partial\n'
+                                    '  Alignment => After start to before stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                epg_programs_index.trim_start(
+                                    epg_program, smooth_streams_program.stop
+                                )
+                                epg_programs_index.insert(smooth_streams_program)
+                                is_smooth_streams_program_processed = True
+
+                                logger.debug(
+                                    'Overlap processed\n'
+                                    '  Type      => Partial\n'
+                                    '  Alignment => After start to before stop\n'
+                                    'SmoothStreams program inserted\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program removed\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                break
+                        elif smooth_streams_program.stop == epg_program.stop:
+                            if is_smooth_streams_program_processed:
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap continuation detected (Overflow, Start to stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap continuation detected\n'
+                                    '  Type      => Overflow\n'
+                                    '  Alignment => Start to stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                epg_programs_index.remove(epg_program)
+
+                                logger.debug(
+                                    'Overlap continuation processed\n'
+                                    '  Type      => Overflow\n'
+                                    '  Alignment => Start to stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program removed\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                break
+                            else:
+                                if (
+                                    do_find_best_matching_program
+                                    and not cls._is_program_in_the_past(
+                                        smooth_streams_program
+                                    )
+                                    and not cls._is_program_past_date_time_criteria(
+                                        smooth_streams_program
+                                    )
+                                    and not cls._is_program_in_ignored_smooth_streams_program_match_table(
+                                        smooth_streams_program
+                                    )
+                                    and not cls._does_program_match_ignored_smooth_streams_program_pattern(
+                                        smooth_streams_program
+                                    )
+                                ):
+                                    matching_program = cls._find_best_matching_program(
+                                        smooth_streams_program
+                                    )
+
+                                    if smooth_streams_program is not matching_program:
+                                        do_find_best_matching_program = False
+
+                                        if (
+                                            smooth_streams_program.start
+                                            != matching_program.start
+                                            or smooth_streams_program.stop
+                                            != matching_program.stop
+                                        ):
+                                            smooth_streams_program = matching_program
+
+                                            break
+                                        else:
+                                            smooth_streams_program = matching_program
+
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap detected (Partial, After start to stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap detected\n'
+                                    '  Type      => Partial\n'
+                                    '  Alignment => After start to stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                epg_programs_index.remove(epg_program)
+                                epg_programs_index.insert(smooth_streams_program)
+                                is_smooth_streams_program_processed = True
+
+                                logger.debug(
+                                    'Overlap processed\n'
+                                    '  Type      => Partial\n'
+                                    '  Alignment => After start to stop\n'
+                                    'SmoothStreams program inserted\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program removed\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                break
+                        elif smooth_streams_program.stop > epg_program.stop:
+                            if is_smooth_streams_program_processed:
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap continuation detected (Overflow, Start to stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap continuation detected\n'
+                                    '  Type      => Overflow\n'
+                                    '  Alignment => Start to stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                epg_programs_index.remove(epg_program)
+
+                                logger.debug(
+                                    'Overlap continuation processed\n'
+                                    '  Type      => Overflow\n'
+                                    '  Alignment => Start to stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program removed\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+                            else:
+                                if (
+                                    do_find_best_matching_program
+                                    and not cls._is_program_in_the_past(
+                                        smooth_streams_program
+                                    )
+                                    and not cls._is_program_past_date_time_criteria(
+                                        smooth_streams_program
+                                    )
+                                    and not cls._is_program_in_ignored_smooth_streams_program_match_table(
+                                        smooth_streams_program
+                                    )
+                                    and not cls._does_program_match_ignored_smooth_streams_program_pattern(
+                                        smooth_streams_program
+                                    )
+                                ):
+                                    matching_program = cls._find_best_matching_program(
+                                        smooth_streams_program
+                                    )
+
+                                    if smooth_streams_program is not matching_program:
+                                        do_find_best_matching_program = False
+
+                                        if (
+                                            smooth_streams_program.start
+                                            != matching_program.start
+                                            or smooth_streams_program.stop
+                                            != matching_program.stop
+                                        ):
+                                            smooth_streams_program = matching_program
+
+                                            break
+                                        else:
+                                            smooth_streams_program = matching_program
+
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap detected (Overflow, After start to after stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap detected\n'
+                                    '  Type      => Overflow\n'
+                                    '  Alignment => After start to after stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                epg_programs_index.remove(epg_program)
+                                epg_programs_index.insert(smooth_streams_program)
+                                is_smooth_streams_program_processed = True
+
+                                logger.debug(
+                                    'Overlap processed\n'
+                                    '  Type      => Overflow\n'
+                                    '  Alignment => After start to after stop\n'
+                                    'SmoothStreams program inserted\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program removed\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                break
+                        else:
+                            is_smooth_streams_program_processed = True
+
+                            MergeStatistics.count_overlap_case(
+                                'Unexpected case #2 detected'
+                            )
+
+                            logger.debug(
+                                'Unexpected case #2 detected\n'
+                                'Sports program\n'
+                                '  Title     => %s\n'
+                                '  Start     => %s\n'
+                                '  Stop      => %s\n'
+                                'EPG program\n'
+                                '  Title     => %s\n'
+                                '%s'
+                                '  Start     => %s\n'
+                                '  Stop      => %s',
+                                smooth_streams_program.titles[0]['value'],
+                                smooth_streams_program.start,
+                                smooth_streams_program.stop,
+                                epg_program.titles[0]['value'],
+                                '  Sub-Title => {0}\n'.format(
+                                    epg_program.sub_titles[0]['value']
+                                )
+                                if epg_program.sub_titles
+                                else '',
+                                epg_program.start,
+                                epg_program.stop,
+                            )
+
+                            break
+                    elif smooth_streams_program.start == epg_program.start:
+                        if smooth_streams_program.stop < epg_program.stop:
+                            (
+                                do_process_overlap,
+                                matching_program,
+                            ) = cls._do_process_overlap(
+                                smooth_streams_program,
+                                epg_program,
+                                do_find_best_matching_program=do_find_best_matching_program,
+                                do_check_start_stop_times_alignment=False,
+                            )
+
+                            if smooth_streams_program is not matching_program:
+                                do_find_best_matching_program = False
+
+                                if (
+                                    smooth_streams_program.start
+                                    != matching_program.start
+                                    or smooth_streams_program.stop
+                                    != matching_program.stop
+                                ):
+                                    smooth_streams_program = matching_program
+
+                                    break
+                                else:
+                                    smooth_streams_program = matching_program
+
+                            if smooth_streams_program == epg_program:
+                                do_process_overlap = False
+
+                            if do_process_overlap:
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap detected (Partial, Start)'
+                                )
+
+                                logger.debug(
+                                    'Overlap detected\n'
+                                    '  Type      => Partial\n'
+                                    '  Alignment => Start\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                epg_programs_index.trim_start(
+                                    epg_program, smooth_streams_program.stop
+                                )
+                                epg_programs_index.insert(smooth_streams_program)
+                                is_smooth_streams_program_processed = True
+
+                                logger.debug(
+                                    'Overlap processed\n'
+                                    '  Type      => Partial\n'
+                                    '  Alignment => Start\n'
+                                    'SmoothStreams program inserted\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program modified\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+                            else:
+                                is_smooth_streams_program_processed = True
+
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap skipped (Partial, Start)'
+                                )
+
+                                logger.debug(
+                                    'Overlap skipped\n'
+                                    '  Type      => Partial\n'
+                                    '  Alignment => Start\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                            break
+                        elif smooth_streams_program.stop == epg_program.stop:
+                            (
+                                do_process_overlap,
+                                matching_program,
+                            ) = cls._do_process_overlap(
+                                smooth_streams_program,
+                                epg_program,
+                                do_find_best_matching_program=do_find_best_matching_program,
+                                do_check_start_stop_times_alignment=False,
+                            )
+
+                            if smooth_streams_program is not matching_program:
+                                do_find_best_matching_program = False
+
+                                if (
+                                    smooth_streams_program.start
+                                    != matching_program.start
+                                    or smooth_streams_program.stop
+                                    != matching_program.stop
+                                ):
+                                    smooth_streams_program = matching_program
+
+                                    break
+                                else:
+                                    smooth_streams_program = matching_program
+
+                            if smooth_streams_program == epg_program:
+                                do_process_overlap = False
+
+                            if do_process_overlap:
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap detected (Full, Start to stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap detected\n'
+                                    '  Type      => Full\n'
+                                    '  Alignment => Start to stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                epg_programs_index.remove(epg_program)
+                                epg_programs_index.insert(smooth_streams_program)
+                                is_smooth_streams_program_processed = True
+
+                                logger.debug(
+                                    'Overlap processed\n'
+                                    '  Type      => Full\n'
+                                    '  Alignment => Start to stop\n'
+                                    'SmoothStreams program inserted\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program removed\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+                            else:
+                                is_smooth_streams_program_processed = True
+
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap skipped (Full, Start to stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap skipped\n'
+                                    '  Type      => Full\n'
+                                    '  Alignment => Start to stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                            break
+                        elif smooth_streams_program.stop > epg_program.stop:
+                            (
+                                do_process_overlap,
+                                matching_program,
+                            ) = cls._do_process_overlap(
+                                smooth_streams_program,
+                                epg_program,
+                                do_find_best_matching_program=do_find_best_matching_program,
+                                do_check_start_stop_times_alignment=False,
+                            )
+
+                            if smooth_streams_program is not matching_program:
+                                do_find_best_matching_program = False
+
+                                if (
+                                    smooth_streams_program.start
+                                    != matching_program.start
+                                    or smooth_streams_program.stop
+                                    != matching_program.stop
+                                ):
+                                    smooth_streams_program = matching_program
+
+                                    break
+                                else:
+                                    smooth_streams_program = matching_program
+
+                            if smooth_streams_program == epg_program:
+                                do_process_overlap = False
+
+                            if do_process_overlap:
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap detected (Overflow, Start to after stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap detected\n'
+                                    '  Type      => Overflow\n'
+                                    '  Alignment => Start to after stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                epg_programs_index.remove(epg_program)
+                                epg_programs_index.insert(smooth_streams_program)
+                                is_smooth_streams_program_processed = True
+
+                                logger.debug(
+                                    'Overlap processed\n'
+                                    '  Type      => Overflow\n'
+                                    '  Alignment => Start to after stop\n'
+                                    'SmoothStreams program inserted\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program removed\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+                            else:
+                                is_smooth_streams_program_processed = True
+
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap skipped (Overflow, Start to after stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap skipped\n'
+                                    '  Type      => Overflow\n'
+                                    '  Alignment => Start to after stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                break
+                    elif smooth_streams_program.start > epg_program.start:
+                        if smooth_streams_program.start >= epg_program.stop:
+                            continue
+                        elif smooth_streams_program.stop < epg_program.stop:
+                            (
+                                do_process_overlap,
+                                matching_program,
+                            ) = cls._do_process_overlap(
+                                smooth_streams_program,
+                                epg_program,
+                                do_find_best_matching_program=do_find_best_matching_program,
+                                do_check_start_stop_times_alignment=False,
+                            )
+
+                            if smooth_streams_program is not matching_program:
+                                do_find_best_matching_program = False
+
+                                if (
+                                    smooth_streams_program.start
+                                    != matching_program.start
+                                    or smooth_streams_program.stop
+                                    != matching_program.stop
+                                ):
+                                    smooth_streams_program = matching_program
+
+                                    break
+                                else:
+                                    smooth_streams_program = matching_program
+
+                            if smooth_streams_program == epg_program:
+                                do_process_overlap = False
+
+                            if do_process_overlap:
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap detected (Partial, After start to before stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap detected\n'
+                                    '  Type      => Partial\n'
+                                    '  Alignment => After start to before stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                new_epg_program = epg_programs_index.split(
+                                    epg_program,
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                )
+                                epg_programs_index.insert(smooth_streams_program)
+                                is_smooth_streams_program_processed = True
+
+                                logger.debug(
+                                    'Overlap processed\n'
+                                    '  Type      => Partial\n'
+                                    '  Alignment => After start to before stop\n'
+                                    'SmoothStreams program inserted\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program modified\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program inserted\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                    new_epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        new_epg_program.sub_titles[0]['value']
+                                    )
+                                    if new_epg_program.sub_titles
+                                    else '',
+                                    new_epg_program.start,
+                                    new_epg_program.stop,
+                                )
+                            else:
+                                is_smooth_streams_program_processed = True
+
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap skipped (Partial, After start to before stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap skipped\n'
+                                    '  Type      => Partial\n'
+                                    '  Alignment => After start to before stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                            break
+                        elif smooth_streams_program.stop == epg_program.stop:
+                            (
+                                do_process_overlap,
+                                matching_program,
+                            ) = cls._do_process_overlap(
+                                smooth_streams_program,
+                                epg_program,
+                                do_find_best_matching_program=do_find_best_matching_program,
+                                do_check_start_stop_times_alignment=False,
+                            )
+
+                            if smooth_streams_program is not matching_program:
+                                do_find_best_matching_program = False
+
+                                if (
+                                    smooth_streams_program.start
+                                    != matching_program.start
+                                    or smooth_streams_program.stop
+                                    != matching_program.stop
+                                ):
+                                    smooth_streams_program = matching_program
+
+                                    break
+                                else:
+                                    smooth_streams_program = matching_program
+
+                            if smooth_streams_program == epg_program:
+                                do_process_overlap = False
+
+                            if do_process_overlap:
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap detected (Partial, After start to stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap detected\n'
+                                    '  Type      => Partial\n'
+                                    '  Alignment => After start to stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                epg_programs_index.trim_stop(
+                                    epg_program, smooth_streams_program.start
+                                )
+                                epg_programs_index.insert(smooth_streams_program)
+                                is_smooth_streams_program_processed = True
+
+                                logger.debug(
+                                    'Overlap processed\n'
+                                    '  Type      => Partial\n'
+                                    '  Alignment => After start to stop\n'
+                                    'SmoothStreams program inserted\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program modified\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+                            else:
+                                is_smooth_streams_program_processed = True
+
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap skipped (Partial, After start to stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap skipped\n'
+                                    '  Type      => Partial\n'
+                                    '  Alignment => After start to stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                            break
+                        elif smooth_streams_program.stop > epg_program.stop:
+                            (
+                                do_process_overlap,
+                                matching_program,
+                            ) = cls._do_process_overlap(
+                                smooth_streams_program,
+                                epg_program,
+                                do_find_best_matching_program=do_find_best_matching_program,
+                                do_check_start_stop_times_alignment=False,
+                            )
+
+                            if smooth_streams_program is not matching_program:
+                                do_find_best_matching_program = False
+
+                                if (
+                                    smooth_streams_program.start
+                                    != matching_program.start
+                                    or smooth_streams_program.stop
+                                    != matching_program.stop
+                                ):
+                                    smooth_streams_program = matching_program
+
+                                    break
+                                else:
+                                    smooth_streams_program = matching_program
+
+                            if smooth_streams_program == epg_program:
+                                do_process_overlap = False
+
+                            if do_process_overlap:
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap detected (Overflow, After start to after stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap detected\n'
+                                    '  Type      => Overflow\n'
+                                    '  Alignment => After start to after stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                epg_programs_index.trim_stop(
+                                    epg_program, smooth_streams_program.start
+                                )
+                                epg_programs_index.insert(smooth_streams_program)
+                                is_smooth_streams_program_processed = True
+
+                                logger.debug(
+                                    'Overlap processed\n'
+                                    '  Type      => Overflow\n'
+                                    '  Alignment => After start to after stop\n'
+                                    'SmoothStreams program inserted\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program modified\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+                            else:
+                                is_smooth_streams_program_processed = True
+
+                                MergeStatistics.count_overlap_case(
+                                    'Overlap skipped (Overflow, After start to after stop)'
+                                )
+
+                                logger.debug(
+                                    'Overlap skipped\n'
+                                    '  Type      => Overflow\n'
+                                    '  Alignment => After start to after stop\n'
+                                    'Sports program\n'
+                                    '  Title     => %s\n'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s\n'
+                                    'EPG program\n'
+                                    '  Title     => %s\n'
+                                    '%s'
+                                    '  Start     => %s\n'
+                                    '  Stop      => %s',
+                                    smooth_streams_program.titles[0]['value'],
+                                    smooth_streams_program.start,
+                                    smooth_streams_program.stop,
+                                    epg_program.titles[0]['value'],
+                                    '  Sub-Title => {0}\n'.format(
+                                        epg_program.sub_titles[0]['value']
+                                    )
+                                    if epg_program.sub_titles
+                                    else '',
+                                    epg_program.start,
+                                    epg_program.stop,
+                                )
+
+                                break
+                        else:
+                            MergeStatistics.count_overlap_case(
+                                'Unexpected case #3 detected'
+                            )
 
-                        if channel_id in cls._channel_id_map:
-                            cls._epg[cls._channel_id_map[channel_id]].add_program(
-                                program
+                            logger.debug(
+                                'Unexpected case #3 detected\n'
+                                'Sports program\n'
+                                '  Title     => %s\n'
+                                '  Start     => %s\n'
+                                '  Stop      => %s\n'
+                                'EPG program\n'
+                                '  Title     => %s\n'
+                                '%s'
+                                '  Start     => %s\n'
+                                '  Stop      => %s',
+                                smooth_streams_program.titles[0]['value'],
+                                smooth_streams_program.start,
+                                smooth_streams_program.stop,
+                                epg_program.titles[0]['value'],
+                                '  Sub-Title => {0}\n'.format(
+                                    epg_program.sub_titles[0]['value']
+                                )
+                                if epg_program.sub_titles
+                                else '',
+                                epg_program.start,
+                                epg_program.stop,
+                            )
+                else:
+                    if not is_smooth_streams_program_processed:
+                        if (
+                            do_find_best_matching_program
+                            and not cls._is_program_in_the_past(smooth_streams_program)
+                            and not cls._is_program_past_date_time_criteria(
+                                smooth_streams_program
+                            )
+                            and not cls._is_program_in_ignored_smooth_streams_program_match_table(
+                                smooth_streams_program
+                            )
+                            and not cls._does_program_match_ignored_smooth_streams_program_pattern(
+                                smooth_streams_program
+                            )
+                        ):
+                            matching_program = cls._find_best_matching_program(
+                                smooth_streams_program
                             )
 
-                            if cls._latest_date_time_epg_xml is None:
-                                cls._latest_date_time_epg_xml = program.stop
-                            elif cls._latest_date_time_epg_xml < program.stop:
-                                cls._latest_date_time_epg_xml = program.stop
+                            if smooth_streams_program is not matching_program:
+                                do_find_best_matching_program = True
 
-                        try:
-                            cls._mc2xml_channel_ids_map[program.channel] = True
-                        except KeyError:
-                            pass
+                                smooth_streams_program = matching_program
 
-                    element.clear()
-                    tv_element.clear()
-            elif event == 'start':
-                if element.tag == 'tv':
-                    tv_element = element
+                        epg_programs_index.insert(smooth_streams_program)
+                        is_smooth_streams_program_processed = True
 
-    @classmethod
-    def _populate_parsed_programs_map(cls, epg_program):
-        if epg_program.titles[0]['value'] in cls._parsed_programs_map:
-            bisect.insort(
-                cls._parsed_programs_map[epg_program.titles[0]['value']], epg_program
-            )
-        else:
-            cls._parsed_programs_map[epg_program.titles[0]['value']] = [epg_program]
+                        MergeStatistics.count_overlap_case('No overlap detected')
 
-        if epg_program.has_sub_titles():
-            if epg_program.sub_titles[0]['value'] in cls._parsed_programs_map:
-                bisect.insort(
-                    cls._parsed_programs_map[epg_program.sub_titles[0]['value']],
-                    epg_program,
-                )
-            else:
-                cls._parsed_programs_map[epg_program.sub_titles[0]['value']] = [
-                    epg_program
-                ]
+                        logger.debug(
+                            'No overlap detected\n'
+                            'SmoothStreams program inserted\n'
+                            '  Title     => %s\n'
+                            '  Start     => %s\n'
+                            '  Stop      => %s',
+                            smooth_streams_program.titles[0]['value'],
+                            smooth_streams_program.start,
+                            smooth_streams_program.stop,
+                        )
 
     @classmethod
-    def _purge_db_tables(cls):
-        cls._delete_from_failed_program_match_table()
-        logger.debug(
-            'Purged failed_program_match\n# of records purged => %s',
-            Database.get_row_count(),
-        )
-
-        cls._delete_from_forced_program_match_table()
-        logger.debug(
-            'Purged forced_program_match\n# of records purged => %s',
-            Database.get_row_count(),
-        )
-
-        cls._delete_from_ignored_epg_program_match_table()
-        logger.debug(
-            'Purged ignored_matched_program_match\n# of records purged => %s',
-            Database.get_row_count(),
-        )
-
-        cls._delete_from_ignored_smooth_streams_program_match_table()
-        logger.debug(
-            'Purged ignored_smooth_streams_program_match\n# of records purged => %s',
-            Database.get_row_count(),
-        )
-
-        cls._delete_from_program_match_table()
-        logger.debug(
-            'Purged program_match\n# of records purged => %s', Database.get_row_count()
-        )
+    def _relax_merge_smooth_streams_epg(cls):
+        cls._merge_smooth_streams_epg(cls._relax_merge_channel, 'relax_merge')
 
     @classmethod
-    def _query_category_map_table(cls, smooth_streams_category):
-        sql_statement = (
-            'SELECT * '
-            'FROM category_map '
-            'WHERE smooth_streams_category = :smooth_streams_category'
-        )
-        records = Database.execute(
-            sql_statement, {'smooth_streams_category': smooth_streams_category}
-        )
+    def _render_epg_channel(cls, channel):
+        channel_output = []
 
-        return records
-
-    @classmethod
-    def _query_forced_program_match_table(cls, smooth_streams_program):
-        sql_statement = (
-            'SELECT * '
-            'FROM forced_program_match '
-            'WHERE smooth_streams_program_title = :smooth_streams_program_title'
-            '  AND smooth_streams_program_sub_title = :smooth_streams_program_sub_title'
-            '  AND smooth_streams_program_channel = :smooth_streams_program_channel'
-            '  AND smooth_streams_program_start = :smooth_streams_program_start'
-            '  AND smooth_streams_program_stop = :smooth_streams_program_stop'
-        )
-        records = Database.execute(
-            sql_statement,
-            {
-                'smooth_streams_program_title': smooth_streams_program.titles[0][
-                    'value'
-                ],
-                'smooth_streams_program_sub_title': smooth_streams_program.sub_titles[
-                    0
-                ]['value']
-                if smooth_streams_program.has_sub_titles()
-                else '',
-                'smooth_streams_program_channel': smooth_streams_program.channel,
-                'smooth_streams_program_start': str(smooth_streams_program.start),
-                'smooth_streams_program_stop': str(smooth_streams_program.stop),
-            },
-        )
+        channel_output.append('\t<channel id="{0}">\n'.format(channel.id))
 
-        return records
+        for display_name in channel.display_names:
+            channel_output.append(
+                '\t\t<display-name{0}>{1}</display-name>\n'.format(
+                    ' lang="{0}"'.format(
+                        OutputEncoding.escape(display_name['language'])
+                    )
+                    if display_name['language'] is not None
+                    else '',
+                    OutputEncoding.escape(display_name['value']),
+                )
+            )
 
-    @classmethod
-    def _query_ignored_epg_program_match_table(cls, epg_program):
-        sql_statement = (
-            'SELECT * '
-            'FROM ignored_epg_program_match '
-            'WHERE epg_program_title = :epg_program_title'
-            '  AND ((epg_program_sub_title = :epg_program_sub_title'
-            '  AND epg_program_channel = :epg_program_channel'
-            '  AND epg_program_start = :epg_program_start'
-            '  AND epg_program_stop = :epg_program_stop)'
-            '  OR (epg_program_sub_title = :epg_program_sub_title'
-            '  AND epg_program_channel = \'\''
-            '  AND epg_program_start = \'\''
-            '  AND epg_program_stop = \'\')'
-            '  OR (epg_program_sub_title = \'\''
-            '  AND epg_program_channel = \'\''
-            '  AND epg_program_start = \'\''
-            '  AND epg_program_stop = \'\'))'
-        )
-        records = Database.execute(
-            sql_statement,
-            {
-                'epg_program_title': epg_program.titles[0]['value'],
-                'epg_program_sub_title': epg_program.sub_titles[0]['value']
-                if epg_program.has_sub_titles()
-                else '',
-                'epg_program_channel': epg_program.channel,
-                'epg_program_start': str(epg_program.start),
-                'epg_program_stop': str(epg_program.stop),
-            },
+        channel_output.append(
+            '\t\t<display-name>{0}</display-name>\n'.format(channel.id)
         )
 
-        return records
-
-    @classmethod
-    def _query_ignored_smooth_streams_program_match_table(cls, smooth_streams_program):
-        sql_statement = (
-            'SELECT * '
-            'FROM ignored_smooth_streams_program_match '
-            'WHERE smooth_streams_program_title = :smooth_streams_program_title'
-            '  AND smooth_streams_program_sub_title = :smooth_streams_program_sub_title'
-            '  AND ((smooth_streams_program_channel = :smooth_streams_program_channel'
-            '  AND smooth_streams_program_start = :smooth_streams_program_start'
-            '  AND smooth_streams_program_stop = :smooth_streams_program_stop)'
-            '  OR (smooth_streams_program_channel = \'\''
-            '  AND smooth_streams_program_start = \'\''
-            '  AND smooth_streams_program_stop = \'\'))'
-        )
-        records = Database.execute(
-            sql_statement,
-            {
-                'smooth_streams_program_title': smooth_streams_program.titles[0][
-                    'value'
-                ],
-                'smooth_streams_program_sub_title': smooth_streams_program.sub_titles[
-                    0
-                ]['value']
-                if smooth_streams_program.has_sub_titles()
-                else '',
-                'smooth_streams_program_channel': smooth_streams_program.channel,
-                'smooth_streams_program_start': str(smooth_streams_program.start),
-                'smooth_streams_program_stop': str(smooth_streams_program.stop),
-            },
-        )
+        for icon in channel.icons:
+            channel_output.append(
+                '\t\t<icon {0}src="{1}"{2} />\n'.format(
+                    'height="{0}" '.format(OutputEncoding.escape(icon['height']))
+                    if icon['height'] is not None
+                    else '',
+                    OutputEncoding.escape(icon['source']),
+                    ' width="{0}"'.format(OutputEncoding.escape(icon['width']))
+                    if icon['width'] is not None
+                    else '',
+                )
+            )
 
-        return records
+        for url in channel.urls:
+            channel_output.append(
+                '\t\t<url>{0}</url>\n'.format(OutputEncoding.escape(url['value']))
+            )
 
-    @classmethod
-    def _query_ignored_smooth_streams_program_pattern_table(cls):
-        sql_statement = 'SELECT * FROM ignored_smooth_streams_program_pattern'
-        records = Database.execute(sql_statement, {})
+        channel_output.append('\t</channel>\n')
 
-        return records
+        return ''.join(channel_output)
 
     @classmethod
-    def _query_pattern_program_match_table(cls, smooth_streams_program):
-        sql_statement = (
-            'SELECT * '
-            'FROM pattern_program_match '
-            'WHERE smooth_streams_program_title = :smooth_streams_program_title'
-        )
-
-        records = Database.execute(
-            sql_statement,
-            {'smooth_streams_program_title': smooth_streams_program.titles[0]['value']},
+    def _render_epg_program(
+        cls,
+        channel,
+        program,
+        do_concatenate_sub_title_to_title=False,
+        do_generate_all_elements=True,
+    ):
+        rendered_fragment_key = (
+            channel.id,
+            do_concatenate_sub_title_to_title,
+            do_generate_all_elements,
         )
 
-        return records
-
-    @classmethod
-    def _query_program_match_table(cls, smooth_streams_program, epg_program):
-        regular_expression_match = re.search(
-            r'I[0-9]+.[0-9]+(.[0-9]+)?', epg_program.channel
-        )
-        if regular_expression_match is not None:
-            epg_program_channel_id = regular_expression_match.group(0)
-        else:
-            epg_program_channel_id = epg_program.channel
+        rendered_fragment = program.get_rendered_fragment(rendered_fragment_key)
+        if rendered_fragment is not None:
+            return rendered_fragment
 
-        sql_statement = (
-            'SELECT * '
-            'FROM program_match '
-            'WHERE smooth_streams_program_title = :smooth_streams_program_title'
-            '  AND smooth_streams_program_sub_title = :smooth_streams_program_sub_title'
-            '  AND smooth_streams_program_channel = :smooth_streams_program_channel'
-            '  AND smooth_streams_program_start = :smooth_streams_program_start'
-            '  AND smooth_streams_program_stop = :smooth_streams_program_stop'
-            '  AND epg_program_title = :epg_program_title'
-            '  AND epg_program_sub_title = :epg_program_sub_title'
-            '  AND epg_program_channel = :epg_program_channel'
-            '  AND epg_program_start = :epg_program_start'
-            '  AND epg_program_stop = :epg_program_stop'
-        )
+        program_output = []
 
-        records = Database.execute(
-            sql_statement,
-            {
-                'smooth_streams_program_title': smooth_streams_program.titles[0][
-                    'value'
-                ],
-                'smooth_streams_program_sub_title': smooth_streams_program.sub_titles[
-                    0
-                ]['value']
-                if smooth_streams_program.has_sub_titles()
+        program_output.append(
+            '\t<programme start="{0}"{1}{2}{3}{4}{5} channel="{6}"{7}>\n'.format(
+                OutputEncoding.format_date_time(program.start),
+                ' stop="{0}"'.format(OutputEncoding.format_date_time(program.stop))
+                if program.stop is not None
+                else '',
+                ' pdc-start="{0}"'.format(OutputEncoding.escape(program.pdc_start))
+                if program.pdc_start is not None
+                else '',
+                ' vps-start="{0}"'.format(OutputEncoding.escape(program.vps_start))
+                if program.vps_start is not None
+                else '',
+                ' showview="{0}"'.format(OutputEncoding.escape(program.showview))
+                if program.showview is not None
                 else '',
-                'smooth_streams_program_channel': smooth_streams_program.channel,
-                'smooth_streams_program_start': str(smooth_streams_program.start),
-                'smooth_streams_program_stop': str(smooth_streams_program.stop),
-                'epg_program_title': epg_program.titles[0]['value'],
-                'epg_program_sub_title': epg_program.sub_titles[0]['value']
-                if epg_program.has_sub_titles()
+                ' videoplus="{0}"'.format(OutputEncoding.escape(program.videoplus))
+                if program.videoplus is not None
                 else '',
-                'epg_program_channel': cls._channel_id_map[epg_program_channel_id]
-                if epg_program_channel_id in cls._channel_id_map
-                else epg_program_channel_id,
-                'epg_program_start': str(epg_program.start),
-                'epg_program_stop': str(epg_program.stop),
-            },
+                channel.id,
+                ' clumpidx="{0}"'.format(OutputEncoding.escape(program.clumpidx))
+                if program.clumpidx is not None
+                else '',
+            )
         )
 
-        return records
+        if not do_concatenate_sub_title_to_title:
+            for title in program.titles:
+                program_output.append(
+                    '\t\t<title{0}>{1}</title>\n'.format(
+                        ' lang="{0}"'.format(OutputEncoding.escape(title['language']))
+                        if title['language'] is not None
+                        else '',
+                        OutputEncoding.escape(re.sub(r'Live: ', '', title['value'])),
+                    )
+                )
 
-    @classmethod
-    def _read_mc2xml_channel_ids_map(cls, mc2xml_country):
-        cls._mc2xml_channel_ids_map = {}
+            for sub_title in program.sub_titles:
+                program_output.append(
+                    '\t\t<sub-title{0}>{1}</sub-title>\n'.format(
+                        ' lang="{0}"'.format(
+                            OutputEncoding.escape(sub_title['language'])
+                        )
+                        if sub_title['language'] is not None
+                        else '',
+                        OutputEncoding.escape(sub_title['value']),
+                    )
+                )
+        else:
+            if program.has_sub_titles():
+                title = program.titles[0]
+                sub_title = program.sub_titles[0]
+
+                program_output.append(
+                    '\t\t<title{0}>{1}: {2}</title>\n'.format(
+                        ' lang="{0}"'.format(OutputEncoding.escape(title['language']))
+                        if title['language'] is not None
+                        else '',
+                        OutputEncoding.escape(re.sub(r'Live: ', '', title['value'])),
+                        OutputEncoding.escape(sub_title['value']),
+                    )
+                )
+            else:
+                title = program.titles[0]
 
-        for mc2xml_channel_id in (
-            Utility.read_file(
-                os.path.join(
-                    DEFAULT_MC2XML_DIRECTORY_PATH, mc2xml_country, 'mc2xml.chl'
+                program_output.append(
+                    '\t\t<title{0}>{1}</title>\n'.format(
+                        ' lang="{0}"'.format(title['language'])
+                        if title['language'] is not None
+                        else '',
+                        OutputEncoding.escape(re.sub(r'Live: ', '', title['value'])),
+                    )
                 )
-            )
-            .strip()
-            .split('\n')
-        ):
-            if mc2xml_channel_id.strip()[0] != '#':
-                cls._mc2xml_channel_ids_map[mc2xml_channel_id] = False
 
-    @classmethod
-    def _relax_merge_smooth_streams_epg(cls):
-        for channel in cls._smooth_streams_epg.values():
-            logger.debug(
-                'Reconciling channel\nName   => %s\nNumber => %s',
-                channel.display_names[0]['value'],
-                channel.id,
+        for description in program.descriptions:
+            program_output.append(
+                '\t\t<desc{0}>{1}</desc>\n'.format(
+                    ' lang="{0}"'.format(description['language'])
+                    if description['language'] is not None
+                    else '',
+                    OutputEncoding.escape(description['value']),
+                )
             )
 
-            epg_programs = cls._epg[channel.id].programs
-
-            for smooth_streams_program in channel.programs:
-                do_find_best_matching_program = True
-                is_smooth_streams_program_processed = False
-
-                while not is_smooth_streams_program_processed:
-                    for epg_program in cls._epg[channel.id].programs:
-                        if smooth_streams_program.start < epg_program.start:
-                            if smooth_streams_program.stop <= epg_program.start:
-                                if not is_smooth_streams_program_processed:
-                                    if (
-                                        do_find_best_matching_program
-                                        and not cls._is_program_in_the_past(
-                                            smooth_streams_program
-                                        )
-                                        and not cls._is_program_past_date_time_criteria(
-                                            smooth_streams_program
-                                        )
-                                        and not cls._is_program_in_ignored_smooth_streams_program_match_table(
-                                            smooth_streams_program
-                                        )
-                                        and not cls._does_program_match_ignored_smooth_streams_program_pattern(
-                                            smooth_streams_program
-                                        )
-                                    ):
-                                        matching_program = cls._find_best_matching_program(
-                                            smooth_streams_program
-                                        )
+        if do_generate_all_elements:
+            if program.has_credits():
+                program_output.append('\t\t<credits>\n')
 
-                                        if (
-                                            smooth_streams_program
-                                            is not matching_program
-                                        ):
-                                            do_find_best_matching_program = False
-
-                                            if (
-                                                smooth_streams_program.start
-                                                != matching_program.start
-                                                or smooth_streams_program.stop
-                                                != matching_program.stop
-                                            ):
-                                                smooth_streams_program = (
-                                                    matching_program
-                                                )
-
-                                                break
-                                            else:
-                                                smooth_streams_program = (
-                                                    matching_program
-                                                )
-
-                                    logger.debug(
-                                        'No overlap detected\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                    )
+                credits_ = program.credits
+                for director in credits_['directors']:
+                    program_output.append(
+                        '\t\t\t<director>{0}</director>\n'.format(
+                            OutputEncoding.escape(director['value'])
+                        )
+                    )
+                for actor in credits_['actors']:
+                    program_output.append(
+                        '\t\t\t<actor{0}>{1}</actor>\n'.format(
+                            ' role="{0}"'.format(OutputEncoding.escape(actor['role']))
+                            if actor['role'] is not None
+                            else '',
+                            OutputEncoding.escape(actor['value']),
+                        )
+                    )
+                for writer in credits_['writers']:
+                    program_output.append(
+                        '\t\t\t<writer>{0}</writer>\n'.format(
+                            OutputEncoding.escape(writer['value'])
+                        )
+                    )
+                for adapter in credits_['adapters']:
+                    program_output.append(
+                        '\t\t\t<adapter>{0}</adapter>\n'.format(
+                            OutputEncoding.escape(adapter['value'])
+                        )
+                    )
+                for producer in credits_['producers']:
+                    program_output.append(
+                        '\t\t\t<producer>{0}</producer>\n'.format(
+                            OutputEncoding.escape(producer['value'])
+                        )
+                    )
+                for composer in credits_['composers']:
+                    program_output.append(
+                        '\t\t\t<composer>{0}</composer>\n'.format(
+                            OutputEncoding.escape(composer['value'])
+                        )
+                    )
+                for editor in credits_['editors']:
+                    program_output.append(
+                        '\t\t\t<editor>{0}</editor>\n'.format(
+                            OutputEncoding.escape(editor['value'])
+                        )
+                    )
+                for presenter in credits_['presenters']:
+                    program_output.append(
+                        '\t\t\t<presenter>{0}</presenter>\n'.format(
+                            OutputEncoding.escape(presenter['value'])
+                        )
+                    )
+                for commentator in credits_['commentators']:
+                    program_output.append(
+                        '\t\t\t<commentator>{0}</commentator>\n'.format(
+                            OutputEncoding.escape(commentator['value'])
+                        )
+                    )
+                for guest in credits_['guests']:
+                    program_output.append(
+                        '\t\t\t<guest>{0}</guest>\n'.format(
+                            OutputEncoding.escape(guest['value'])
+                        )
+                    )
 
-                                    bisect.insort(epg_programs, smooth_streams_program)
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'No overlap processed\n'
-                                        'SmoothStreams program inserted\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                    )
-                                else:
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Unexpected case #1 detected\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
-                                break
-                            elif smooth_streams_program.stop < epg_program.stop:
-                                if is_smooth_streams_program_processed:
-                                    logger.debug(
-                                        'Overlap continuation detected\n'
-                                        '  Type      => Overflow\n'
-                                        '  Alignment => Start to before stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+                program_output.append('\t\t</credits>\n')
 
-                                    epg_program.start = smooth_streams_program.stop
-
-                                    logger.debug(
-                                        'Overlap continuation processed\n'
-                                        '  Type      => Overflow\n'
-                                        '  Alignment => Start to before stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program modified\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+            if program.date is not None:
+                program_output.append(
+                    '\t\t<date>{0}</date>\n'.format(
+                        OutputEncoding.escape(program.date['value'])
+                    )
+                )
 
-                                    break
-                                else:
-                                    if (
-                                        do_find_best_matching_program
-                                        and not cls._is_program_in_the_past(
-                                            smooth_streams_program
-                                        )
-                                        and not cls._is_program_past_date_time_criteria(
-                                            smooth_streams_program
-                                        )
-                                        and not cls._is_program_in_ignored_smooth_streams_program_match_table(
-                                            smooth_streams_program
-                                        )
-                                        and not cls._does_program_match_ignored_smooth_streams_program_pattern(
-                                            smooth_streams_program
-                                        )
-                                    ):
-                                        matching_program = cls._find_best_matching_program(
-                                            smooth_streams_program
-                                        )
+        for category in program.categories:
+            program_output.append(
+                '\t\t<category{0}>{1}</category>\n'.format(
+                    ' lang="{0}"'.format(OutputEncoding.escape(category['language']))
+                    if category['language'] is not None
+                    else '',
+                    OutputEncoding.escape(category['value']),
+                )
+            )
 
-                                        if (
-                                            smooth_streams_program
-                                            is not matching_program
-                                        ):
-                                            do_find_best_matching_program = False
-
-                                            if (
-                                                smooth_streams_program.start
-                                                != matching_program.start
-                                                or smooth_streams_program.stop
-                                                != matching_program.stop
-                                            ):
-                                                smooth_streams_program = (
-                                                    matching_program
-                                                )
-
-                                                break
-                                            else:
-                                                smooth_streams_program = (
-                                                    matching_program
-                                                )
-
-                                    logger.debug(
-                                        'Overlap detected\n'
-                                        '  Type      => Partial\n'
-                                        '  Alignment => After start to before stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+        if do_generate_all_elements:
+            for keyword in program.keywords:
+                program_output.append(
+                    '\t\t<keyword{0}>{1}</keyword>\n'.format(
+                        ' lang="{0}"'.format(OutputEncoding.escape(keyword['language']))
+                        if keyword['language'] is not None
+                        else '',
+                        OutputEncoding.escape(keyword['value']),
+                    )
+                )
 
-                                    epg_program.start = smooth_streams_program.stop
-                                    bisect.insort(epg_programs, smooth_streams_program)
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Overlap processed\n'
-                                        '  Type      => Partial\n'
-                                        '  Alignment => After start to before stop\n'
-                                        'SmoothStreams program inserted\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program removed\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+            if program.language is not None:
+                program_output.append(
+                    '\t\t<language{0}>{1}</language>\n'.format(
+                        ' lang="{0}"'.format(
+                            OutputEncoding.escape(program.language['language'])
+                        )
+                        if program.language['language'] is not None
+                        else '',
+                        OutputEncoding.escape(program.language['value']),
+                    )
+                )
 
-                                    break
-                            elif smooth_streams_program.stop == epg_program.stop:
-                                if is_smooth_streams_program_processed:
-                                    logger.debug(
-                                        'Overlap continuation detected\n'
-                                        '  Type      => Overflow\n'
-                                        '  Alignment => Start to stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+            if program.original_language is not None:
+                program_output.append(
+                    '\t\t<orig-language{0}>{1}</orig-language>\n'.format(
+                        ' lang="{0}"'.format(
+                            OutputEncoding.escape(program.original_language['language'])
+                        )
+                        if program.original_language['language'] is not None
+                        else '',
+                        OutputEncoding.escape(program.original_language['value']),
+                    )
+                )
 
-                                    epg_programs.remove(epg_program)
-
-                                    logger.debug(
-                                        'Overlap continuation processed\n'
-                                        '  Type      => Overflow\n'
-                                        '  Alignment => Start to stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program removed\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+            if program.length is not None:
+                program_output.append(
+                    '\t\t<length units="{0}">{1}</length>\n'.format(
+                        OutputEncoding.escape(program.length['units']),
+                        OutputEncoding.escape(program.length['value']),
+                    )
+                )
 
-                                    break
-                                else:
-                                    if (
-                                        do_find_best_matching_program
-                                        and not cls._is_program_in_the_past(
-                                            smooth_streams_program
-                                        )
-                                        and not cls._is_program_past_date_time_criteria(
-                                            smooth_streams_program
-                                        )
-                                        and not cls._is_program_in_ignored_smooth_streams_program_match_table(
-                                            smooth_streams_program
-                                        )
-                                        and not cls._does_program_match_ignored_smooth_streams_program_pattern(
-                                            smooth_streams_program
-                                        )
-                                    ):
-                                        matching_program = cls._find_best_matching_program(
-                                            smooth_streams_program
-                                        )
+            for icon in program.icons:
+                program_output.append(
+                    '\t\t<icon {0}src="{1}"{2} />\n'.format(
+                        'height="{0}" '.format(OutputEncoding.escape(icon['height']))
+                        if icon['height'] is not None
+                        else '',
+                        icon['source'],
+                        ' width="{0}"'.format(OutputEncoding.escape(icon['width']))
+                        if icon['width'] is not None
+                        else '',
+                    )
+                )
 
-                                        if (
-                                            smooth_streams_program
-                                            is not matching_program
-                                        ):
-                                            do_find_best_matching_program = False
-
-                                            if (
-                                                smooth_streams_program.start
-                                                != matching_program.start
-                                                or smooth_streams_program.stop
-                                                != matching_program.stop
-                                            ):
-                                                smooth_streams_program = (
-                                                    matching_program
-                                                )
-
-                                                break
-                                            else:
-                                                smooth_streams_program = (
-                                                    matching_program
-                                                )
-
-                                    logger.debug(
-                                        'Overlap detected\n'
-                                        '  Type      => Partial\n'
-                                        '  Alignment => After start to stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+            for url in program.urls:
+                program_output.append(
+                    '\t\t<url>{0}</url>\n'.format(OutputEncoding.escape(url['value']))
+                )
 
-                                    epg_programs.remove(epg_program)
-                                    bisect.insort(epg_programs, smooth_streams_program)
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Overlap processed\n'
-                                        '  Type      => Partial\n'
-                                        '  Alignment => After start to stop\n'
-                                        'SmoothStreams program inserted\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program removed\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+            for country in program.countries:
+                program_output.append(
+                    '\t\t<country{0}>{1}</country>\n'.format(
+                        ' lang="{0}"'.format(OutputEncoding.escape(country['language']))
+                        if country['language'] is not None
+                        else '',
+                        OutputEncoding.escape(country['value']),
+                    )
+                )
 
-                                    break
-                            elif smooth_streams_program.stop > epg_program.stop:
-                                if is_smooth_streams_program_processed:
-                                    logger.debug(
-                                        'Overlap continuation detected\n'
-                                        '  Type      => Overflow\n'
-                                        '  Alignment => Start to stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+            for episode_number in program.episode_numbers:
+                program_output.append(
+                    '\t\t<episode-num{0}>{1}</episode-num>\n'.format(
+                        ' system="{0}"'.format(
+                            OutputEncoding.escape(episode_number['system'])
+                        )
+                        if episode_number['system'] is not None
+                        else '',
+                        OutputEncoding.escape(episode_number['value']),
+                    )
+                )
 
-                                    epg_programs.remove(epg_program)
-
-                                    logger.debug(
-                                        'Overlap continuation processed\n'
-                                        '  Type      => Overflow\n'
-                                        '  Alignment => Start to stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program removed\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
-                                else:
-                                    if (
-                                        do_find_best_matching_program
-                                        and not cls._is_program_in_the_past(
-                                            smooth_streams_program
-                                        )
-                                        and not cls._is_program_past_date_time_criteria(
-                                            smooth_streams_program
-                                        )
-                                        and not cls._is_program_in_ignored_smooth_streams_program_match_table(
-                                            smooth_streams_program
-                                        )
-                                        and not cls._does_program_match_ignored_smooth_streams_program_pattern(
-                                            smooth_streams_program
-                                        )
-                                    ):
-                                        matching_program = cls._find_best_matching_program(
-                                            smooth_streams_program
-                                        )
+            if program.has_video():
+                program_output.append('\t\t<video>\n')
 
-                                        if (
-                                            smooth_streams_program
-                                            is not matching_program
-                                        ):
-                                            do_find_best_matching_program = False
-
-                                            if (
-                                                smooth_streams_program.start
-                                                != matching_program.start
-                                                or smooth_streams_program.stop
-                                                != matching_program.stop
-                                            ):
-                                                smooth_streams_program = (
-                                                    matching_program
-                                                )
-
-                                                break
-                                            else:
-                                                smooth_streams_program = (
-                                                    matching_program
-                                                )
-
-                                    logger.debug(
-                                        'Overlap detected\n'
-                                        '  Type      => Overflow\n'
-                                        '  Alignment => After start to after stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+                video = program.video
+                if video['present'] is not None:
+                    program_output.append(
+                        '\t\t\t<present>{0}</present>\n'.format(
+                            OutputEncoding.escape(video['present']['value'])
+                        )
+                    )
+                if video['colour'] is not None:
+                    program_output.append(
+                        '\t\t\t<colour>{0}</colour>\n'.format(
+                            OutputEncoding.escape(video['colour']['value'])
+                        )
+                    )
+                if video['aspect'] is not None:
+                    program_output.append(
+                        '\t\t\t<aspect>{0}</aspect>\n'.format(
+                            OutputEncoding.escape(video['aspect']['value'])
+                        )
+                    )
+                if video['quality'] is not None:
+                    program_output.append(
+                        '\t\t\t<quality>{0}</quality>\n'.format(
+                            OutputEncoding.escape(video['quality']['value'])
+                        )
+                    )
 
-                                    epg_programs.remove(epg_program)
-                                    bisect.insort(epg_programs, smooth_streams_program)
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Overlap processed\n'
-                                        '  Type      => Overflow\n'
-                                        '  Alignment => After start to after stop\n'
-                                        'SmoothStreams program inserted\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program removed\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+                program_output.append('\t\t</video>\n')
 
-                                    break
-                            else:
-                                is_smooth_streams_program_processed = True
+            if program.has_audio():
+                program_output.append('\t\t<audio>\n')
 
-                                logger.debug(
-                                    'Unexpected case #2 detected\n'
-                                    'Sports program\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
-                                )
+                audio = program.audio
+                if audio['present'] is not None:
+                    program_output.append(
+                        '\t\t\t<present>{0}</present>\n'.format(
+                            OutputEncoding.escape(audio['present']['value'])
+                        )
+                    )
+                if audio['stereo'] is not None:
+                    program_output.append(
+                        '\t\t\t<stereo>{0}</stereo>\n'.format(
+                            OutputEncoding.escape(audio['stereo']['value'])
+                        )
+                    )
 
-                                break
-                        elif smooth_streams_program.start == epg_program.start:
-                            if smooth_streams_program.stop < epg_program.stop:
-                                (
-                                    do_process_overlap,
-                                    matching_program,
-                                ) = cls._do_process_overlap(
-                                    smooth_streams_program,
-                                    epg_program,
-                                    do_find_best_matching_program=do_find_best_matching_program,
-                                    do_check_start_stop_times_alignment=False,
-                                )
+                program_output.append('\t\t</audio>\n')
 
-                                if smooth_streams_program is not matching_program:
-                                    do_find_best_matching_program = False
-
-                                    if (
-                                        smooth_streams_program.start
-                                        != matching_program.start
-                                        or smooth_streams_program.stop
-                                        != matching_program.stop
-                                    ):
-                                        smooth_streams_program = matching_program
-
-                                        break
-                                    else:
-                                        smooth_streams_program = matching_program
-
-                                if smooth_streams_program == epg_program:
-                                    do_process_overlap = False
-
-                                if do_process_overlap:
-                                    logger.debug(
-                                        'Overlap detected\n'
-                                        '  Type      => Partial\n'
-                                        '  Alignment => Start\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+            if program.previously_shown is not None:
+                program_output.append(
+                    '\t\t<previously-shown{0}{1} />\n'.format(
+                        ' start="{0}"'.format(
+                            OutputEncoding.escape(program.previously_shown['start'])
+                        )
+                        if program.previously_shown['start'] is not None
+                        else '',
+                        ' channel="{0}"'.format(
+                            OutputEncoding.escape(program.previously_shown['channel'])
+                        )
+                        if program.previously_shown['channel'] is not None
+                        else '',
+                    )
+                )
 
-                                    epg_program.start = smooth_streams_program.stop
-                                    bisect.insort(epg_programs, smooth_streams_program)
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Overlap processed\n'
-                                        '  Type      => Partial\n'
-                                        '  Alignment => Start\n'
-                                        'SmoothStreams program inserted\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program modified\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
-                                else:
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Overlap skipped\n'
-                                        '  Type      => Partial\n'
-                                        '  Alignment => Start\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+            if program.premiere is not None:
+                program_output.append(
+                    '\t\t<premiere{0}{1}\n'.format(
+                        ' lang="{0}"'.format(
+                            OutputEncoding.escape(program.premiere['language'])
+                        )
+                        if program.premiere['language'] is not None
+                        else '',
+                        ' />'
+                        if program.premiere['value'] is None
+                        else '>{0}</premiere>'.format(
+                            OutputEncoding.escape(program.premiere['value'])
+                        ),
+                    )
+                )
 
-                                break
-                            elif smooth_streams_program.stop == epg_program.stop:
-                                (
-                                    do_process_overlap,
-                                    matching_program,
-                                ) = cls._do_process_overlap(
-                                    smooth_streams_program,
-                                    epg_program,
-                                    do_find_best_matching_program=do_find_best_matching_program,
-                                    do_check_start_stop_times_alignment=False,
-                                )
+            if program.last_chance is not None:
+                program_output.append(
+                    '\t\t<last-chance{0}{1}\n'.format(
+                        ' lang="{0}"'.format(
+                            OutputEncoding.escape(program.last_chance['language'])
+                        )
+                        if program.last_chance['language'] is not None
+                        else '',
+                        ' />'
+                        if program.last_chance['value'] is None
+                        else '>{0}</last-chance>'.format(
+                            OutputEncoding.escape(program.last_chance['value'])
+                        ),
+                    )
+                )
 
-                                if smooth_streams_program is not matching_program:
-                                    do_find_best_matching_program = False
-
-                                    if (
-                                        smooth_streams_program.start
-                                        != matching_program.start
-                                        or smooth_streams_program.stop
-                                        != matching_program.stop
-                                    ):
-                                        smooth_streams_program = matching_program
-
-                                        break
-                                    else:
-                                        smooth_streams_program = matching_program
-
-                                if smooth_streams_program == epg_program:
-                                    do_process_overlap = False
-
-                                if do_process_overlap:
-                                    logger.debug(
-                                        'Overlap detected\n'
-                                        '  Type      => Full\n'
-                                        '  Alignment => Start to stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+            if program.new:
+                program_output.append('\t\t<new />\n')
 
-                                    epg_programs.remove(epg_program)
-                                    bisect.insort(epg_programs, smooth_streams_program)
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Overlap processed\n'
-                                        '  Type      => Full\n'
-                                        '  Alignment => Start to stop\n'
-                                        'SmoothStreams program inserted\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program removed\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
-                                else:
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Overlap skipped\n'
-                                        '  Type      => Full\n'
-                                        '  Alignment => Start to stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+            for subtitles in program.subtitles:
+                program_output.append(
+                    '\t\t<subtitles{0}{1}>\n'.format(
+                        ' type="{0}"'.format(OutputEncoding.escape(subtitles['type']))
+                        if subtitles['type'] is not None
+                        else '',
+                        ' /' if 'language' not in subtitles else '',
+                    )
+                )
 
-                                break
-                            elif smooth_streams_program.stop > epg_program.stop:
-                                (
-                                    do_process_overlap,
-                                    matching_program,
-                                ) = cls._do_process_overlap(
-                                    smooth_streams_program,
-                                    epg_program,
-                                    do_find_best_matching_program=do_find_best_matching_program,
-                                    do_check_start_stop_times_alignment=False,
-                                )
+                if 'language' in subtitles:
+                    program_output.append(
+                        '\t\t\t<language{0}>{1}</language>\n'.format(
+                            ' lang="{0}"'.format(
+                                OutputEncoding.escape(subtitles['language']['language'])
+                            )
+                            if subtitles['language']['language'] is not None
+                            else '',
+                            OutputEncoding.escape(subtitles['language']['value']),
+                        )
+                    )
 
-                                if smooth_streams_program is not matching_program:
-                                    do_find_best_matching_program = False
-
-                                    if (
-                                        smooth_streams_program.start
-                                        != matching_program.start
-                                        or smooth_streams_program.stop
-                                        != matching_program.stop
-                                    ):
-                                        smooth_streams_program = matching_program
-
-                                        break
-                                    else:
-                                        smooth_streams_program = matching_program
-
-                                if smooth_streams_program == epg_program:
-                                    do_process_overlap = False
-
-                                if do_process_overlap:
-                                    logger.debug(
-                                        'Overlap detected\n'
-                                        '  Type      => Overflow\n'
-                                        '  Alignment => Start to after stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+                    program_output.append('\t\t</subtitles>\n')
 
-                                    epg_programs.remove(epg_program)
-                                    bisect.insort(epg_programs, smooth_streams_program)
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Overlap processed\n'
-                                        '  Type      => Overflow\n'
-                                        '  Alignment => Start to after stop\n'
-                                        'SmoothStreams program inserted\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program removed\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
-                                else:
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Overlap skipped\n'
-                                        '  Type      => Overflow\n'
-                                        '  Alignment => Start to after stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+            for rating in program.ratings:
+                program_output.append(
+                    '\t\t<rating{0}>\n'.format(
+                        ' system="{0}"'.format(OutputEncoding.escape(rating['system']))
+                        if rating['system'] is not None
+                        else ''
+                    )
+                )
 
-                                    break
-                        elif smooth_streams_program.start > epg_program.start:
-                            if smooth_streams_program.start >= epg_program.stop:
-                                continue
-                            elif smooth_streams_program.stop < epg_program.stop:
-                                (
-                                    do_process_overlap,
-                                    matching_program,
-                                ) = cls._do_process_overlap(
-                                    smooth_streams_program,
-                                    epg_program,
-                                    do_find_best_matching_program=do_find_best_matching_program,
-                                    do_check_start_stop_times_alignment=False,
-                                )
+                for icon in rating['icons']:
+                    program_output.append(
+                        '\t\t\t<icon {0}src="{1}"{2} />\n'.format(
+                            'height="{0}" '.format(
+                                OutputEncoding.escape(icon['height'])
+                            )
+                            if icon['height'] is not None
+                            else '',
+                            OutputEncoding.escape(icon['source']),
+                            ' width="{0}"'.format(OutputEncoding.escape(icon['width']))
+                            if icon['width'] is not None
+                            else '',
+                        )
+                    )
 
-                                if smooth_streams_program is not matching_program:
-                                    do_find_best_matching_program = False
-
-                                    if (
-                                        smooth_streams_program.start
-                                        != matching_program.start
-                                        or smooth_streams_program.stop
-                                        != matching_program.stop
-                                    ):
-                                        smooth_streams_program = matching_program
-
-                                        break
-                                    else:
-                                        smooth_streams_program = matching_program
-
-                                if smooth_streams_program == epg_program:
-                                    do_process_overlap = False
-
-                                if do_process_overlap:
-                                    logger.debug(
-                                        'Overlap detected\n'
-                                        '  Type      => Partial\n'
-                                        '  Alignment => After start to before stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+                if 'value' in rating:
+                    program_output.append(
+                        '\t\t\t<value>{0}</value>\n'.format(
+                            OutputEncoding.escape(rating['value']['value'])
+                        )
+                    )
 
-                                    new_epg_program = copy.deepcopy(epg_program)
-
-                                    epg_program.stop = smooth_streams_program.start
-                                    bisect.insort(epg_programs, smooth_streams_program)
-                                    is_smooth_streams_program_processed = True
-
-                                    new_epg_program.start = smooth_streams_program.stop
-                                    bisect.insort(epg_programs, new_epg_program)
-
-                                    logger.debug(
-                                        'Overlap processed\n'
-                                        '  Type      => Partial\n'
-                                        '  Alignment => After start to before stop\n'
-                                        'SmoothStreams program inserted\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program modified\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program inserted\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                        new_epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            new_epg_program.sub_titles[0]['value']
-                                        )
-                                        if new_epg_program.sub_titles
-                                        else '',
-                                        new_epg_program.start,
-                                        new_epg_program.stop,
-                                    )
-                                else:
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Overlap skipped\n'
-                                        '  Type      => Partial\n'
-                                        '  Alignment => After start to before stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+                program_output.append('\t\t</rating>\n')
 
-                                break
-                            elif smooth_streams_program.stop == epg_program.stop:
-                                (
-                                    do_process_overlap,
-                                    matching_program,
-                                ) = cls._do_process_overlap(
-                                    smooth_streams_program,
-                                    epg_program,
-                                    do_find_best_matching_program=do_find_best_matching_program,
-                                    do_check_start_stop_times_alignment=False,
-                                )
+            for star_rating in program.star_ratings:
+                program_output.append(
+                    '\t\t<star-rating{0}>\n'.format(
+                        ' system="{0}"'.format(
+                            OutputEncoding.escape(star_rating['system'])
+                        )
+                        if star_rating['system'] is not None
+                        else ''
+                    )
+                )
 
-                                if smooth_streams_program is not matching_program:
-                                    do_find_best_matching_program = False
-
-                                    if (
-                                        smooth_streams_program.start
-                                        != matching_program.start
-                                        or smooth_streams_program.stop
-                                        != matching_program.stop
-                                    ):
-                                        smooth_streams_program = matching_program
-
-                                        break
-                                    else:
-                                        smooth_streams_program = matching_program
-
-                                if smooth_streams_program == epg_program:
-                                    do_process_overlap = False
-
-                                if do_process_overlap:
-                                    logger.debug(
-                                        'Overlap detected\n'
-                                        '  Type      => Partial\n'
-                                        '  Alignment => After start to stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+                for icon in star_rating['icons']:
+                    program_output.append(
+                        '\t\t\t<icon {0}src="{1}"{2} />\n'.format(
+                            'height="{0}" '.format(
+                                OutputEncoding.escape(icon['height'])
+                            )
+                            if icon['height'] is not None
+                            else '',
+                            OutputEncoding.escape(icon['source']),
+                            ' width="{0}"'.format(OutputEncoding.escape(icon['width']))
+                            if icon['width'] is not None
+                            else '',
+                        )
+                    )
 
-                                    epg_program.stop = smooth_streams_program.start
-                                    bisect.insort(epg_programs, smooth_streams_program)
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Overlap processed\n'
-                                        '  Type      => Partial\n'
-                                        '  Alignment => After start to stop\n'
-                                        'SmoothStreams program inserted\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program modified\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
-                                else:
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Overlap skipped\n'
-                                        '  Type      => Partial\n'
-                                        '  Alignment => After start to stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+                if 'value' in star_rating:
+                    program_output.append(
+                        '\t\t\t<value>{0}</value>\n'.format(
+                            OutputEncoding.escape(star_rating['value']['value'])
+                        )
+                    )
 
-                                break
-                            elif smooth_streams_program.stop > epg_program.stop:
-                                (
-                                    do_process_overlap,
-                                    matching_program,
-                                ) = cls._do_process_overlap(
-                                    smooth_streams_program,
-                                    epg_program,
-                                    do_find_best_matching_program=do_find_best_matching_program,
-                                    do_check_start_stop_times_alignment=False,
-                                )
+                program_output.append('\t\t</star-rating>\n')
 
-                                if smooth_streams_program is not matching_program:
-                                    do_find_best_matching_program = False
-
-                                    if (
-                                        smooth_streams_program.start
-                                        != matching_program.start
-                                        or smooth_streams_program.stop
-                                        != matching_program.stop
-                                    ):
-                                        smooth_streams_program = matching_program
-
-                                        break
-                                    else:
-                                        smooth_streams_program = matching_program
-
-                                if smooth_streams_program == epg_program:
-                                    do_process_overlap = False
-
-                                if do_process_overlap:
-                                    logger.debug(
-                                        'Overlap detected\n'
-                                        '  Type      => Overflow\n'
-                                        '  Alignment => After start to after stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+            for review in program.reviews:
+                program_output.append(
+                    '\t\t<review type="{0}"{1}{2}{3}>{4}</review>\n'.format(
+                        OutputEncoding.escape(review['type']),
+                        ' source="{0}"'.format(OutputEncoding.escape(review['source']))
+                        if review['source'] is not None
+                        else '',
+                        ' reviewer="{0}"'.format(
+                            OutputEncoding.escape(review['reviewer'])
+                        )
+                        if review['reviewer'] is not None
+                        else '',
+                        ' lang="{0}"'.format(OutputEncoding.escape(review['language']))
+                        if review['language'] is not None
+                        else '',
+                        OutputEncoding.escape(review['value']),
+                    )
+                )
 
-                                    epg_program.stop = smooth_streams_program.start
-                                    bisect.insort(epg_programs, smooth_streams_program)
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Overlap processed\n'
-                                        '  Type      => Overflow\n'
-                                        '  Alignment => After start to after stop\n'
-                                        'SmoothStreams program inserted\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program modified\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
-                                else:
-                                    is_smooth_streams_program_processed = True
-
-                                    logger.debug(
-                                        'Overlap skipped\n'
-                                        '  Type      => Overflow\n'
-                                        '  Alignment => After start to after stop\n'
-                                        'Sports program\n'
-                                        '  Title     => %s\n'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s\n'
-                                        'EPG program\n'
-                                        '  Title     => %s\n'
-                                        '%s'
-                                        '  Start     => %s\n'
-                                        '  Stop      => %s',
-                                        smooth_streams_program.titles[0]['value'],
-                                        smooth_streams_program.start,
-                                        smooth_streams_program.stop,
-                                        epg_program.titles[0]['value'],
-                                        '  Sub-Title => {0}\n'.format(
-                                            epg_program.sub_titles[0]['value']
-                                        )
-                                        if epg_program.sub_titles
-                                        else '',
-                                        epg_program.start,
-                                        epg_program.stop,
-                                    )
+        program_output.append('\t</programme>\n')
 
-                                    break
-                            else:
-                                logger.debug(
-                                    'Unexpected case #3 detected\n'
-                                    'Sports program\n'
-                                    '  Title     => %s\n'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s\n'
-                                    'EPG program\n'
-                                    '  Title     => %s\n'
-                                    '%s'
-                                    '  Start     => %s\n'
-                                    '  Stop      => %s',
-                                    smooth_streams_program.titles[0]['value'],
-                                    smooth_streams_program.start,
-                                    smooth_streams_program.stop,
-                                    epg_program.titles[0]['value'],
-                                    '  Sub-Title => {0}\n'.format(
-                                        epg_program.sub_titles[0]['value']
-                                    )
-                                    if epg_program.sub_titles
-                                    else '',
-                                    epg_program.start,
-                                    epg_program.stop,
-                                )
-                    else:
-                        if not is_smooth_streams_program_processed:
-                            if (
-                                do_find_best_matching_program
-                                and not cls._is_program_in_the_past(
-                                    smooth_streams_program
-                                )
-                                and not cls._is_program_past_date_time_criteria(
-                                    smooth_streams_program
-                                )
-                                and not cls._is_program_in_ignored_smooth_streams_program_match_table(
-                                    smooth_streams_program
-                                )
-                                and not cls._does_program_match_ignored_smooth_streams_program_pattern(
-                                    smooth_streams_program
-                                )
-                            ):
-                                matching_program = cls._find_best_matching_program(
-                                    smooth_streams_program
-                                )
+        rendered_fragment = ''.join(program_output)
+        program.set_rendered_fragment(rendered_fragment_key, rendered_fragment)
 
-                                if smooth_streams_program is not matching_program:
-                                    do_find_best_matching_program = True
+        return rendered_fragment
 
-                                    smooth_streams_program = matching_program
+    @classmethod
+    def _render_epg_program_json(cls, channel, program):
+        rendered_fragment_key = (channel.id, 'ndjson')
 
-                            bisect.insort(epg_programs, smooth_streams_program)
-                            is_smooth_streams_program_processed = True
+        rendered_fragment = program.get_rendered_fragment(rendered_fragment_key)
+        if rendered_fragment is not None:
+            return rendered_fragment
 
-                            logger.debug(
-                                'No overlap detected\n'
-                                'SmoothStreams program inserted\n'
-                                '  Title     => %s\n'
-                                '  Start     => %s\n'
-                                '  Stop      => %s',
-                                smooth_streams_program.titles[0]['value'],
-                                smooth_streams_program.start,
-                                smooth_streams_program.stop,
-                            )
+        rendered_fragment = '{0}\n'.format(
+            json.dumps(
+                {
+                    'categories': [
+                        category['value'] for category in program.categories
+                    ],
+                    'channel': channel.id,
+                    'description': program.descriptions[0]['value']
+                    if program.descriptions
+                    else None,
+                    'episode_numbers': [
+                        {
+                            'system': episode_number['system'],
+                            'value': episode_number['value'],
+                        }
+                        for episode_number in program.episode_numbers
+                    ],
+                    'icon': program.icons[0]['source'] if program.icons else None,
+                    'new': bool(program.new),
+                    'start': Utility.convert_date_time_to_epoch(program.start),
+                    'stop': Utility.convert_date_time_to_epoch(program.stop),
+                    'sub_title': program.sub_titles[0]['value']
+                    if program.sub_titles
+                    else None,
+                    'title': re.sub(r'Live: ', '', program.titles[0]['value'])
+                    if program.titles
+                    else None,
+                },
+                ensure_ascii=False,
+                separators=(',', ':'),
+                sort_keys=True,
+            )
+        )
+        program.set_rendered_fragment(rendered_fragment_key, rendered_fragment)
 
-                cls._epg[channel.id].programs = epg_programs
+        return rendered_fragment
 
     @classmethod
     def _request_epg_xml(cls, epg_base_url, epg_file_name):
@@ -4561,6 +4955,29 @@ class EPG(object):
 
             response.raise_for_status()
 
+    @classmethod
+    def _reset(cls):
+        cls._categories_map = {}
+        cls._epg = {}
+        cls._generate_epgs_futures = []
+        cls._generate_epgs_process_pool_executor = None
+        cls._latest_date_time_epg_xml = None
+        cls._mc2xml_channel_ids_map = {}
+        cls._parsed_programs_map = {}
+        cls._smooth_streams_epg = {}
+
+    @classmethod
+    def _run_merge_channel(cls, merge_channel, channel):
+        merge_start_time = time.monotonic()
+
+        merge_channel(channel)
+
+        MergeStatistics.record_channel_merge_time(
+            channel.id,
+            channel.display_names[0]['value'],
+            time.monotonic() - merge_start_time,
+        )
+
     @classmethod
     def _update_categories_map(cls, smooth_streams_program, epg_program):
         if ': ' in smooth_streams_program.titles[0]['value']:
@@ -4569,111 +4986,33 @@ class EPG(object):
             ]
             epg_program_title = re.sub(r'\A.*:\s+', '', epg_program.titles[0]['value'])
 
-            if (
-                smooth_streams_program_category in cls._categories_map
-                and epg_program_title
-                in cls._categories_map[smooth_streams_program_category]
-            ):
-                cls._categories_map[smooth_streams_program_category][
-                    epg_program_title
-                ] += 1
+            if cls._deferred_categories_map_updates is not None:
+                cls._deferred_categories_map_updates.append(
+                    (smooth_streams_program_category, epg_program_title)
+                )
             else:
-                cls._categories_map[smooth_streams_program_category] = {
-                    epg_program_title: 1
-                }
+                cls._apply_categories_map_update(
+                    smooth_streams_program_category, epg_program_title
+                )
 
     @classmethod
     def _update_program_match_table(cls, smooth_streams_program, epg_program):
-        regular_expression_match = re.search(
-            r'I[0-9]+.[0-9]+(.[0-9]+)?', epg_program.channel
-        )
-        if regular_expression_match is not None:
-            epg_program_channel_id = regular_expression_match.group(0)
-        else:
-            epg_program_channel_id = epg_program.channel
-
         sql_statement = (
             'UPDATE program_match '
-            'SET date_time_of_last_match = :date_time_of_last_match, '
-            'number_of_occurrences = number_of_occurrences + 1 '
-            'WHERE smooth_streams_program_title = :smooth_streams_program_title'
-            '  AND smooth_streams_program_sub_title = :smooth_streams_program_sub_title'
-            '  AND smooth_streams_program_channel = :smooth_streams_program_channel'
-            '  AND smooth_streams_program_start = :smooth_streams_program_start'
-            '  AND smooth_streams_program_stop = :smooth_streams_program_stop'
-            '  AND epg_program_title = :epg_program_title'
-            '  AND epg_program_sub_title = :epg_program_sub_title'
-            '  AND epg_program_channel = :epg_program_channel'
-            '  AND epg_program_start = :epg_program_start'
-            '  AND epg_program_stop = :epg_program_stop'
-        )
-
-        Database.execute(
-            sql_statement,
-            {
-                'date_time_of_last_match': str(
-                    datetime.now(pytz.utc).replace(microsecond=0)
-                ),
-                'smooth_streams_program_title': smooth_streams_program.titles[0][
-                    'value'
-                ],
-                'smooth_streams_program_sub_title': smooth_streams_program.sub_titles[
-                    0
-                ]['value']
-                if smooth_streams_program.has_sub_titles()
-                else '',
-                'smooth_streams_program_channel': smooth_streams_program.channel,
-                'smooth_streams_program_start': str(smooth_streams_program.start),
-                'smooth_streams_program_stop': str(smooth_streams_program.stop),
-                'epg_program_title': epg_program.titles[0]['value'],
-                'epg_program_sub_title': epg_program.sub_titles[0]['value']
-                if epg_program.has_sub_titles()
-                else '',
-                'epg_program_channel': cls._channel_id_map[epg_program_channel_id]
-                if epg_program_channel_id in cls._channel_id_map
-                else epg_program_channel_id,
-                'epg_program_start': str(epg_program.start),
-                'epg_program_stop': str(epg_program.stop),
-            },
-        )
-
-        Database.commit()
-
-    @classmethod
-    def _update_failed_program_match_table(cls, smooth_streams_program):
-        sql_statement = (
-            'UPDATE failed_program_match '
-            'SET date_time_of_last_failure = :date_time_of_last_failure, '
+            'SET date_time_of_last_match = CAST(strftime(\'%s\', \'now\') AS INTEGER), '
             'number_of_occurrences = number_of_occurrences + 1 '
-            'WHERE smooth_streams_program_title = :smooth_streams_program_title'
-            '  AND smooth_streams_program_sub_title = :smooth_streams_program_sub_title'
-            '  AND smooth_streams_program_channel = :smooth_streams_program_channel'
-            '  AND smooth_streams_program_start = :smooth_streams_program_start'
-            '  AND smooth_streams_program_stop = :smooth_streams_program_stop'
+            'WHERE program_match_key = :program_match_key'
         )
 
-        Database.execute(
+        Database.submit(
             sql_statement,
             {
-                'date_time_of_last_failure': str(
-                    datetime.now(pytz.utc).replace(microsecond=0)
-                ),
-                'smooth_streams_program_title': smooth_streams_program.titles[0][
-                    'value'
-                ],
-                'smooth_streams_program_sub_title': smooth_streams_program.sub_titles[
-                    0
-                ]['value']
-                if smooth_streams_program.has_sub_titles()
-                else '',
-                'smooth_streams_program_channel': smooth_streams_program.channel,
-                'smooth_streams_program_start': str(smooth_streams_program.start),
-                'smooth_streams_program_stop': str(smooth_streams_program.stop),
+                'program_match_key': cls._create_program_match_identity(
+                    smooth_streams_program, epg_program
+                )['program_match_key'],
             },
         )
 
-        Database.commit()
-
     @classmethod
     def _validate_source_channels(cls):
         smooth_streams_channels_with_source = cls._channel_id_map.values()
@@ -4706,10 +5045,194 @@ class EPG(object):
                 logger.error(error)
                 Error.add_error(error)
 
+    @classmethod
+    def _wait_for_generated_epgs(cls):
+        try:
+            for future in cls._generate_epgs_futures:
+                (published_files, manifest) = future.result()
+
+                OutputManifest.attach(manifest)
+
+                cls._compress_epgs(published_files)
+        finally:
+            cls._generate_epgs_futures = []
+
+            if cls._generate_epgs_process_pool_executor is not None:
+                cls._generate_epgs_process_pool_executor.shutdown(wait=True)
+                cls._generate_epgs_process_pool_executor = None
+
+    @classmethod
+    def _write_epgs(
+        cls, output_directory_path, is_forced, do_generate_all_elements_values
+    ):
+        numbers_of_days = sorted(DEFAULT_OUTPUT_XMLTV_NUMBER_OF_DAYS)
+        startup_date_in_utc = cls._startup_date_time_in_utc.replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        cutoff_date_times_in_utc = [
+            startup_date_in_utc + timedelta(days=number_of_days + 1)
+            for number_of_days in numbers_of_days
+        ]
+
+        is_splitting = Configuration.get_configuration_parameter('OUTPUT_SPLIT')
+
+        output_writers = [
+            OutputXMLTVWriter(
+                output_directory_path,
+                is_forced,
+                do_generate_all_elements_values,
+                numbers_of_days,
+                is_indexing=is_splitting,
+            )
+        ]
+
+        if is_splitting:
+            output_writers.append(
+                OutputSplitWriter(
+                    output_directory_path,
+                    is_forced,
+                    do_generate_all_elements_values,
+                    [
+                        (startup_date_in_utc + timedelta(days=day_offset)).strftime(
+                            '%Y%m%d'
+                        )
+                        for day_offset in range(numbers_of_days[-1] + 1)
+                    ],
+                )
+            )
+
+        if True in do_generate_all_elements_values:
+            if Configuration.get_configuration_parameter('OUTPUT_EXPORT'):
+                output_writers.append(
+                    OutputExportWriter(
+                        output_directory_path, is_forced, cls._render_epg_program_json,
+                    )
+                )
+
+            if Configuration.get_configuration_parameter('OUTPUT_DELTA'):
+                output_writers.append(
+                    OutputDeltaWriter(
+                        output_directory_path,
+                        is_forced,
+                        cls._startup_date_time_in_utc,
+                        cls._render_epg_program_json,
+                    )
+                )
+
+        output_files = [
+            output_file
+            for output_writer in output_writers
+            for output_file in output_writer.output_files
+        ]
+
+        Privilege.become_privileged_user()
+        try:
+            for output_file in output_files:
+                output_file.open()
+        except OSError:
+            for output_file in output_files:
+                output_file.discard()
+
+            raise
+        finally:
+            Privilege.become_unprivileged_user()
+
+        published_files = []
+
+        try:
+            for output_writer in output_writers:
+                output_writer.write_header()
+
+            for channel in cls._epg.values():
+                channel_output = cls._render_epg_channel(channel)
+
+                for output_writer in output_writers:
+                    output_writer.write_channel(channel, channel_output)
+
+            for channel in cls._epg.values():
+                for program in channel.programs:
+                    if cls._startup_date_time_in_utc >= program.stop:
+                        continue
+
+                    program_numbers_of_days = [
+                        number_of_days
+                        for (number_of_days, cutoff_date_time_in_utc) in zip(
+                            numbers_of_days, cutoff_date_times_in_utc
+                        )
+                        if cutoff_date_time_in_utc > program.start
+                    ]
+                    if not program_numbers_of_days:
+                        continue
+
+                    program_day = (
+                        max(program.start, startup_date_in_utc).strftime('%Y%m%d')
+                        if is_splitting
+                        else None
+                    )
+                    program_outputs = {
+                        do_generate_all_elements: cls._render_epg_program(
+                            channel,
+                            program,
+                            do_concatenate_sub_title_to_title=not do_generate_all_elements,
+                            do_generate_all_elements=do_generate_all_elements,
+                        )
+                        for do_generate_all_elements in do_generate_all_elements_values
+                    }
+
+                    for output_writer in output_writers:
+                        output_writer.write_program(
+                            channel,
+                            program,
+                            program_day,
+                            program_numbers_of_days,
+                            program_outputs,
+                        )
+
+                for output_writer in output_writers:
+                    published_files.extend(output_writer.end_channel(channel))
+
+            for output_writer in output_writers:
+                output_writer.write_footer()
+        except Exception:
+            Privilege.become_privileged_user()
+            for output_file in output_files:
+                output_file.discard()
+            Privilege.become_unprivileged_user()
+
+            raise
+
+        Privilege.become_privileged_user()
+        try:
+            for output_file in output_files:
+                published_files.append((output_file.file_path, output_file.close()))
+        finally:
+            Privilege.become_unprivileged_user()
+
+        for output_writer in output_writers:
+            output_writer.publish()
+
+        return published_files
+
+    @classmethod
+    def _write_epgs_in_worker(
+        cls, output_directory_path, is_forced, do_generate_all_elements_values
+    ):
+        OutputManifest.detach()
+
+        published_files = cls._write_epgs(
+            output_directory_path, is_forced, do_generate_all_elements_values
+        )
+
+        return (published_files, OutputManifest.detach())
+
     @classmethod
     def generate_epg(cls, output_directory_path, do_backup_output_xmltv_files):
+        cls._reset()
+
         cls._startup_date_time_in_utc = datetime.now(pytz.utc).replace(microsecond=0)
 
+        MergeStatistics.reset()
+
         logger.info(
             'Parsing default SmoothStreams channel map\nFile path => %s',
             DEFAULT_CHANNEL_MAP_FILE_PATH,
@@ -4743,12 +5266,26 @@ class EPG(object):
         if do_backup_output_xmltv_files:
             Utility.backup_epgs(output_directory_path)
 
+        OutputManifest.load(output_directory_path)
+        OutputCompressor.start(
+            Configuration.get_configuration_parameter('OUTPUT_COMPRESSION')
+        )
+
         cls._relax_merge_smooth_streams_epg()
         cls._generate_epgs(output_directory_path, is_forced=False)
 
         cls._force_merge_smooth_streams_epg()
         cls._generate_epgs(output_directory_path, is_forced=True)
 
+        cls._wait_for_generated_epgs()
+
+        Privilege.become_privileged_user()
+        try:
+            OutputCompressor.wait()
+            OutputManifest.save()
+        finally:
+            Privilege.become_unprivileged_user()
+
         for smooth_streams_category in cls._categories_map:
             for epg_category in cls._categories_map[smooth_streams_category]:
                 if cls._categories_map[smooth_streams_category][epg_category] > 3:
@@ -4756,7 +5293,9 @@ class EPG(object):
                         smooth_streams_category, epg_category
                     )
 
-        cls._purge_db_tables()
+        DatabaseMaintenance.run(cls._startup_date_time_in_utc)
+
+        MergeStatistics.log_summary()
 
 
 class EPGChannel(object):
@@ -4781,9 +5320,15 @@ class EPGChannel(object):
     def add_url(self, url):
         self._urls.append(url)
 
+    def bisect_programs(self, program, lo=0):
+        return bisect.bisect_left(self._programs, program, lo=lo)
+
     def remove_program(self, program):
         self._programs.remove(program)
 
+    def remove_programs(self, start_index, stop_index):
+        del self._programs[start_index:stop_index]
+
     @property
     def id(self):
         return self._id
@@ -4794,7 +5339,7 @@ class EPGChannel(object):
 
     @property
     def display_names(self):
-        return copy.copy(self._display_names)
+        return EPGSequenceView(self._display_names)
 
     @display_names.setter
     def display_names(self, display_names):
@@ -4802,7 +5347,7 @@ class EPGChannel(object):
 
     @property
     def icons(self):
-        return copy.copy(self._icons)
+        return EPGSequenceView(self._icons)
 
     @icons.setter
     def icons(self, icons):
@@ -4810,7 +5355,7 @@ class EPGChannel(object):
 
     @property
     def programs(self):
-        return copy.copy(self._programs)
+        return EPGSequenceView(self._programs)
 
     @programs.setter
     def programs(self, programs):
@@ -4818,7 +5363,7 @@ class EPGChannel(object):
 
     @property
     def urls(self):
-        return copy.copy(self._urls)
+        return EPGSequenceView(self._urls)
 
     @urls.setter
     def urls(self, urls):
@@ -4847,6 +5392,7 @@ class EPGProgram(object):
         '_premiere',
         '_previously_shown',
         '_ratings',
+        '_rendered_fragments',
         '_reviews',
         '_showview',
         '_star_ratings',
@@ -4874,6 +5420,13 @@ class EPGProgram(object):
             and self._stop == other._stop
         )
 
+    def __getstate__(self):
+        return {
+            slot: getattr(self, slot)
+            for slot in self.__slots__
+            if slot != '_rendered_fragments'
+        }
+
     def __init__(self):
         self._audio = {'present': None, 'stereo': None}
         self._categories = []
@@ -4906,6 +5459,7 @@ class EPGProgram(object):
         self._premiere = None
         self._previously_shown = None
         self._ratings = []
+        self._rendered_fragments = {}
         self._reviews = []
         self._showview = None
         self._star_ratings = []
@@ -4922,6 +5476,12 @@ class EPGProgram(object):
     def __lt__(self, other):
         return self.start < other.start
 
+    def __setstate__(self, state):
+        for (slot, value) in state.items():
+            setattr(self, slot, value)
+
+        self._rendered_fragments = {}
+
     def add_category(self, category):
         self._categories.append(category)
 
@@ -4991,6 +5551,45 @@ class EPGProgram(object):
     def add_url(self, url):
         self._urls.append(url)
 
+    def get_fingerprint_fields(self):
+        return {
+            'audio': self._audio,
+            'categories': self._categories,
+            'channel': self._channel,
+            'clumpidx': self._clumpidx,
+            'countries': self._countries,
+            'credits': self._credits,
+            'date': self._date,
+            'descriptions': self._descriptions,
+            'episode_numbers': self._episode_numbers,
+            'icons': self._icons,
+            'keywords': self._keywords,
+            'language': self._language,
+            'last_chance': self._last_chance,
+            'length': self._length,
+            'new': self._new,
+            'original_language': self._original_language,
+            'pdc_start': self._pdc_start,
+            'premiere': self._premiere,
+            'previously_shown': self._previously_shown,
+            'ratings': self._ratings,
+            'reviews': self._reviews,
+            'showview': self._showview,
+            'star_ratings': self._star_ratings,
+            'start': Utility.convert_date_time_to_epoch(self._start),
+            'stop': Utility.convert_date_time_to_epoch(self._stop),
+            'sub_titles': self._sub_titles,
+            'subtitles': self._subtitles,
+            'titles': self._titles,
+            'urls': self._urls,
+            'video': self._video,
+            'videoplus': self._videoplus,
+            'vps_start': self._vps_start,
+        }
+
+    def get_rendered_fragment(self, key):
+        return self._rendered_fragments.get(key)
+
     def has_audio(self):
         if self._audio['present'] is not None or self._audio['stereo'] is not None:
             return True
@@ -5037,6 +5636,21 @@ class EPGProgram(object):
 
         return False
 
+    def retime(self, start, stop):
+        retimed_program = EPGProgram.__new__(EPGProgram)
+
+        for slot in EPGProgram.__slots__:
+            setattr(retimed_program, slot, getattr(self, slot))
+
+        retimed_program._rendered_fragments = {}
+        retimed_program._start = start
+        retimed_program._stop = stop
+
+        return retimed_program
+
+    def set_rendered_fragment(self, key, rendered_fragment):
+        self._rendered_fragments[key] = rendered_fragment
+
     @property
     def audio(self):
         return copy.copy(self._audio)
@@ -5244,6 +5858,7 @@ class EPGProgram(object):
     @start.setter
     def start(self, start):
         self._start = start
+        self._rendered_fragments = {}
 
     @property
     def stop(self):
@@ -5252,6 +5867,7 @@ class EPGProgram(object):
     @stop.setter
     def stop(self, stop):
         self._stop = stop
+        self._rendered_fragments = {}
 
     @property
     def sub_titles(self):
@@ -5340,3 +5956,101 @@ class EPGProgram(object):
     @vps_start.setter
     def vps_start(self, vps_start):
         self._vps_start = vps_start
+
+
+class EPGProgramIntervalIndex(object):
+    __slots__ = ['_channel', '_maximum_program_duration']
+
+    def __init__(self, channel):
+        self._channel = channel
+        self._maximum_program_duration = max(
+            [program.stop - program.start for program in channel.programs],
+            default=timedelta(0),
+        )
+
+    def _bisect(self, date_time, lo=0):
+        probe_program = EPGProgram()
+        probe_program.start = date_time
+
+        return self._channel.bisect_programs(probe_program, lo=lo)
+
+    def find_programs_in_range(self, start, stop):
+        start_index = self._bisect(start - self._maximum_program_duration)
+        stop_index = self._bisect(stop, lo=start_index)
+
+        return self._channel.programs[start_index : stop_index + 1]
+
+    def insert(self, program):
+        self._channel.add_program(program)
+
+        self._maximum_program_duration = max(
+            self._maximum_program_duration, program.stop - program.start
+        )
+
+    def remove(self, program):
+        programs = self._channel.programs
+        index = self._bisect(program.start)
+
+        while index < len(programs) and programs[index].start == program.start:
+            if programs[index] is program:
+                self._channel.remove_programs(index, index + 1)
+
+                return
+
+            index += 1
+
+        self._channel.remove_program(program)
+
+    def split(self, program, start, stop):
+        new_program = program.retime(stop, program.stop)
+
+        program.stop = start
+
+        self.insert(new_program)
+
+        return new_program
+
+    def trim_start(self, program, start):
+        self.remove(program)
+
+        program.start = start
+        self.insert(program)
+
+    def trim_stop(self, program, stop):
+        program.stop = stop
+
+
+class EPGProgramIntervalSnapshot(object):
+    __slots__ = ['_maximum_program_duration', '_programs', '_starts']
+
+    def __init__(self, programs):
+        self._programs = list(programs)
+        self._starts = [program.start for program in self._programs]
+        self._maximum_program_duration = max(
+            [program.stop - program.start for program in self._programs],
+            default=timedelta(0),
+        )
+
+    def find_programs_in_range(self, start, stop):
+        start_index = bisect.bisect_left(
+            self._starts, start - self._maximum_program_duration
+        )
+        stop_index = bisect.bisect_left(self._starts, stop, lo=start_index)
+
+        return self._programs[start_index : stop_index + 1]
+
+
+class EPGSequenceView(Sequence):
+    __slots__ = ['_sequence']
+
+    def __init__(self, sequence):
+        self._sequence = sequence
+
+    def __getitem__(self, index):
+        return self._sequence[index]
+
+    def __iter__(self):
+        return iter(self._sequence)
+
+    def __len__(self):
+        return len(self._sequence)
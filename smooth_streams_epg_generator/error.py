@@ -23,3 +23,7 @@ class Error(object):
             return True
 
         return False
+
+    @classmethod
+    def reset(cls):
+        cls._errors = []
@@ -1,5 +1,6 @@
 import logging
 import sys
+import time
 import traceback
 
 from .configuration import Configuration
@@ -13,11 +14,79 @@ from .notification import Notifier
 from .privilege import Privilege
 from .rovi import Rovi
 from .schedules_direct import SchedulesDirect
+from .server import Server
 from .utilities import Utility
 
 logger = logging.getLogger(__name__)
 
 
+def _generate_epg(
+    database_file_path, output_directory_path, do_backup_output_xmltv_files
+):
+    Database.open_connection(database_file_path)
+
+    try:
+        Rovi.generate_xmltv_files()
+        SchedulesDirect.generate_xmltv_files()
+
+        EPG.generate_epg(output_directory_path, do_backup_output_xmltv_files)
+
+        Database.stop_writer()
+        Database.commit()
+    except Exception:
+        Database.stop_writer()
+        Database.rollback()
+        Database.close_connection(do_persist=False)
+
+        raise
+
+    Database.close_connection()
+
+
+def _notify_errors():
+    if (
+        Configuration.get_configuration_parameter('GMAIL_ENABLED')
+        and Error.has_errors()
+    ):
+        Notifier.send_email('\n{0}\n'.format('*' * 120).join(Error.get_errors()))
+
+
+def _serve_epg(database_file_path, output_directory_path, do_backup_output_xmltv_files):
+    Server.start(
+        output_directory_path,
+        Configuration.get_configuration_parameter('SERVER_ADDRESS'),
+        Configuration.get_configuration_parameter('SERVER_PORT'),
+    )
+
+    try:
+        while True:
+            try:
+                _generate_epg(
+                    database_file_path,
+                    output_directory_path,
+                    do_backup_output_xmltv_files,
+                )
+            except Exception:
+                (type_, value_, traceback_) = sys.exc_info()
+                error = '\n'.join(traceback.format_exception(type_, value_, traceback_))
+
+                logger.error(error)
+                Error.add_error(error)
+            finally:
+                _notify_errors()
+                Error.reset()
+
+            Server.reload()
+
+            time.sleep(
+                Configuration.get_configuration_parameter('SERVER_GENERATION_INTERVAL')
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        Server.stop()
+
+
 def main():
     try:
         Privilege.initialize()
@@ -29,6 +98,7 @@ def main():
             database_file_path,
             log_file_path,
             output_directory_path,
+            do_serve_output_xmltv_files,
         ) = Utility.parse_command_line_arguments()
 
         Log.initialize_logging(log_file_path)
@@ -46,21 +116,22 @@ def main():
             output_directory_path,
         )
 
-        Configuration.read_configuration_file(configuration_file_path)
+        Configuration.read_configuration_file(
+            configuration_file_path, do_serve_output_xmltv_files
+        )
         Log.set_logging_level(
             LOGGING_MAP[
                 Configuration.get_configuration_parameter('LOGGING_LEVEL').upper()
             ]
         )
-        Database.open_connection(database_file_path)
-
-        Rovi.generate_xmltv_files()
-        SchedulesDirect.generate_xmltv_files()
-
-        EPG.generate_epg(output_directory_path, do_backup_output_xmltv_files)
-
-        Database.commit()
-        Database.close_connection()
+        if do_serve_output_xmltv_files:
+            _serve_epg(
+                database_file_path, output_directory_path, do_backup_output_xmltv_files
+            )
+        else:
+            _generate_epg(
+                database_file_path, output_directory_path, do_backup_output_xmltv_files
+            )
     except Exception:
         (type_, value_, traceback_) = sys.exc_info()
         error = '\n'.join(traceback.format_exception(type_, value_, traceback_))
@@ -68,10 +139,6 @@ def main():
         logger.error(error)
         Error.add_error(error)
     finally:
-        if (
-            Configuration.get_configuration_parameter('GMAIL_ENABLED')
-            and Error.has_errors()
-        ):
-            Notifier.send_email('\n{0}\n'.format('*' * 120).join(Error.get_errors()))
+        _notify_errors()
 
     logger.info('Shutdown SmoothStreams EPG Generator %s', VERSION)
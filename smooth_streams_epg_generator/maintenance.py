@@ -0,0 +1,194 @@
+import logging
+import sqlite3
+import time
+from datetime import timedelta
+
+from .configuration import Configuration
+from .db import Database
+from .utilities import Utility
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseMaintenance(object):
+    __slots__ = []
+
+    @classmethod
+    def _analyze(cls):
+        analyze_interval = Configuration.get_configuration_parameter(
+            'DATABASE_ANALYZE_INTERVAL'
+        )
+        if analyze_interval <= 0:
+            return
+
+        current_time = int(time.time())
+
+        records = Database.execute(
+            'SELECT date_time_of_last_run '
+            'FROM maintenance_task '
+            'WHERE name = :name',
+            {'name': 'analyze'},
+        )
+        if records and current_time - records[0]['date_time_of_last_run'] < (
+            analyze_interval
+        ):
+            return
+
+        Database.execute('ANALYZE', {})
+        Database.execute(
+            'INSERT '
+            'INTO maintenance_task (name, date_time_of_last_run) '
+            'VALUES (:name, :date_time_of_last_run) '
+            'ON CONFLICT (name) '
+            'DO UPDATE SET date_time_of_last_run = excluded.date_time_of_last_run',
+            {'name': 'analyze', 'date_time_of_last_run': current_time},
+        )
+        Database.commit()
+
+        logger.debug('Analyzed SQLite database')
+
+    @classmethod
+    def _enable_incremental_auto_vacuum(cls):
+        if Database.execute('PRAGMA auto_vacuum', {})[0][0] == 2:
+            return
+
+        logger.info(
+            'Enabling incremental auto vacuum\n'
+            'The SQLite database will be vacuumed once'
+        )
+
+        Database.execute('PRAGMA auto_vacuum = INCREMENTAL', {})
+        Database.execute('VACUUM', {})
+
+    @classmethod
+    def _get_database_size(cls):
+        page_size = Database.execute('PRAGMA page_size', {})[0][0]
+        page_count = Database.execute('PRAGMA page_count', {})[0][0]
+        freelist_count = Database.execute('PRAGMA freelist_count', {})[0][0]
+
+        return (page_count * page_size, freelist_count * page_size)
+
+    @classmethod
+    def _purge_tables(cls, startup_date_time_in_utc):
+        purge_statements = [
+            (
+                'failed_program_match',
+                'DELETE '
+                'FROM failed_program_match '
+                'WHERE date_time_of_last_failure < :date_time_of_last_failure_cutoff',
+                {
+                    'date_time_of_last_failure_cutoff': Utility.convert_date_time_to_epoch(
+                        startup_date_time_in_utc
+                    )
+                },
+            ),
+            (
+                'forced_program_match',
+                'DELETE '
+                'FROM forced_program_match '
+                'WHERE smooth_streams_program_stop < :smooth_streams_program_stop_cutoff',
+                {
+                    'smooth_streams_program_stop_cutoff': str(
+                        startup_date_time_in_utc - timedelta(days=1)
+                    )
+                },
+            ),
+            (
+                'ignored_epg_program_match',
+                'DELETE '
+                'FROM ignored_epg_program_match '
+                'WHERE epg_program_stop < :epg_program_stop_cutoff'
+                '  AND epg_program_stop <> \'\'',
+                {
+                    'epg_program_stop_cutoff': str(
+                        startup_date_time_in_utc - timedelta(days=1)
+                    )
+                },
+            ),
+            (
+                'ignored_smooth_streams_program_match',
+                'DELETE '
+                'FROM ignored_smooth_streams_program_match '
+                'WHERE smooth_streams_program_stop < :smooth_streams_program_stop_cutoff'
+                '  AND smooth_streams_program_stop <> \'\'',
+                {
+                    'smooth_streams_program_stop_cutoff': str(
+                        startup_date_time_in_utc - timedelta(days=1)
+                    )
+                },
+            ),
+            (
+                'program_match',
+                'DELETE '
+                'FROM program_match '
+                'WHERE date_time_of_last_match < :date_time_of_last_match_cutoff',
+                {
+                    'date_time_of_last_match_cutoff': Utility.convert_date_time_to_epoch(
+                        startup_date_time_in_utc
+                    )
+                },
+            ),
+        ]
+
+        number_of_records_purged = {}
+
+        try:
+            for (table_name, sql_statement, parameters) in purge_statements:
+                Database.execute(sql_statement, parameters)
+                number_of_records_purged[table_name] = Database.get_row_count()
+
+            Database.commit()
+        except sqlite3.Error:
+            Database.rollback()
+
+            raise
+
+        return number_of_records_purged
+
+    @classmethod
+    def _vacuum_incrementally(cls):
+        incremental_vacuum_pages = Configuration.get_configuration_parameter(
+            'DATABASE_INCREMENTAL_VACUUM_PAGES'
+        )
+        if incremental_vacuum_pages <= 0:
+            return
+
+        Database.execute(
+            'PRAGMA incremental_vacuum({0:d})'.format(incremental_vacuum_pages), {}
+        )
+
+    @classmethod
+    def run(cls, startup_date_time_in_utc):
+        Database.flush()
+
+        (database_size_before, _) = cls._get_database_size()
+
+        number_of_records_purged = cls._purge_tables(startup_date_time_in_utc)
+
+        cls._enable_incremental_auto_vacuum()
+        cls._vacuum_incrementally()
+        cls._analyze()
+
+        (database_size_after, free_space_after) = cls._get_database_size()
+
+        logger.info(
+            'Performed SQLite database maintenance\n'
+            '# of failed_program_match records purged                 => %s\n'
+            '# of forced_program_match records purged                 => %s\n'
+            '# of ignored_epg_program_match records purged            => %s\n'
+            '# of ignored_smooth_streams_program_match records purged => %s\n'
+            '# of program_match records purged                        => %s\n'
+            'Database size before                                     => %s\n'
+            'Database size after                                      => %s\n'
+            '# of bytes reclaimed                                     => %s\n'
+            '# of bytes still free                                    => %s',
+            number_of_records_purged['failed_program_match'],
+            number_of_records_purged['forced_program_match'],
+            number_of_records_purged['ignored_epg_program_match'],
+            number_of_records_purged['ignored_smooth_streams_program_match'],
+            number_of_records_purged['program_match'],
+            database_size_before,
+            database_size_after,
+            database_size_before - database_size_after,
+            free_space_after,
+        )
@@ -0,0 +1,125 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+
+from .constants import DEFAULT_MERGE_CACHE_DIRECTORY_PATH
+from .utilities import Utility
+
+logger = logging.getLogger(__name__)
+
+
+class MergeCache(object):
+    __slots__ = []
+
+    _cache_file_path = None
+    _cached_entries = {}
+    _entries = {}
+    _number_of_hits = 0
+    _number_of_misses = 0
+
+    @classmethod
+    def calculate_fingerprint(cls, *values):
+        return hashlib.blake2b(
+            json.dumps(
+                values,
+                default=str,
+                ensure_ascii=False,
+                separators=(',', ':'),
+                sort_keys=True,
+            ).encode('utf-8'),
+            digest_size=16,
+        ).hexdigest()
+
+    @classmethod
+    def get_merge_result(
+        cls, channel_id, fingerprint, calculate_parsed_programs_fingerprint
+    ):
+        try:
+            (
+                cached_fingerprint,
+                parsed_programs_map_keys,
+                parsed_programs_fingerprint,
+                merge_result,
+            ) = cls._cached_entries[channel_id]
+        except KeyError:
+            cls._number_of_misses += 1
+
+            return None
+
+        if (
+            cached_fingerprint != fingerprint
+            or calculate_parsed_programs_fingerprint(parsed_programs_map_keys)
+            != parsed_programs_fingerprint
+        ):
+            cls._number_of_misses += 1
+
+            return None
+
+        cls._entries[channel_id] = cls._cached_entries[channel_id]
+        cls._number_of_hits += 1
+
+        return merge_result
+
+    @classmethod
+    def load(cls, cache_name):
+        cls._cache_file_path = os.path.join(
+            DEFAULT_MERGE_CACHE_DIRECTORY_PATH, '{0}.pickle'.format(cache_name)
+        )
+        cls._cached_entries = {}
+        cls._entries = {}
+        cls._number_of_hits = 0
+        cls._number_of_misses = 0
+
+        try:
+            with open(cls._cache_file_path, 'rb') as cache_file:
+                cls._cached_entries = pickle.load(cache_file)
+        except FileNotFoundError:
+            pass
+        except (AttributeError, EOFError, ImportError, OSError, pickle.PickleError):
+            logger.info(
+                'Failed to load merge cache\nCache file path => %s',
+                cls._cache_file_path,
+            )
+
+    @classmethod
+    def save(cls):
+        if not os.path.exists(DEFAULT_MERGE_CACHE_DIRECTORY_PATH):
+            Utility.create_directory(DEFAULT_MERGE_CACHE_DIRECTORY_PATH)
+
+        temporary_cache_file_path = '{0}.new'.format(cls._cache_file_path)
+
+        with open(temporary_cache_file_path, 'wb') as cache_file:
+            pickle.dump(cls._entries, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temporary_cache_file_path, cls._cache_file_path)
+
+        logger.info(
+            'Saved merge cache\n'
+            'Cache file path         => %s\n'
+            '# of channels reused    => %s\n'
+            '# of channels re-merged => %s',
+            cls._cache_file_path,
+            cls._number_of_hits,
+            cls._number_of_misses,
+        )
+
+        cls._cached_entries = {}
+        cls._entries = {}
+
+    @classmethod
+    def set_merge_result(
+        cls,
+        channel_id,
+        fingerprint,
+        parsed_programs_map_keys,
+        parsed_programs_fingerprint,
+        merge_result,
+    ):
+        cls._entries[channel_id] = (
+            fingerprint,
+            parsed_programs_map_keys,
+            parsed_programs_fingerprint,
+            merge_result,
+        )
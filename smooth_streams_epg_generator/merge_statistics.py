@@ -0,0 +1,122 @@
+import logging
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+
+class MergeStatistics(object):
+    __slots__ = []
+
+    _channel_merge_times = {}
+    _matching_outcomes = {}
+    _merge_name = None
+    _merge_names = []
+    _number_of_channels_reused = {}
+    _overlap_cases = {}
+
+    @classmethod
+    def attach(cls, statistics):
+        (overlap_cases, matching_outcomes, channel_merge_times) = statistics
+
+        cls._overlap_cases[cls._merge_name].update(overlap_cases)
+        cls._matching_outcomes[cls._merge_name].update(matching_outcomes)
+        cls._channel_merge_times[cls._merge_name].update(channel_merge_times)
+
+    @classmethod
+    def count_channel_reused(cls):
+        cls._number_of_channels_reused[cls._merge_name] += 1
+
+    @classmethod
+    def count_matching_outcome(cls, matching_outcome):
+        if cls._merge_name is not None:
+            cls._matching_outcomes[cls._merge_name][matching_outcome] += 1
+
+    @classmethod
+    def count_overlap_case(cls, overlap_case):
+        if cls._merge_name is not None:
+            cls._overlap_cases[cls._merge_name][overlap_case] += 1
+
+    @classmethod
+    def detach(cls):
+        statistics = (
+            cls._overlap_cases[cls._merge_name],
+            cls._matching_outcomes[cls._merge_name],
+            cls._channel_merge_times[cls._merge_name],
+        )
+
+        cls._overlap_cases[cls._merge_name] = Counter()
+        cls._matching_outcomes[cls._merge_name] = Counter()
+        cls._channel_merge_times[cls._merge_name] = {}
+
+        return statistics
+
+    @classmethod
+    def log_summary(cls, number_of_slowest_channels=10):
+        for merge_name in cls._merge_names:
+            channel_merge_times = sorted(
+                cls._channel_merge_times[merge_name].items(),
+                key=lambda channel_merge_time: channel_merge_time[1][1],
+                reverse=True,
+            )
+
+            logger.info(
+                'Merge statistics\n'
+                'Merge pass               => %s\n'
+                '# of channels merged     => %s\n'
+                '# of channels reused     => %s\n'
+                'Total channel merge time => %.3f\n\n'
+                'Slowest channels\n%s\n\n'
+                'Overlap cases\n%s\n\n'
+                'Matching outcomes\n%s',
+                merge_name,
+                len(channel_merge_times),
+                cls._number_of_channels_reused[merge_name],
+                sum(merge_time for (_, (_, merge_time)) in channel_merge_times),
+                '\n'.join(
+                    '  {0} ({1}) => {2:.3f}'.format(
+                        channel_id, channel_name, merge_time
+                    )
+                    for (channel_id, (channel_name, merge_time)) in channel_merge_times[
+                        :number_of_slowest_channels
+                    ]
+                ),
+                '\n'.join(
+                    '  {0} => {1}'.format(overlap_case, number_of_occurrences)
+                    for (overlap_case, number_of_occurrences,) in cls._overlap_cases[
+                        merge_name
+                    ].most_common()
+                ),
+                '\n'.join(
+                    '  {0} => {1}'.format(matching_outcome, number_of_occurrences)
+                    for (
+                        matching_outcome,
+                        number_of_occurrences,
+                    ) in cls._matching_outcomes[merge_name].most_common()
+                ),
+            )
+
+    @classmethod
+    def record_channel_merge_time(cls, channel_id, channel_name, merge_time):
+        cls._channel_merge_times[cls._merge_name][channel_id] = (
+            channel_name,
+            merge_time,
+        )
+
+    @classmethod
+    def reset(cls):
+        cls._channel_merge_times = {}
+        cls._matching_outcomes = {}
+        cls._merge_name = None
+        cls._merge_names = []
+        cls._number_of_channels_reused = {}
+        cls._overlap_cases = {}
+
+    @classmethod
+    def start_merge(cls, merge_name):
+        cls._merge_name = merge_name
+        cls._merge_names.append(merge_name)
+
+        cls._channel_merge_times[merge_name] = {}
+        cls._matching_outcomes[merge_name] = Counter()
+        cls._number_of_channels_reused[merge_name] = 0
+        cls._overlap_cases[merge_name] = Counter()
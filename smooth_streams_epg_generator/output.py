@@ -0,0 +1,370 @@
+import hashlib
+import json
+import logging
+import lzma
+import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from .constants import DEFAULT_OUTPUT_FILE_BUFFER_SIZE
+from .constants import DEFAULT_OUTPUT_MANIFEST_FILE_NAME
+
+logger = logging.getLogger(__name__)
+
+
+class OutputCompressor(object):
+    __slots__ = []
+
+    _compression_formats = ()
+    _compressions = []
+    _executor = None
+
+    @classmethod
+    def _compress(cls, input_file, compression_format, output_file):
+        with input_file:
+            if compression_format == 'GZ':
+                compressor = zlib.compressobj(9, zlib.DEFLATED, 31)
+            else:
+                compressor = lzma.LZMACompressor(format=lzma.FORMAT_XZ)
+
+            for data in iter(
+                lambda: input_file.read(DEFAULT_OUTPUT_FILE_BUFFER_SIZE), b''
+            ):
+                output_file.write(compressor.compress(data))
+
+        output_file.write(compressor.flush())
+
+    @classmethod
+    def compress(cls, file_path, is_published):
+        for compression_format in cls._compression_formats:
+            compressed_file_path = '{0}.{1}'.format(
+                file_path, compression_format.lower()
+            )
+
+            if not is_published and OutputManifest.is_unchanged(compressed_file_path):
+                OutputManifest.keep_entry(compressed_file_path)
+
+                continue
+
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor()
+
+            output_file = OutputFile(compressed_file_path, is_binary=True)
+            output_file.open()
+
+            input_file = None
+
+            try:
+                input_file = open(file_path, 'rb')
+
+                cls._compressions.append(
+                    (
+                        output_file,
+                        cls._executor.submit(
+                            cls._compress, input_file, compression_format, output_file
+                        ),
+                    )
+                )
+            except Exception:
+                if input_file is not None:
+                    input_file.close()
+
+                output_file.discard()
+
+                raise
+
+    @classmethod
+    def start(cls, compression_formats):
+        cls._compression_formats = compression_formats
+        cls._compressions = []
+
+    @classmethod
+    def wait(cls):
+        compression_error = None
+
+        for (output_file, future) in cls._compressions:
+            try:
+                future.result()
+                output_file.close()
+            except Exception as error:
+                logger.error(
+                    'Failed to compress file\nFile path => %s', output_file.file_path
+                )
+
+                output_file.discard()
+
+                compression_error = compression_error or error
+
+        cls._compressions = []
+
+        if cls._executor is not None:
+            cls._executor.shutdown()
+            cls._executor = None
+
+        if compression_error is not None:
+            raise compression_error
+
+
+class OutputFile(object):
+    __slots__ = [
+        '_file_path',
+        '_hash',
+        '_is_binary',
+        '_output_file',
+        '_size',
+        '_temporary_file_path',
+    ]
+
+    def __init__(self, file_path, is_binary=False):
+        self._file_path = file_path
+        self._hash = hashlib.sha256()
+        self._is_binary = is_binary
+        self._output_file = None
+        self._size = 0
+        self._temporary_file_path = '{0}.new'.format(file_path)
+
+    def __enter__(self):
+        self.open()
+
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        if exception_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def close(self):
+        sha256 = self._hash.hexdigest()
+
+        try:
+            self._output_file.close()
+
+            if OutputManifest.is_unchanged(self._file_path, sha256, self._size):
+                os.remove(self._temporary_file_path)
+
+                is_published = False
+            else:
+                os.replace(self._temporary_file_path, self._file_path)
+
+                is_published = True
+
+            OutputManifest.set_entry(self._file_path, sha256, self._size, is_published)
+
+            return is_published
+        except OSError:
+            logger.error('Failed to write file\nFile path => %s', self._file_path)
+
+            self.discard()
+
+            raise
+        finally:
+            self._output_file = None
+
+    def discard(self):
+        if self._output_file is not None:
+            self._output_file.close()
+            self._output_file = None
+
+        try:
+            os.remove(self._temporary_file_path)
+        except FileNotFoundError:
+            pass
+
+    def open(self):
+        try:
+            self._output_file = open(
+                self._temporary_file_path,
+                mode='wb',
+                buffering=DEFAULT_OUTPUT_FILE_BUFFER_SIZE,
+            )
+        except OSError:
+            logger.error('Failed to write file\nFile path => %s', self._file_path)
+
+            raise
+
+    def write(self, output):
+        if not self._is_binary:
+            output = output.encode('utf-8')
+
+        self._hash.update(output)
+        self._size += len(output)
+
+        self._output_file.write(output)
+
+    @property
+    def file_path(self):
+        return self._file_path
+
+    @property
+    def size(self):
+        return self._size
+
+
+class OutputFileIndex(object):
+    __slots__ = ['_channels']
+
+    def __init__(self):
+        self._channels = {}
+
+    def _get_channel_index(self, channel_id):
+        try:
+            return self._channels[channel_id]
+        except KeyError:
+            channel_index = {'channel': None, 'days': {}, 'programmes': None}
+            self._channels[channel_id] = channel_index
+
+            return channel_index
+
+    def add_channel_block(self, channel_id, start, end):
+        self._get_channel_index(channel_id)['channel'] = [start, end - start]
+
+    def add_program_block(self, channel_id, day, start, end):
+        channel_index = self._get_channel_index(channel_id)
+
+        if channel_index['programmes'] is None:
+            channel_index['programmes'] = [start, end - start]
+        else:
+            channel_index['programmes'][1] = end - channel_index['programmes'][0]
+
+        day_block = channel_index['days'].get(day)
+        if day_block is None:
+            channel_index['days'][day] = [start, end - start]
+        else:
+            day_block[1] = end - day_block[0]
+
+    def render(self):
+        return json.dumps(
+            {'channels': self._channels}, separators=(',', ':'), sort_keys=True
+        )
+
+
+class OutputManifest(object):
+    __slots__ = []
+
+    _entries = {}
+    _manifest_file_path = None
+    _number_of_files_published = 0
+    _number_of_files_removed = 0
+    _number_of_files_unchanged = 0
+    _previous_entries = {}
+
+    @classmethod
+    def attach(cls, manifest):
+        (entries, number_of_files_published, number_of_files_unchanged) = manifest
+
+        cls._entries.update(entries)
+        cls._number_of_files_published += number_of_files_published
+        cls._number_of_files_unchanged += number_of_files_unchanged
+
+    @classmethod
+    def detach(cls):
+        manifest = (
+            cls._entries,
+            cls._number_of_files_published,
+            cls._number_of_files_unchanged,
+        )
+
+        cls._entries = {}
+        cls._number_of_files_published = 0
+        cls._number_of_files_unchanged = 0
+
+        return manifest
+
+    @classmethod
+    def is_unchanged(cls, file_path, sha256=None, size=None):
+        try:
+            previous_entry = cls._previous_entries[os.path.basename(file_path)]
+        except KeyError:
+            return False
+
+        if (sha256 is not None and previous_entry['sha256'] != sha256) or (
+            size is not None and previous_entry['size'] != size
+        ):
+            return False
+
+        try:
+            return os.stat(file_path).st_size == previous_entry['size']
+        except FileNotFoundError:
+            return False
+
+    @classmethod
+    def keep_entry(cls, file_path):
+        file_name = os.path.basename(file_path)
+
+        cls._entries[file_name] = cls._previous_entries[file_name]
+        cls._number_of_files_unchanged += 1
+
+    @classmethod
+    def load(cls, output_directory_path):
+        cls._entries = {}
+        cls._manifest_file_path = os.path.join(
+            output_directory_path, DEFAULT_OUTPUT_MANIFEST_FILE_NAME
+        )
+        cls._number_of_files_published = 0
+        cls._number_of_files_removed = 0
+        cls._number_of_files_unchanged = 0
+        cls._previous_entries = cls.read(output_directory_path)
+
+    @classmethod
+    def read(cls, output_directory_path):
+        manifest_file_path = os.path.join(
+            output_directory_path, DEFAULT_OUTPUT_MANIFEST_FILE_NAME
+        )
+
+        try:
+            with open(manifest_file_path, 'r', encoding='utf-8') as manifest_file:
+                return json.load(manifest_file)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            logger.info(
+                'Failed to load output manifest\nManifest file path => %s',
+                manifest_file_path,
+            )
+
+        return {}
+
+    @classmethod
+    def save(cls):
+        output_directory_path = os.path.dirname(cls._manifest_file_path)
+
+        for file_name in cls._previous_entries.keys() - cls._entries.keys():
+            try:
+                os.remove(os.path.join(output_directory_path, file_name))
+
+                cls._number_of_files_removed += 1
+            except FileNotFoundError:
+                pass
+
+        temporary_manifest_file_path = '{0}.new'.format(cls._manifest_file_path)
+
+        with open(temporary_manifest_file_path, 'w', encoding='utf-8') as manifest_file:
+            json.dump(cls._entries, manifest_file, indent=4, sort_keys=True)
+
+        os.replace(temporary_manifest_file_path, cls._manifest_file_path)
+
+        logger.info(
+            'Saved output manifest\n'
+            'Manifest file path     => %s\n'
+            '# of files published   => %s\n'
+            '# of files unchanged   => %s\n'
+            '# of files removed     => %s',
+            cls._manifest_file_path,
+            cls._number_of_files_published,
+            cls._number_of_files_unchanged,
+            cls._number_of_files_removed,
+        )
+
+    @classmethod
+    def set_entry(cls, file_path, sha256, size, is_published):
+        cls._entries[os.path.basename(file_path)] = {
+            'etag': '"{0}"'.format(sha256),
+            'sha256': sha256,
+            'size': size,
+        }
+
+        if is_published:
+            cls._number_of_files_published += 1
+        else:
+            cls._number_of_files_unchanged += 1
@@ -0,0 +1,22 @@
+import functools
+import logging
+
+import pytz
+
+logger = logging.getLogger(__name__)
+
+
+class OutputEncoding(object):
+    __slots__ = []
+
+    @classmethod
+    def escape(cls, data):
+        if '&' in data or '<' in data or '>' in data:
+            return data.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+        return data
+
+    @classmethod
+    @functools.lru_cache(maxsize=16384)
+    def format_date_time(cls, date_time):
+        return date_time.astimezone(pytz.utc).strftime('%Y%m%d%H%M%S %z')
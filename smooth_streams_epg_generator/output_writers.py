@@ -0,0 +1,395 @@
+import json
+import os
+import re
+import urllib.parse
+
+from .constants import DEFAULT_OUTPUT_DELTA_FILE_NAME_FORMAT
+from .constants import DEFAULT_OUTPUT_EXPORT_COLUMNAR_FILE_NAME_FORMAT
+from .constants import DEFAULT_OUTPUT_EXPORT_NDJSON_FILE_NAME_FORMAT
+from .constants import DEFAULT_OUTPUT_INDEX_FILE_NAME_FORMAT
+from .constants import DEFAULT_OUTPUT_SPLIT_CHANNEL_FILE_NAME_FORMAT
+from .constants import DEFAULT_OUTPUT_SPLIT_DAY_FILE_NAME_FORMAT
+from .constants import DEFAULT_OUTPUT_XMLTV_FILE_NAME_FORMAT
+from .constants import DEFAULT_OUTPUT_XMLTV_FOOTER
+from .constants import DEFAULT_OUTPUT_XMLTV_HEADER
+from .delta import OutputDelta
+from .output import OutputFile
+from .output import OutputFileIndex
+from .privilege import Privilege
+from .utilities import Utility
+
+
+class OutputWriter(object):
+    __slots__ = []
+
+    @classmethod
+    def _write_file(cls, file_path, outputs):
+        output_file = OutputFile(file_path)
+
+        Privilege.become_privileged_user()
+        try:
+            output_file.open()
+
+            try:
+                for output in outputs:
+                    output_file.write(output)
+            except Exception:
+                output_file.discard()
+
+                raise
+
+            return (file_path, output_file.close())
+        finally:
+            Privilege.become_unprivileged_user()
+
+    def end_channel(self, channel):
+        return []
+
+    def publish(self):
+        pass
+
+    def write_channel(self, channel, channel_output):
+        pass
+
+    def write_footer(self):
+        pass
+
+    def write_header(self):
+        pass
+
+    def write_program(
+        self, channel, program, program_day, program_numbers_of_days, program_outputs
+    ):
+        pass
+
+    @property
+    def output_files(self):
+        return []
+
+
+class OutputDeltaWriter(OutputWriter):
+    __slots__ = [
+        '_delta_file',
+        '_delta_programs',
+        '_generation_date_time_in_utc',
+        '_previous_snapshot',
+        '_program_identity_occurrences',
+        '_render_program_json',
+        '_snapshot',
+        '_snapshot_channels',
+        '_snapshot_name',
+    ]
+
+    def __init__(
+        self,
+        output_directory_path,
+        is_forced,
+        generation_date_time_in_utc,
+        render_program_json,
+    ):
+        self._delta_file = None
+        self._delta_programs = {}
+        self._generation_date_time_in_utc = generation_date_time_in_utc
+        self._program_identity_occurrences = {}
+        self._render_program_json = render_program_json
+        self._snapshot = None
+        self._snapshot_channels = {}
+        self._snapshot_name = 'f' if is_forced else 'r'
+
+        self._previous_snapshot = OutputDelta.load_snapshot(self._snapshot_name)
+
+        if self._previous_snapshot is not None:
+            self._delta_file = OutputFile(
+                os.path.join(
+                    output_directory_path,
+                    DEFAULT_OUTPUT_DELTA_FILE_NAME_FORMAT.format(self._snapshot_name),
+                )
+            )
+
+    def publish(self):
+        OutputDelta.save_snapshot(self._snapshot_name, self._snapshot)
+
+    def write_footer(self):
+        self._snapshot = (
+            Utility.convert_date_time_to_epoch(self._generation_date_time_in_utc),
+            self._snapshot_channels,
+        )
+
+        if self._delta_file is not None:
+            self._delta_file.write(
+                OutputDelta.render_delta(
+                    self._previous_snapshot,
+                    self._snapshot,
+                    lambda channel_id, program_identity: self._render_program_json(
+                        *self._delta_programs[(channel_id, program_identity)]
+                    ),
+                )
+            )
+
+    def write_program(
+        self, channel, program, program_day, program_numbers_of_days, program_outputs
+    ):
+        program_identity = OutputDelta.calculate_program_identity(program)
+        program_identity_occurrence = self._program_identity_occurrences.get(
+            (channel.id, program_identity), 0
+        )
+        self._program_identity_occurrences[(channel.id, program_identity)] = (
+            program_identity_occurrence + 1
+        )
+        program_identity = '{0}.{1}'.format(
+            program_identity, program_identity_occurrence
+        )
+
+        self._snapshot_channels.setdefault(channel.id, {})[program_identity] = (
+            Utility.convert_date_time_to_epoch(program.start),
+            Utility.convert_date_time_to_epoch(program.stop),
+        )
+        self._delta_programs[(channel.id, program_identity)] = (channel, program)
+
+    @property
+    def output_files(self):
+        return [self._delta_file] if self._delta_file is not None else []
+
+
+class OutputExportWriter(OutputWriter):
+    __slots__ = [
+        '_columnar_file',
+        '_columns',
+        '_ndjson_file',
+        '_render_program_json',
+        '_string_table',
+    ]
+
+    def __init__(self, output_directory_path, is_forced, render_program_json):
+        self._columnar_file = OutputFile(
+            os.path.join(
+                output_directory_path,
+                DEFAULT_OUTPUT_EXPORT_COLUMNAR_FILE_NAME_FORMAT.format(
+                    'f' if is_forced else 'r'
+                ),
+            )
+        )
+        self._columns = {
+            'channel': [],
+            'start': [],
+            'stop': [],
+            'strings': [],
+            'title': [],
+        }
+        self._ndjson_file = OutputFile(
+            os.path.join(
+                output_directory_path,
+                DEFAULT_OUTPUT_EXPORT_NDJSON_FILE_NAME_FORMAT.format(
+                    'f' if is_forced else 'r'
+                ),
+            )
+        )
+        self._render_program_json = render_program_json
+        self._string_table = {}
+
+    def write_footer(self):
+        self._columns['strings'] = list(self._string_table)
+
+        self._columnar_file.write(
+            json.dumps(
+                self._columns,
+                ensure_ascii=False,
+                separators=(',', ':'),
+                sort_keys=True,
+            )
+        )
+
+    def write_program(
+        self, channel, program, program_day, program_numbers_of_days, program_outputs
+    ):
+        self._ndjson_file.write(self._render_program_json(channel, program))
+
+        self._columns['channel'].append(
+            self._string_table.setdefault(channel.id, len(self._string_table))
+        )
+        self._columns['start'].append(Utility.convert_date_time_to_epoch(program.start))
+        self._columns['stop'].append(Utility.convert_date_time_to_epoch(program.stop))
+        self._columns['title'].append(
+            self._string_table.setdefault(
+                re.sub(r'Live: ', '', program.titles[0]['value']),
+                len(self._string_table),
+            )
+            if program.titles
+            else None
+        )
+
+    @property
+    def output_files(self):
+        return [self._columnar_file, self._ndjson_file]
+
+
+class OutputSplitWriter(OutputWriter):
+    __slots__ = [
+        '_channel_outputs',
+        '_channel_programs_outputs',
+        '_day_files',
+        '_do_generate_all_elements_values',
+        '_is_forced',
+        '_output_directory_path',
+    ]
+
+    def __init__(
+        self, output_directory_path, is_forced, do_generate_all_elements_values, days
+    ):
+        self._channel_outputs = {}
+        self._channel_programs_outputs = {
+            do_generate_all_elements: []
+            for do_generate_all_elements in do_generate_all_elements_values
+        }
+        self._day_files = {
+            (do_generate_all_elements, day): OutputFile(
+                os.path.join(
+                    output_directory_path,
+                    DEFAULT_OUTPUT_SPLIT_DAY_FILE_NAME_FORMAT.format(
+                        'f' if is_forced else 'r',
+                        'f' if do_generate_all_elements else 's',
+                        day,
+                    ),
+                )
+            )
+            for do_generate_all_elements in do_generate_all_elements_values
+            for day in days
+        }
+        self._do_generate_all_elements_values = do_generate_all_elements_values
+        self._is_forced = is_forced
+        self._output_directory_path = output_directory_path
+
+    def end_channel(self, channel):
+        published_files = []
+
+        for do_generate_all_elements in self._do_generate_all_elements_values:
+            published_files.append(
+                self._write_file(
+                    os.path.join(
+                        self._output_directory_path,
+                        DEFAULT_OUTPUT_SPLIT_CHANNEL_FILE_NAME_FORMAT.format(
+                            'f' if self._is_forced else 'r',
+                            'f' if do_generate_all_elements else 's',
+                            urllib.parse.quote(channel.id, safe=''),
+                        ),
+                    ),
+                    [DEFAULT_OUTPUT_XMLTV_HEADER, self._channel_outputs[channel.id]]
+                    + self._channel_programs_outputs[do_generate_all_elements]
+                    + [DEFAULT_OUTPUT_XMLTV_FOOTER],
+                )
+            )
+
+            self._channel_programs_outputs[do_generate_all_elements] = []
+
+        return published_files
+
+    def write_channel(self, channel, channel_output):
+        self._channel_outputs[channel.id] = channel_output
+
+        for day_file in self._day_files.values():
+            day_file.write(channel_output)
+
+    def write_footer(self):
+        for day_file in self._day_files.values():
+            day_file.write(DEFAULT_OUTPUT_XMLTV_FOOTER)
+
+    def write_header(self):
+        for day_file in self._day_files.values():
+            day_file.write(DEFAULT_OUTPUT_XMLTV_HEADER)
+
+    def write_program(
+        self, channel, program, program_day, program_numbers_of_days, program_outputs
+    ):
+        for (do_generate_all_elements, program_output) in program_outputs.items():
+            self._channel_programs_outputs[do_generate_all_elements].append(
+                program_output
+            )
+            self._day_files[(do_generate_all_elements, program_day)].write(
+                program_output
+            )
+
+    @property
+    def output_files(self):
+        return list(self._day_files.values())
+
+
+class OutputXMLTVWriter(OutputWriter):
+    __slots__ = ['_output_file_indexes', '_output_files']
+
+    def __init__(
+        self,
+        output_directory_path,
+        is_forced,
+        do_generate_all_elements_values,
+        numbers_of_days,
+        is_indexing,
+    ):
+        self._output_files = {
+            (do_generate_all_elements, number_of_days): OutputFile(
+                os.path.join(
+                    output_directory_path,
+                    DEFAULT_OUTPUT_XMLTV_FILE_NAME_FORMAT.format(
+                        'f' if is_forced else 'r',
+                        'f' if do_generate_all_elements else 's',
+                        number_of_days,
+                    ),
+                )
+            )
+            for do_generate_all_elements in do_generate_all_elements_values
+            for number_of_days in numbers_of_days
+        }
+        self._output_file_indexes = (
+            {
+                output_file_key: OutputFileIndex()
+                for output_file_key in self._output_files
+            }
+            if is_indexing
+            else {}
+        )
+
+    def publish(self):
+        for (output_file_key, output_file_index) in self._output_file_indexes.items():
+            self._write_file(
+                DEFAULT_OUTPUT_INDEX_FILE_NAME_FORMAT.format(
+                    self._output_files[output_file_key].file_path
+                ),
+                [output_file_index.render()],
+            )
+
+    def write_channel(self, channel, channel_output):
+        for (output_file_key, output_file) in self._output_files.items():
+            channel_output_start = output_file.size
+            output_file.write(channel_output)
+
+            if self._output_file_indexes:
+                self._output_file_indexes[output_file_key].add_channel_block(
+                    channel.id, channel_output_start, output_file.size
+                )
+
+    def write_footer(self):
+        for output_file in self._output_files.values():
+            output_file.write(DEFAULT_OUTPUT_XMLTV_FOOTER)
+
+    def write_header(self):
+        for output_file in self._output_files.values():
+            output_file.write(DEFAULT_OUTPUT_XMLTV_HEADER)
+
+    def write_program(
+        self, channel, program, program_day, program_numbers_of_days, program_outputs
+    ):
+        for (do_generate_all_elements, program_output) in program_outputs.items():
+            for number_of_days in program_numbers_of_days:
+                output_file_key = (do_generate_all_elements, number_of_days)
+                output_file = self._output_files[output_file_key]
+
+                program_output_start = output_file.size
+                output_file.write(program_output)
+
+                if self._output_file_indexes:
+                    self._output_file_indexes[output_file_key].add_program_block(
+                        channel.id, program_day, program_output_start, output_file.size
+                    )
+
+    @property
+    def output_files(self):
+        return list(self._output_files.values())
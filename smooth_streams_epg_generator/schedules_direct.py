@@ -122,6 +122,8 @@ class SchedulesDirect(object):
 
     @classmethod
     def _populate_lineups(cls):
+        cls._lineups = []
+
         logger.debug(
             'Obtaining SchedulesDirect token\n'
             'URL      => %s\n'
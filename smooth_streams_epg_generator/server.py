@@ -0,0 +1,267 @@
+import email.utils
+import logging
+import os
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+from .constants import SERVER_CONTENT_TYPE_MAP
+from .constants import VERSION
+from .output import OutputManifest
+from .privilege import Privilege
+
+logger = logging.getLogger(__name__)
+
+
+class Server(object):
+    __slots__ = []
+
+    _files = {}
+    _http_server = None
+    _http_server_thread = None
+    _output_directory_path = None
+
+    @classmethod
+    def get_file(cls, file_name):
+        return cls._files.get(file_name)
+
+    @classmethod
+    def get_output_directory_path(cls):
+        return cls._output_directory_path
+
+    @classmethod
+    def reload(cls):
+        files = {}
+
+        for (file_name, entry) in OutputManifest.read(
+            cls._output_directory_path
+        ).items():
+            try:
+                file_attributes = os.stat(
+                    os.path.join(cls._output_directory_path, file_name)
+                )
+            except FileNotFoundError:
+                continue
+
+            files[file_name] = (entry['etag'], file_attributes.st_ino)
+
+        cls._files = files
+
+        logger.info(
+            'Reloaded HTTP server files\n'
+            'Output directory path => %s\n'
+            '# of files            => %s',
+            cls._output_directory_path,
+            len(files),
+        )
+
+    @classmethod
+    def start(cls, output_directory_path, address, port):
+        cls._output_directory_path = output_directory_path
+        cls.reload()
+
+        Privilege.become_privileged_user()
+        try:
+            cls._http_server = ThreadingHTTPServer(
+                (address, port), ServerRequestHandler
+            )
+        finally:
+            Privilege.become_unprivileged_user()
+
+        cls._http_server.daemon_threads = True
+
+        cls._http_server_thread = threading.Thread(
+            target=cls._http_server.serve_forever, daemon=True
+        )
+        cls._http_server_thread.start()
+
+        logger.info('Started HTTP server\nAddress => %s\nPort    => %s', address, port)
+
+    @classmethod
+    def stop(cls):
+        if cls._http_server is None:
+            return
+
+        cls._http_server.shutdown()
+        cls._http_server.server_close()
+        cls._http_server_thread.join()
+
+        cls._http_server = None
+        cls._http_server_thread = None
+
+        logger.info('Stopped HTTP server')
+
+
+class ServerRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'SmoothStreamsEPGGenerator/{0}'.format(VERSION)
+
+    def _is_not_modified(self, etag, last_modified_time):
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            if if_none_match.strip() == '*':
+                return True
+
+            return etag.replace('W/', '', 1) in [
+                entity_tag.strip().replace('W/', '', 1)
+                for entity_tag in if_none_match.split(',')
+            ]
+
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since is not None:
+            try:
+                return int(last_modified_time) <= int(
+                    email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+                )
+            except (TypeError, ValueError):
+                pass
+
+        return False
+
+    def _parse_range(self, etag, last_modified, file_size):
+        range_ = self.headers.get('Range')
+        if range_ is None or not range_.startswith('bytes=') or ',' in range_:
+            return None
+
+        if_range = self.headers.get('If-Range')
+        if if_range is not None and (
+            etag.startswith('W/') or if_range.strip() not in (etag, last_modified)
+        ):
+            return None
+
+        (first_byte_position, _, last_byte_position) = (
+            range_[len('bytes=') :].strip().partition('-')
+        )
+
+        try:
+            if first_byte_position:
+                start = int(first_byte_position)
+
+                if last_byte_position:
+                    if int(last_byte_position) < start:
+                        return None
+
+                    end = min(int(last_byte_position), file_size - 1)
+                else:
+                    end = file_size - 1
+            else:
+                suffix_length = int(last_byte_position)
+
+                start = (
+                    max(file_size - suffix_length, 0) if suffix_length else file_size
+                )
+                end = file_size - 1
+        except ValueError:
+            return None
+
+        return (start, end)
+
+    def _send_file(self, do_send_body):
+        file_name = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)[1:]
+
+        if '/' in file_name or Server.get_file(file_name) is None:
+            self.send_error(404)
+
+            return
+
+        content_encoding = None
+        served_file_name = file_name
+
+        if (
+            not file_name.endswith('.gz')
+            and 'Range' not in self.headers
+            and 'If-Range' not in self.headers
+            and Server.get_file('{0}.gz'.format(file_name))
+        ):
+            if 'gzip' in [
+                coding.split(';')[0].strip()
+                for coding in self.headers.get('Accept-Encoding', '').split(',')
+            ]:
+                content_encoding = 'gzip'
+                served_file_name = '{0}.gz'.format(file_name)
+
+        try:
+            served_file = open(
+                os.path.join(Server.get_output_directory_path(), served_file_name),
+                'rb',
+            )
+        except FileNotFoundError:
+            self.send_error(404)
+
+            return
+
+        with served_file:
+            file_attributes = os.fstat(served_file.fileno())
+
+            (etag, inode) = Server.get_file(served_file_name) or (None, None)
+            if inode != file_attributes.st_ino:
+                etag = 'W/"{0:x}-{1:x}"'.format(
+                    file_attributes.st_size, int(file_attributes.st_mtime)
+                )
+
+            last_modified = email.utils.formatdate(
+                file_attributes.st_mtime, usegmt=True
+            )
+
+            if self._is_not_modified(etag, file_attributes.st_mtime):
+                self.send_response(304)
+                self._send_entity_headers(etag, last_modified, content_encoding)
+                self.end_headers()
+
+                return
+
+            byte_range = self._parse_range(etag, last_modified, file_attributes.st_size)
+
+            if byte_range is None:
+                (start, end) = (0, file_attributes.st_size - 1)
+
+                self.send_response(200)
+            elif byte_range[0] >= file_attributes.st_size:
+                self.send_response(416)
+                self.send_header(
+                    'Content-Range', 'bytes */{0}'.format(file_attributes.st_size)
+                )
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+                return
+            else:
+                (start, end) = byte_range
+
+                self.send_response(206)
+                self.send_header(
+                    'Content-Range',
+                    'bytes {0}-{1}/{2}'.format(start, end, file_attributes.st_size),
+                )
+
+            self.send_header(
+                'Content-Type',
+                SERVER_CONTENT_TYPE_MAP.get(
+                    os.path.splitext(file_name)[1], 'application/octet-stream'
+                ),
+            )
+            self.send_header('Content-Length', str(end - start + 1))
+            self.send_header('Accept-Ranges', 'bytes')
+            self._send_entity_headers(etag, last_modified, content_encoding)
+            self.end_headers()
+
+            if do_send_body and end >= start:
+                self.connection.sendfile(served_file, start, end - start + 1)
+
+    def _send_entity_headers(self, etag, last_modified, content_encoding):
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', last_modified)
+        self.send_header('Vary', 'Accept-Encoding')
+
+        if content_encoding is not None:
+            self.send_header('Content-Encoding', content_encoding)
+
+    def do_GET(self):
+        self._send_file(do_send_body=True)
+
+    def do_HEAD(self):
+        self._send_file(do_send_body=False)
+
+    def log_message(self, format_, *args):
+        logger.debug('%s - %s', self.address_string(), format_ % args)
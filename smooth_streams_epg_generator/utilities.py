@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging.handlers
 import os
@@ -122,6 +123,21 @@ class Utility(object):
     def calculate_absolute_time_delta(cls, date_time_1, date_time_2):
         return abs((date_time_2 - date_time_1).total_seconds())
 
+    @classmethod
+    def calculate_hash_key(cls, *values):
+        return int.from_bytes(
+            hashlib.blake2b(
+                '\x1f'.join('{0}'.format(value) for value in values).encode('utf-8'),
+                digest_size=8,
+            ).digest(),
+            byteorder='big',
+            signed=True,
+        )
+
+    @classmethod
+    def convert_date_time_to_epoch(cls, date_time):
+        return int(date_time.timestamp())
+
     @classmethod
     def create_directory(cls, path):
         os.makedirs(path)
@@ -265,6 +281,12 @@ class Utility(object):
             help='path to the output directory file',
             metavar='output directory path',
         )
+        parser.add_argument(
+            '-s',
+            action='store_true',
+            dest='do_serve_output_xmltv_files',
+            help='serve the XMLTV files over HTTP and regenerate them periodically',
+        )
 
         arguments = parser.parse_args()
 
@@ -274,6 +296,7 @@ class Utility(object):
             arguments.database_file_path,
             arguments.log_file_path,
             arguments.output_directory_path,
+            arguments.do_serve_output_xmltv_files,
         )
 
     @classmethod
@@ -0,0 +1,155 @@
+import os
+import re
+import sqlite3
+import unittest
+from unittest import mock
+
+from smooth_streams_epg_generator import db
+from smooth_streams_epg_generator.db import Database
+from smooth_streams_epg_generator.utilities import Utility
+
+DB_DIRECTORY_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'db')
+
+
+class DatabaseQueryPlanTestCase(unittest.TestCase):
+    hot_sql_statements = {
+        'category_map': (
+            'SELECT * '
+            'FROM category_map '
+            'WHERE smooth_streams_category = :smooth_streams_category'
+        ),
+        'failed_program_match purge': (
+            'DELETE '
+            'FROM failed_program_match '
+            'WHERE date_time_of_last_failure < :date_time_of_last_failure_cutoff'
+        ),
+        'forced_program_match': (
+            'SELECT * '
+            'FROM forced_program_match '
+            'WHERE smooth_streams_program_title = :smooth_streams_program_title'
+            '  AND smooth_streams_program_sub_title = :smooth_streams_program_sub_title'
+            '  AND smooth_streams_program_channel = :smooth_streams_program_channel'
+            '  AND smooth_streams_program_start = :smooth_streams_program_start'
+            '  AND smooth_streams_program_stop = :smooth_streams_program_stop'
+        ),
+        'forced_program_match purge': (
+            'DELETE '
+            'FROM forced_program_match '
+            'WHERE smooth_streams_program_stop < :smooth_streams_program_stop_cutoff'
+        ),
+        'ignored_epg_program_match': (
+            'SELECT * '
+            'FROM ignored_epg_program_match '
+            'WHERE epg_program_title = :epg_program_title'
+            '  AND ((epg_program_sub_title = :epg_program_sub_title'
+            '  AND epg_program_channel = :epg_program_channel'
+            '  AND epg_program_start = :epg_program_start'
+            '  AND epg_program_stop = :epg_program_stop)'
+            '  OR (epg_program_sub_title = :epg_program_sub_title'
+            '  AND epg_program_channel = \'\''
+            '  AND epg_program_start = \'\''
+            '  AND epg_program_stop = \'\')'
+            '  OR (epg_program_sub_title = \'\''
+            '  AND epg_program_channel = \'\''
+            '  AND epg_program_start = \'\''
+            '  AND epg_program_stop = \'\'))'
+        ),
+        'ignored_epg_program_match purge': (
+            'DELETE '
+            'FROM ignored_epg_program_match '
+            'WHERE epg_program_stop < :epg_program_stop_cutoff'
+            '  AND epg_program_stop <> \'\''
+        ),
+        'ignored_smooth_streams_program_match': (
+            'SELECT * '
+            'FROM ignored_smooth_streams_program_match '
+            'WHERE smooth_streams_program_title = :smooth_streams_program_title'
+            '  AND smooth_streams_program_sub_title = :smooth_streams_program_sub_title'
+            '  AND ((smooth_streams_program_channel = :smooth_streams_program_channel'
+            '  AND smooth_streams_program_start = :smooth_streams_program_start'
+            '  AND smooth_streams_program_stop = :smooth_streams_program_stop)'
+            '  OR (smooth_streams_program_channel = \'\''
+            '  AND smooth_streams_program_start = \'\''
+            '  AND smooth_streams_program_stop = \'\'))'
+        ),
+        'ignored_smooth_streams_program_match purge': (
+            'DELETE '
+            'FROM ignored_smooth_streams_program_match '
+            'WHERE smooth_streams_program_stop < :smooth_streams_program_stop_cutoff'
+            '  AND smooth_streams_program_stop <> \'\''
+        ),
+        'pattern_program_match': (
+            'SELECT * '
+            'FROM pattern_program_match '
+            'WHERE smooth_streams_program_title = :smooth_streams_program_title'
+        ),
+        'program_match': (
+            'SELECT is_valid '
+            'FROM program_match '
+            'WHERE program_match_key = :program_match_key'
+        ),
+        'program_match purge': (
+            'DELETE '
+            'FROM program_match '
+            'WHERE date_time_of_last_match < :date_time_of_last_match_cutoff'
+        ),
+        'program_match update': (
+            'UPDATE program_match '
+            'SET date_time_of_last_match = CAST(strftime(\'%s\', \'now\') AS INTEGER), '
+            'number_of_occurrences = number_of_occurrences + 1 '
+            'WHERE program_match_key = :program_match_key'
+        ),
+    }
+
+    def setUp(self):
+        connection = sqlite3.connect(':memory:')
+        connection.row_factory = sqlite3.Row
+        connection.create_function(
+            'calculate_hash_key', -1, Utility.calculate_hash_key, deterministic=True
+        )
+
+        Database._connection = connection
+        Database._cursor = connection.cursor()
+
+        with mock.patch.object(
+            db,
+            'DEFAULT_DB_CREATE_SCHEMA_FILE_PATH',
+            os.path.join(DB_DIRECTORY_PATH, 'create_schema.sql'),
+        ), mock.patch.object(
+            db,
+            'DEFAULT_DB_MIGRATIONS_DIRECTORY_PATH',
+            os.path.join(DB_DIRECTORY_PATH, 'migrations'),
+        ):
+            Database._create_schema()
+            Database._migrate_schema()
+
+    def tearDown(self):
+        Database._cursor.close()
+        Database._connection.close()
+
+        Database._connection = None
+        Database._cursor = None
+
+    def test_hot_sql_statements_use_indexes(self):
+        for (name, sql_statement) in self.hot_sql_statements.items():
+            with self.subTest(name=name):
+                parameters = {
+                    parameter_name: ''
+                    for parameter_name in re.findall(r':(\w+)', sql_statement)
+                }
+                query_plan_details = [
+                    query_plan_record['detail']
+                    for query_plan_record in Database._cursor.execute(
+                        'EXPLAIN QUERY PLAN {0}'.format(sql_statement), parameters
+                    ).fetchall()
+                ]
+
+                self.assertTrue(query_plan_details)
+                self.assertFalse(
+                    [
+                        query_plan_detail
+                        for query_plan_detail in query_plan_details
+                        if query_plan_detail.startswith('SCAN')
+                    ],
+                    query_plan_details,
+                )
@@ -0,0 +1,69 @@
+import http.client
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import ThreadingHTTPServer
+
+from smooth_streams_epg_generator.server import Server
+from smooth_streams_epg_generator.server import ServerRequestHandler
+
+
+class ServerRequestHandlerTestCase(unittest.TestCase):
+    file_content = b'0123456789'
+
+    def setUp(self):
+        self.output_directory_path = tempfile.mkdtemp()
+
+        file_path = os.path.join(self.output_directory_path, 'xmltv_rf1.xml')
+        with open(file_path, 'wb') as output_file:
+            output_file.write(self.file_content)
+
+        Server._output_directory_path = self.output_directory_path
+        Server._files = {'xmltv_rf1.xml': ('"etag"', os.stat(file_path).st_ino)}
+
+        self.http_server = ThreadingHTTPServer(('127.0.0.1', 0), ServerRequestHandler)
+        self.http_server_thread = threading.Thread(
+            target=self.http_server.serve_forever, daemon=True
+        )
+        self.http_server_thread.start()
+
+    def tearDown(self):
+        self.http_server.shutdown()
+        self.http_server.server_close()
+        self.http_server_thread.join()
+
+        Server._files = {}
+        Server._output_directory_path = None
+
+        shutil.rmtree(self.output_directory_path)
+
+    def _request(self, range_):
+        connection = http.client.HTTPConnection(*self.http_server.server_address)
+        try:
+            connection.request('GET', '/xmltv_rf1.xml', headers={'Range': range_})
+            response = connection.getresponse()
+
+            return (
+                response.status,
+                response.getheader('Content-Range'),
+                response.read(),
+            )
+        finally:
+            connection.close()
+
+    def test_satisfiable_range(self):
+        self.assertEqual(
+            self._request('bytes=2-4'), (206, 'bytes 2-4/10', self.file_content[2:5])
+        )
+
+    def test_invalid_range_is_ignored(self):
+        self.assertEqual(self._request('bytes=5-3'), (200, None, self.file_content))
+
+    def test_unsatisfiable_range(self):
+        self.assertEqual(self._request('bytes=10-12'), (416, 'bytes */10', b''))
+
+
+if __name__ == '__main__':
+    unittest.main()